@@ -0,0 +1,76 @@
+# SPDX-License-Identifier: LGPL-2.1-or-later
+# SPDX-FileNotice: Part of the Dynamic Data addon.
+
+################################################################################
+#                                                                              #
+#   Copyright (c) 2018 Mark Ganson ( TheMarkster )                             #
+#                                                                              #
+#   This library is free software; you can redistribute it and/or modify it    #
+#   under the terms of the GNU Lesser General Public License as published      #
+#   by the Free Software Foundation; either version 2.1 of the License, or     #
+#   (at your option) any later version.                                        #
+#                                                                              #
+#   This library is distributed in the hope that it will be useful,            #
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of             #
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.                       #
+#                                                                              #
+#   See the GNU Lesser General Public License for more details.                #
+#                                                                              #
+#   You should have received a copy of the GNU Lesser General Public License   #
+#   along with this library; if not, write to the Free Software Foundation,    #
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA           #
+#                                                                              #
+################################################################################
+
+"""Startup benchmark for the DynamicData workbench.
+
+Measures the time taken to initialize and activate the workbench and how many
+modules get imported doing so, then the deferred cost of loading DynamicDataCmd
+when the first command is used.  Run it in a fresh FreeCAD session, before the
+workbench has been activated, for example:
+
+    freecad benchmarks/bench_startup.py
+
+Results are printed as JSON and also written to the file named in the
+DD_BENCH_OUTPUT environment variable, if set."""
+
+import json, os, sys, time
+import FreeCAD
+import FreeCADGui as Gui
+
+WORKBENCH = "DynamicDataWorkbench"
+PACKAGE = "freecad.Dynamic_Data"
+CMD_MODULE = "freecad.Dynamic_Data.DynamicDataCmd"
+
+def ddModules(names):
+    return sorted(name for name in names if name.startswith(PACKAGE))
+
+def run():
+    results = {"benchmark": "startup", "freecad": ".".join(FreeCAD.Version()[:3])}
+    if CMD_MODULE in sys.modules:
+        FreeCAD.Console.PrintWarning("bench_startup: DynamicDataCmd is already loaded, run this in a fresh session.\n")
+    before = set(sys.modules)
+    start = time.perf_counter()
+    Gui.activateWorkbench(WORKBENCH)
+    results["activate_seconds"] = time.perf_counter() - start
+    imported = set(sys.modules) - before
+    results["imported_modules"] = len(imported)
+    results["imported_dd_modules"] = ddModules(imported)
+    results["cmd_module_loaded_on_startup"] = CMD_MODULE in imported
+
+    #deferred cost, paid when the first command is activated
+    before = set(sys.modules)
+    start = time.perf_counter()
+    import freecad.Dynamic_Data.DynamicDataCmd
+    results["first_command_load_seconds"] = time.perf_counter() - start
+    results["first_command_imported_modules"] = len(set(sys.modules) - before)
+
+    output = json.dumps(results, indent=2)
+    FreeCAD.Console.PrintMessage(output + "\n")
+    path = os.environ.get("DD_BENCH_OUTPUT")
+    if path:
+        with open(path, "w") as f:
+            f.write(output)
+    return results
+
+run()
@@ -0,0 +1,106 @@
+# SPDX-License-Identifier: LGPL-2.1-or-later
+# SPDX-FileNotice: Part of the Dynamic Data addon.
+
+################################################################################
+#                                                                              #
+#   Copyright (c) 2018 Mark Ganson ( TheMarkster )                             #
+#                                                                              #
+#   This library is free software; you can redistribute it and/or modify it    #
+#   under the terms of the GNU Lesser General Public License as published      #
+#   by the Free Software Foundation; either version 2.1 of the License, or     #
+#   (at your option) any later version.                                        #
+#                                                                              #
+#   This library is distributed in the hope that it will be useful,            #
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of             #
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.                       #
+#                                                                              #
+#   See the GNU Lesser General Public License for more details.                #
+#                                                                              #
+#   You should have received a copy of the GNU Lesser General Public License   #
+#   along with this library; if not, write to the Free Software Foundation,    #
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA           #
+#                                                                              #
+################################################################################
+
+
+"""Synthetic documents for the benchmarks.
+
+Each generator builds one kind of large input in a document: a dd object with
+many dynamic properties, a deep chain of expressions, a spreadsheet with many
+aliases, a sketch with many named constraints, or a large configuration table.
+They need no GUI and are used by run.py, but may also be used from the Python
+console to reproduce a slow case, for example:
+
+    import sys; sys.path.append("/path/to/DynamicData/benchmarks")
+    import generators
+    doc = FreeCAD.newDocument()
+    dd = generators.makeDDObject(doc, 10000)"""
+
+import FreeCAD
+from freecad.Dynamic_Data import configtable, core
+
+PROPERTY_GROUP = "Bench"
+
+def makeDDObject(doc, count, name="dd", expressionEvery=0):
+    """dd object with count Length properties Prop0, Prop1, ... added in bulk.
+    With expressionEvery n, every nth property is an expression of the previous one."""
+    dd = core.createObject(doc, name, version="bench")
+    rows = []
+    for idx in range(count):
+        value = f"={getPropertyName(idx-1)} * 2" if expressionEvery and idx and idx % expressionEvery == 0 else f"{idx} mm"
+        rows.append(core.PropertyRow(getPropertyName(idx), "Length", PROPERTY_GROUP, "", value))
+    core.addProperties(dd, rows, recompute=False)
+    return dd
+
+def getPropertyName(idx):
+    return f"Prop{idx}"
+
+def makeExpressionChain(doc, dd, depth, prefix="Chain"):
+    """depth Length properties of dd, each an expression of the previous one:
+    Chain0 = 1 mm, Chain1 = Chain0 + 1 mm, ...  Returns their names."""
+    names = [f"{prefix}{idx}" for idx in range(depth)]
+    rows = [core.PropertyRow(names[0], "Length", PROPERTY_GROUP, "", "1 mm")]
+    rows.extend(core.PropertyRow(names[idx], "Length", PROPERTY_GROUP, "", f"={names[idx-1]} + 1 mm")
+                for idx in range(1, depth))
+    core.addProperties(dd, rows, recompute=False)
+    return names
+
+def makeSheet(doc, count, name="Spreadsheet"):
+    """spreadsheet with count aliased cells alias1, alias2, ... in column A,
+    every tenth one an expression referencing other aliases"""
+    sheet = doc.addObject("Spreadsheet::Sheet", name)
+    for row in range(1, count + 1):
+        cell = f"A{row}"
+        if row % 10 == 0:
+            sheet.set(cell, f"=alias{row-1} + alias{row-2} * 2")
+        else:
+            sheet.set(cell, f"{row} mm")
+        sheet.setAlias(cell, f"alias{row}")
+    doc.recompute()
+    return sheet
+
+def makeSketch(doc, count, name="Sketch"):
+    """sketch with a polyline of count segments, each with a named length
+    constraint len0, len1, ..., every tenth one an expression of the previous one"""
+    import Part, Sketcher
+    sketch = doc.addObject("Sketcher::SketchObject", name)
+    lines = [Part.LineSegment(FreeCAD.Vector(idx * 10, 0, 0), FreeCAD.Vector(idx * 10 + 10, 0, 0))
+             for idx in range(count)]
+    sketch.addGeometry(lines, False)
+    constraints = [Sketcher.Constraint("Coincident", idx, 2, idx + 1, 1) for idx in range(count - 1)]
+    sketch.addConstraint(constraints)
+    first = len(constraints)
+    sketch.addConstraint([Sketcher.Constraint("Distance", idx, 10.0) for idx in range(count)])
+    for idx in range(count):
+        sketch.renameConstraint(first + idx, f"len{idx}")
+        if idx and idx % 10 == 0:
+            sketch.setExpression(f"Constraints.len{idx}", f".Constraints.len{idx-1}")
+    doc.recompute()
+    return sketch
+
+def makeConfigurationTable(variables, enums):
+    """configtable.ConfigurationTable of variables Var0, Var1, ... and enums
+    Size1, Size2, ... after the "Select size" entry"""
+    names = ["Select size"] + [f"Size{col}" for col in range(1, enums + 1)]
+    rows = [[row + col / 100 for col in range(enums + 1)] for row in range(variables)]
+    return configtable.ConfigurationTable(names, [f"Var{row}" for row in range(variables)], rows)
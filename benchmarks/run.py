@@ -0,0 +1,309 @@
+# SPDX-License-Identifier: LGPL-2.1-or-later
+# SPDX-FileNotice: Part of the Dynamic Data addon.
+
+################################################################################
+#                                                                              #
+#   Copyright (c) 2018 Mark Ganson ( TheMarkster )                             #
+#                                                                              #
+#   This library is free software; you can redistribute it and/or modify it    #
+#   under the terms of the GNU Lesser General Public License as published      #
+#   by the Free Software Foundation; either version 2.1 of the License, or     #
+#   (at your option) any later version.                                        #
+#                                                                              #
+#   This library is distributed in the hope that it will be useful,            #
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of             #
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.                       #
+#                                                                              #
+#   See the GNU Lesser General Public License for more details.                #
+#                                                                              #
+#   You should have received a copy of the GNU Lesser General Public License   #
+#   along with this library; if not, write to the Free Software Foundation,    #
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA           #
+#                                                                              #
+################################################################################
+
+
+"""Benchmark suite of the DynamicData workbench.
+
+Times the core operations on synthetic documents made by generators.py, at
+several sizes: adding, renaming, retyping and removing properties, deep
+expression chains, alias and constraint import, and building and switching
+configurations.  Needs no GUI, for example:
+
+    FreeCADCmd benchmarks/run.py
+
+When run in the GUI (freecad benchmarks/run.py) the latency of the commands'
+IsActive() is timed too, the startup benchmark is separate, see bench_startup.py.
+
+Environment variables:
+    DD_BENCH_ONLY      comma separated benchmarks to run, default all
+    DD_BENCH_SIZES     comma separated sizes, default 100,1000,10000
+    DD_BENCH_OUTPUT    file the JSON results are written to
+    DD_BENCH_BASELINE  JSON results of an earlier run to compare with
+
+Results are printed as JSON: one entry per benchmark and size with the
+seconds taken by each step and the counts of the metrics module."""
+
+import json, os, platform, statistics, sys, time
+import FreeCAD
+from freecad.Dynamic_Data import core, metrics
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import generators
+
+DEFAULT_SIZES = (100, 1000, 10000)
+REPEATS = 20 #operations timed per size by the benchmarks timing single edits
+
+BENCHMARKS = {} #name: function(size) returning a dictionary of results
+
+def benchmark(name):
+    def register(function):
+        BENCHMARKS[name] = function
+        return function
+    return register
+
+class Timer:
+    """with Timer(results, "add_seconds"): stores the seconds taken in results"""
+
+    def __init__(self, results, key):
+        self.results = results
+        self.key = key
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.results[self.key] = time.perf_counter() - self.start
+        return False
+
+def newDocument(name):
+    return FreeCAD.newDocument(f"Bench_{name}")
+
+def closeDocument(doc):
+    FreeCAD.closeDocument(doc.Name)
+
+def getRepeats(size):
+    return min(REPEATS, size)
+
+
+@benchmark("add_property")
+def benchAddProperty(size):
+    """one call and one transaction per property, then all in one bulk call"""
+    results = {}
+    doc = newDocument("add")
+    dd = core.createObject(doc, version="bench")
+    with Timer(results, "add_each_seconds"):
+        for idx in range(size):
+            core.addProperty(dd, "Length", f"Each{idx}", "Bench", "", f"{idx} mm")
+    rows = [core.PropertyRow(f"Bulk{idx}", "Length", "Bench", "", f"{idx} mm") for idx in range(size)]
+    with Timer(results, "add_bulk_seconds"):
+        core.addProperties(dd, rows, recompute=False)
+    with Timer(results, "recompute_seconds"):
+        doc.recompute()
+    closeDocument(doc)
+    return results
+
+@benchmark("rename_property")
+def benchRenameProperty(size):
+    """rename properties of a dd object of size properties, every tenth property
+    being an expression of the previous one, so renames update expressions"""
+    results = {}
+    doc = newDocument("rename")
+    with Timer(results, "setup_seconds"):
+        dd = generators.makeDDObject(doc, size, expressionEvery=10)
+    repeats = getRepeats(size)
+    with Timer(results, "rename_seconds"):
+        for idx in range(repeats):
+            core.renameProperty(dd, generators.getPropertyName(idx * (size // repeats)), f"Renamed{idx}")
+    results["rename_mean_seconds"] = results["rename_seconds"] / repeats
+    closeDocument(doc)
+    return results
+
+@benchmark("retype_property")
+def benchRetypeProperty(size):
+    results = {}
+    doc = newDocument("retype")
+    with Timer(results, "setup_seconds"):
+        dd = generators.makeDDObject(doc, size)
+    repeats = getRepeats(size)
+    with Timer(results, "retype_seconds"):
+        for idx in range(repeats):
+            core.retypeProperty(dd, generators.getPropertyName(idx * (size // repeats)), "Distance")
+    results["retype_mean_seconds"] = results["retype_seconds"] / repeats
+    closeDocument(doc)
+    return results
+
+@benchmark("remove_properties")
+def benchRemoveProperties(size):
+    results = {}
+    doc = newDocument("remove")
+    with Timer(results, "setup_seconds"):
+        dd = generators.makeDDObject(doc, size)
+    with Timer(results, "remove_seconds"):
+        removed = core.removeProperties(dd, [generators.getPropertyName(idx) for idx in range(size)])
+    results["removed"] = len(removed)
+    closeDocument(doc)
+    return results
+
+@benchmark("expression_chain")
+def benchExpressionChain(size):
+    """a chain of size expressions, each depending on the previous one"""
+    results = {}
+    doc = newDocument("chain")
+    dd = core.createObject(doc, version="bench")
+    with Timer(results, "build_seconds"):
+        names = generators.makeExpressionChain(doc, dd, size)
+    with Timer(results, "recompute_seconds"):
+        doc.recompute()
+    with Timer(results, "rename_root_seconds"):
+        core.renameProperty(dd, names[0], "Root")
+    with Timer(results, "recompute_dependents_seconds"):
+        dd.Root = 2
+        core.recomputeDependents(dd)
+    results["correct"] = abs(getattr(dd, names[-1]).Value - (2 + size - 1)) < 1e-6
+    closeDocument(doc)
+    return results
+
+@benchmark("import_aliases")
+def benchImportAliases(size):
+    results = {}
+    doc = newDocument("aliases")
+    with Timer(results, "setup_seconds"):
+        sheet = generators.makeSheet(doc, size)
+    dd = core.createObject(doc, version="bench")
+    with Timer(results, "plan_seconds"):
+        plan = core.planAliasImport(dd, [sheet])
+    with Timer(results, "import_seconds"): #with the default recompute of dd and the sheet
+        imported = core.importAliases(dd, [sheet])
+    results["planned"] = len(plan)
+    results["imported"] = len(imported)
+    closeDocument(doc)
+    return results
+
+@benchmark("import_constraints")
+def benchImportConstraints(size):
+    results = {}
+    doc = newDocument("constraints")
+    with Timer(results, "setup_seconds"):
+        sketch = generators.makeSketch(doc, size)
+    dd = core.createObject(doc, version="bench")
+    with Timer(results, "import_seconds"):
+        results["imported"] = core.importNamedConstraints(dd, [sketch])
+    with Timer(results, "recompute_seconds"):
+        doc.recompute()
+    closeDocument(doc)
+    return results
+
+@benchmark("configuration")
+def benchConfiguration(size):
+    """build a configuration of size variables and 10 enums in each mode, then
+    switch through all the enums three times, each switch followed by a recompute"""
+    results = {}
+    table = generators.makeConfigurationTable(size, 10)
+    for mode in core.CONFIGURATION_MODES:
+        doc = newDocument(f"configuration_{mode}")
+        dd = core.createObject(doc, version="bench")
+        with Timer(results, f"{mode}_build_seconds"):
+            core.applyConfigurationTable(dd, "Configuration", table, mode=mode)
+            doc.recompute()
+        times = []
+        for r in range(3):
+            for enum in table.enums[1:]:
+                start = time.perf_counter()
+                dd.Configuration = enum
+                doc.recompute()
+                times.append(time.perf_counter() - start)
+        last = table.getColumn(table.enums[-1])
+        results[f"{mode}_correct"] = all(getattr(dd, var) == value for var,value in zip(table.variables, last))
+        results[f"{mode}_switch_median_seconds"] = statistics.median(times)
+        results[f"{mode}_switch_max_seconds"] = max(times)
+        closeDocument(doc)
+    results["switch_speedup"] = results["expression_switch_median_seconds"] / results["switch_switch_median_seconds"]
+    return results
+
+@benchmark("is_active")
+def benchIsActive(size):
+    """mean latency of each command's IsActive() with a dd object of size
+    properties selected, only in the GUI"""
+    if not FreeCAD.GuiUp:
+        return {"skipped": "needs the GUI"}
+    import FreeCADGui
+    from freecad.Dynamic_Data import commands
+    results = {}
+    doc = newDocument("isactive")
+    dd = generators.makeDDObject(doc, size)
+    FreeCADGui.Selection.clearSelection()
+    FreeCADGui.Selection.addSelection(dd)
+    stubs = commands.registerCommands()
+    for name, stub in stubs.items():
+        command = stub.getCommand()
+        start = time.perf_counter()
+        for r in range(REPEATS):
+            command.IsActive()
+        results[f"{name}_seconds"] = (time.perf_counter() - start) / REPEATS
+    results["total_seconds"] = sum(results.values())
+    FreeCADGui.Selection.clearSelection()
+    closeDocument(doc)
+    return results
+
+
+def getEnvironment():
+    return {"freecad": ".".join(FreeCAD.Version()[:3]), "python": platform.python_version(),
+            "platform": platform.platform(), "gui": bool(FreeCAD.GuiUp),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S")}
+
+def getList(name, default):
+    value = os.environ.get(name)
+    return [item.strip() for item in value.split(",") if item.strip()] if value else list(default)
+
+def runOne(name, size):
+    metrics.reset()
+    entry = {"benchmark": name, "size": size}
+    try:
+        entry.update(BENCHMARKS[name](size))
+    except Exception as e:
+        entry["error"] = f"{type(e).__name__}: {e}"
+        FreeCAD.Console.PrintError(f"DynamicData benchmark {name} {size}: {entry['error']}\n")
+    entry["counters"] = metrics.getMetrics()["counters"]
+    return entry
+
+def compare(results, baseline):
+    """lines comparing the seconds of results with those of baseline, same benchmark and size"""
+    old = {(entry["benchmark"], entry["size"]): entry for entry in baseline["results"]}
+    lines = []
+    for entry in results["results"]:
+        before = old.get((entry["benchmark"], entry["size"]))
+        if not before:
+            continue
+        for key, value in entry.items():
+            if key.endswith("_seconds") and before.get(key):
+                lines.append(f"{entry['benchmark']} {entry['size']} {key}: {before[key]:.4f} -> {value:.4f} "
+                             f"({value / before[key]:.2f}x)")
+    return lines
+
+def run():
+    names = getList("DD_BENCH_ONLY", BENCHMARKS)
+    sizes = [int(size) for size in getList("DD_BENCH_SIZES", DEFAULT_SIZES)]
+    unknown = [name for name in names if not name in BENCHMARKS]
+    if unknown:
+        raise ValueError(f"unknown benchmarks {unknown}, choose from {list(BENCHMARKS)}")
+    results = {"suite": "DynamicData", "environment": getEnvironment(), "results": []}
+    for name in names:
+        for size in sizes:
+            FreeCAD.Console.PrintLog(f"DynamicData benchmark {name} {size}\n")
+            results["results"].append(runOne(name, size))
+
+    output = json.dumps(results, indent=2)
+    FreeCAD.Console.PrintMessage(output + "\n")
+    path = os.environ.get("DD_BENCH_OUTPUT")
+    if path:
+        with open(path, "w") as f:
+            f.write(output)
+    baselinePath = os.environ.get("DD_BENCH_BASELINE")
+    if baselinePath:
+        with open(baselinePath) as f:
+            FreeCAD.Console.PrintMessage("\n".join(compare(results, json.load(f))) + "\n")
+    return results
+
+run()
@@ -23,3 +23,15 @@
 ################################################################################
 
 # print("DynamicData workbench loaded")
+
+def __getattr__(name):
+    """public API, imported on first use so loading the workbench stays cheap:
+
+    import freecad.Dynamic_Data as dd
+    with dd.batch(doc):
+        ...
+    """
+    if name == "batch":
+        from freecad.Dynamic_Data.core import batch
+        return batch
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
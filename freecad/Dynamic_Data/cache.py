@@ -0,0 +1,616 @@
+# SPDX-License-Identifier: LGPL-2.1-or-later
+# SPDX-FileNotice: Part of the Dynamic Data addon.
+
+################################################################################
+#                                                                              #
+#   Copyright (c) 2018 Mark Ganson ( TheMarkster )                             #
+#                                                                              #
+#   This library is free software; you can redistribute it and/or modify it    #
+#   under the terms of the GNU Lesser General Public License as published      #
+#   by the Free Software Foundation; either version 2.1 of the License, or     #
+#   (at your option) any later version.                                        #
+#                                                                              #
+#   This library is distributed in the hope that it will be useful,            #
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of             #
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.                       #
+#                                                                              #
+#   See the GNU Lesser General Public License for more details.                #
+#                                                                              #
+#   You should have received a copy of the GNU Lesser General Public License   #
+#   along with this library; if not, write to the Free Software Foundation,    #
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA           #
+#                                                                              #
+################################################################################
+
+"""Caches of property metadata, kept current by a document observer.
+
+The commands ask the same questions about the selected object over and over
+(which properties are dynamic, what group is this property in, is it bound by
+an expression) every time FreeCAD polls IsActive().  Answering these by walking
+obj.PropertiesList each time is slow on objects with thousands of properties,
+so we answer them once per object and keep the answers until the observer tells
+us something changed.
+
+This module does not import Qt, so it may be used from FreeCADCmd."""
+
+from collections import namedtuple
+import FreeCAD
+
+PROP_DYNAMIC = 21 #App::Property::PropDynamic status bit
+
+#metadata for a single property
+PropertyInfo = namedtuple("PropertyInfo", ["name", "dynamic", "typeId", "group", "tooltip", "expression", "status"])
+
+
+class ObjectMetadata:
+    """metadata of all properties of one object, built in one pass"""
+
+    def __init__(self, obj):
+        self.signature = self.getSignature(obj)
+        self.properties = {}
+        expressions = {}
+        try:
+            expressions = {xp[0]:xp[1] for xp in obj.ExpressionEngine}
+        except Exception:
+            pass
+        hasStatus = hasattr(obj, "getPropertyStatus")
+        for prop in self.signature:
+            try:
+                status = obj.getPropertyStatus(prop) if hasStatus else []
+            except Exception:
+                status = []
+            if hasStatus:
+                dynamic = PROP_DYNAMIC in status
+            else:
+                dynamic = probeDynamic(obj, prop) #very old FreeCAD versions, only done on rebuild
+            if prop == "DynamicData":
+                dynamic = False
+            self.properties[prop] = PropertyInfo(prop, dynamic,
+                                                 safeCall(obj.getTypeIdOfProperty, prop),
+                                                 safeCall(obj.getGroupOfProperty, prop),
+                                                 safeCall(obj.getDocumentationOfProperty, prop),
+                                                 expressions.get(prop),
+                                                 status)
+        self.dynamicProperties = [p for p,info in self.properties.items() if info.dynamic]
+
+    @staticmethod
+    def getSignature(obj):
+        """the signature is the tuple of property names, it changes whenever
+        a property is added, removed, or renamed"""
+        return tuple(obj.PropertiesList)
+
+
+def safeCall(func, prop):
+    try:
+        return func(prop)
+    except Exception:
+        return None
+
+
+def probeDynamic(obj, prop):
+    """legacy test for a dynamic property: only dynamic properties may be moved to
+    another group.  This writes to the object, so only used where getPropertyStatus()
+    is not available"""
+    try:
+        oldGroup = obj.getGroupOfProperty(prop)
+        obj.setGroupOfProperty(prop, "test")
+        obj.setGroupOfProperty(prop, oldGroup)
+        return True
+    except Exception:
+        return False
+
+
+def objectKey(obj):
+    """(document name, object name) tuple used as dictionary key"""
+    try:
+        return (obj.Document.Name, obj.Name)
+    except Exception:
+        return (None, id(obj))
+
+
+class DocumentCache:
+    """base class of the caches kept current by DynamicDataDocumentObserver,
+    subclasses override only the hooks they care about"""
+
+    def objectCreated(self, obj):
+        pass
+
+    def objectDeleted(self, obj):
+        pass
+
+    def objectChanged(self, obj, prop):
+        pass
+
+    def propertyAdded(self, obj, prop):
+        pass
+
+    def propertyRemoved(self, obj, prop):
+        pass
+
+    def propertyEditorChanged(self, obj, prop):
+        pass
+
+    def documentReset(self, doc):
+        """undo, redo, or the document was closed, forget everything about doc"""
+        pass
+
+
+def documentName(doc):
+    return doc.Name if hasattr(doc, "Name") else doc
+
+
+class PropertyMetadataCache(DocumentCache):
+    """per object cache of property metadata, keyed on object and validated
+    against the signature of its property list"""
+
+    def __init__(self):
+        self.entries = {}
+
+    def get(self, obj):
+        """returns the ObjectMetadata for obj, rebuilding it if stale"""
+        key = objectKey(obj)
+        entry = self.entries.get(key)
+        if entry is None or entry.signature != ObjectMetadata.getSignature(obj):
+            entry = ObjectMetadata(obj)
+            self.entries[key] = entry
+        return entry
+
+    def getInfo(self, obj, prop):
+        """returns the PropertyInfo for obj.prop or None if there is no such property"""
+        return self.get(obj).properties.get(prop)
+
+    def isDynamic(self, obj, prop):
+        info = self.getInfo(obj, prop)
+        return bool(info and info.dynamic)
+
+    def getDynamicProperties(self, obj):
+        return list(self.get(obj).dynamicProperties)
+
+    def hasDynamicProperties(self, obj):
+        return bool(self.get(obj).dynamicProperties)
+
+    def getGroup(self, obj, prop):
+        info = self.getInfo(obj, prop)
+        return info.group if info else None
+
+    def getExpression(self, obj, prop):
+        info = self.getInfo(obj, prop)
+        return info.expression if info else None
+
+    def invalidate(self, obj, prop=None):
+        """drop the cached metadata for obj"""
+        self.entries.pop(objectKey(obj), None)
+
+    def invalidateDocument(self, doc):
+        docName = documentName(doc)
+        for key in [k for k in self.entries if k[0] == docName]:
+            self.entries.pop(key, None)
+
+    def clear(self):
+        self.entries.clear()
+
+    def objectDeleted(self, obj):
+        self.invalidate(obj)
+
+    def objectChanged(self, obj, prop):
+        #values do not change metadata, but expressions do
+        if prop == "ExpressionEngine":
+            self.invalidate(obj)
+
+    def propertyAdded(self, obj, prop):
+        self.invalidate(obj)
+
+    def propertyRemoved(self, obj, prop):
+        self.invalidate(obj)
+
+    def propertyEditorChanged(self, obj, prop):
+        #group or tooltip of a property was changed
+        self.invalidate(obj)
+
+    def documentReset(self, doc):
+        self.invalidateDocument(doc)
+
+
+class DDObjectIndex(DocumentCache):
+    """index of the dd objects (objects with a DynamicData property) in each
+    document.  A document is scanned once on first use, after that the index is
+    kept current from the observer.  Objects created since the last query are
+    checked lazily at the next query, since their properties are not yet restored
+    when the creation signal is sent."""
+
+    def __init__(self):
+        self.entries = {} #document name: {object name: object}
+        self.pending = {} #document name: {object name: object} created since last query
+
+    def getDDObjects(self, doc):
+        """returns the list of dd objects in doc"""
+        return list(self.getEntry(doc).values())
+
+    def getDDObjectCount(self, doc):
+        return len(self.getEntry(doc))
+
+    def getSingleDDObject(self, doc):
+        """returns the dd object if doc has exactly one of them, else None"""
+        entry = self.getEntry(doc)
+        if len(entry) != 1:
+            return None
+        return next(iter(entry.values()))
+
+    def getEntry(self, doc):
+        docName = documentName(doc)
+        entry = self.entries.get(docName)
+        if entry is None:
+            entry = {obj.Name:obj for obj in doc.Objects if hasattr(obj, "DynamicData")}
+            self.entries[docName] = entry
+            self.pending.pop(docName, None)
+            return entry
+        pending = self.pending.pop(docName, None)
+        if pending:
+            for name,obj in pending.items():
+                try:
+                    if hasattr(obj, "DynamicData"):
+                        entry[name] = obj
+                except Exception:
+                    pass #object was deleted in the meantime
+        return entry
+
+    def add(self, obj):
+        entry = self.entries.get(objectKey(obj)[0])
+        if entry is not None:
+            entry[obj.Name] = obj
+
+    def discard(self, obj):
+        docName, name = objectKey(obj)
+        entry = self.entries.get(docName)
+        if entry is not None:
+            entry.pop(name, None)
+        pending = self.pending.get(docName)
+        if pending:
+            pending.pop(name, None)
+
+    def objectCreated(self, obj):
+        docName, name = objectKey(obj)
+        if docName in self.entries:
+            self.pending.setdefault(docName, {})[name] = obj
+
+    def objectDeleted(self, obj):
+        self.discard(obj)
+
+    def objectChanged(self, obj, prop):
+        if prop == "DynamicData":
+            self.add(obj)
+
+    def propertyAdded(self, obj, prop):
+        if prop == "DynamicData":
+            self.add(obj)
+
+    def propertyRemoved(self, obj, prop):
+        if prop == "DynamicData":
+            self.discard(obj)
+
+    def documentReset(self, doc):
+        docName = documentName(doc)
+        self.entries.pop(docName, None)
+        self.pending.pop(docName, None)
+
+
+class LabelIndex(DocumentCache):
+    """label -> object index of each document, so resolving many labels, for
+    example the entries of a LinkList value, does not scan the document once per
+    label.  An entry is built on first use and dropped when an object of the
+    document is created, deleted or relabeled, it is then rebuilt at the next query."""
+
+    def __init__(self):
+        self.entries = {} #document name: {label: first object with that label}
+
+    def getEntry(self, doc):
+        docName = documentName(doc)
+        entry = self.entries.get(docName)
+        if entry is None:
+            entry = {}
+            for obj in doc.Objects:
+                entry.setdefault(obj.Label, obj)
+            self.entries[docName] = entry
+        return entry
+
+    def getObject(self, doc, label):
+        """first object of doc labeled label, as doc.getObjectsByLabel(label)[0], or None"""
+        obj = self.getEntry(doc).get(label)
+        if obj is None:
+            return None
+        try:
+            if obj.Label == label:
+                return obj
+        except Exception:
+            pass #deleted object
+        self.entries.pop(documentName(doc), None)
+        return self.getEntry(doc).get(label)
+
+    def invalidate(self, obj):
+        self.entries.pop(objectKey(obj)[0], None)
+
+    def objectCreated(self, obj):
+        self.invalidate(obj)
+
+    def objectDeleted(self, obj):
+        self.invalidate(obj)
+
+    def objectChanged(self, obj, prop):
+        if prop == "Label":
+            self.invalidate(obj)
+
+    def documentReset(self, doc):
+        self.entries.pop(documentName(doc), None)
+
+
+class DocumentRevisions(DocumentCache):
+    """change counter of each document, incremented on every change the observer
+    sees, so results computed from a document can be cached with its revision"""
+
+    def __init__(self):
+        self.revisions = {} #document name: revision
+
+    def getRevision(self, doc):
+        return self.revisions.get(documentName(doc), 0)
+
+    def bump(self, obj):
+        docName = objectKey(obj)[0]
+        self.revisions[docName] = self.revisions.get(docName, 0) + 1
+
+    def objectCreated(self, obj):
+        self.bump(obj)
+
+    def objectDeleted(self, obj):
+        self.bump(obj)
+
+    def objectChanged(self, obj, prop):
+        self.bump(obj)
+
+    def propertyAdded(self, obj, prop):
+        self.bump(obj)
+
+    def propertyRemoved(self, obj, prop):
+        self.bump(obj)
+
+    def documentReset(self, doc):
+        docName = documentName(doc)
+        self.revisions[docName] = self.revisions.get(docName, 0) + 1
+
+
+class NameSuffixIndex(DocumentCache):
+    """remembers for each object and base name the numbered names found taken,
+    so finding a free name such as Length24 does not try Length1, Length2, ...
+    every time.  Adding properties only takes more names, so what is remembered
+    holds until a property of the object is removed."""
+
+    def __init__(self):
+        self.entries = {} #object key: {base name: (first, free)}, base+first ... base+(free-1) are taken
+
+    def getFreeSuffix(self, obj, base, start=1):
+        """first idx >= start for which obj has no attribute base+idx"""
+        if observer is None:
+            idx = start
+            while hasattr(obj, f"{base}{idx}"):
+                idx += 1
+            return idx
+        known = self.entries.setdefault(objectKey(obj), {})
+        first, free = known.get(base, (start, start))
+        idx = free if first <= start <= free else start
+        while hasattr(obj, f"{base}{idx}"):
+            idx += 1
+        known[base] = (min(first, start) if first <= start <= free else start, idx)
+        return idx
+
+    def invalidate(self, obj):
+        self.entries.pop(objectKey(obj), None)
+
+    def objectDeleted(self, obj):
+        self.invalidate(obj)
+
+    def propertyRemoved(self, obj, prop):
+        self.invalidate(obj)
+
+    def documentReset(self, doc):
+        docName = documentName(doc)
+        for key in [k for k in self.entries if k[0] == docName]:
+            self.entries.pop(key, None)
+
+
+#an expression referencing a property: owner is the object holding the expression,
+#path is the property it is bound to, or the cell address if kind is "cell"
+ExpressionRef = namedtuple("ExpressionRef", ["owner", "path", "expression", "kind"])
+
+PROPERTY = "property"
+CELL = "cell"
+
+
+class ExpressionIndex(DocumentCache):
+    """reverse dependency index over the expressions of all open documents:
+    (document, object, property) -> the expressions referencing that property.
+    Documents are scanned once when first needed, after that an object is
+    indexed again only when its expressions change."""
+
+    def __init__(self):
+        self.documents = set() #names of the documents scanned
+        self.sources = {} #objectKey(owner): [(ExpressionRef, [target keys])]
+        self.dependents = {} #(document name, object name, property): {(owner key, path)}
+
+    def update(self):
+        """scan the documents opened since the last query"""
+        for docName,doc in FreeCAD.listDocuments().items():
+            if not docName in self.documents:
+                self.documents.add(docName)
+                for obj in doc.Objects:
+                    self.indexObject(obj)
+
+    def getExpressions(self, obj):
+        """the expressions held by obj as ExpressionRefs"""
+        refs = []
+        try:
+            refs = [ExpressionRef(obj, path, expr, PROPERTY) for path,expr in obj.ExpressionEngine]
+        except Exception:
+            pass
+        if hasattr(obj, "getUsedCells") and obj.isDerivedFrom("Spreadsheet::Sheet"):
+            for cell in obj.getUsedCells():
+                contents = obj.getContents(cell)
+                if contents.startswith("="):
+                    refs.append(ExpressionRef(obj, cell, contents[1:], CELL))
+        return refs
+
+    def indexObject(self, obj):
+        from freecad.Dynamic_Data import expressions
+        self.unindexObject(obj)
+        key = objectKey(obj)
+        entries = []
+        for ref in self.getExpressions(obj):
+            try:
+                targets = [(objectKey(r.object)[0], objectKey(r.object)[1], r.property)
+                           for r in expressions.getReferences(ref.expression, obj)]
+            except Exception as ex:
+                FreeCAD.Console.PrintLog(f"DynamicData: cannot parse {obj.Name}.{ref.path} = {ref.expression}: {ex}\n")
+                continue
+            entries.append((ref, targets))
+            for target in targets:
+                self.dependents.setdefault(target, set()).add((key, ref.path))
+        if entries:
+            self.sources[key] = entries
+
+    def unindexObject(self, obj, key=None):
+        key = key if key else objectKey(obj)
+        for ref,targets in self.sources.pop(key, []):
+            for target in targets:
+                dependents = self.dependents.get(target)
+                if dependents:
+                    dependents.discard((key, ref.path))
+                    if not dependents:
+                        del self.dependents[target]
+
+    def getDependents(self, obj, prop):
+        """the ExpressionRefs of the expressions referencing obj.prop, in any open document"""
+        self.update()
+        docName, objName = objectKey(obj)
+        refs = []
+        for key,path in self.dependents.get((docName, objName, prop), ()):
+            for ref,targets in self.sources.get(key, []):
+                if ref.path == path:
+                    refs.append(ref)
+        return refs
+
+    def objectDeleted(self, obj):
+        if objectKey(obj)[0] in self.documents:
+            self.unindexObject(obj)
+
+    def objectChanged(self, obj, prop):
+        if prop in ("ExpressionEngine", "cells") and objectKey(obj)[0] in self.documents:
+            self.indexObject(obj)
+
+    def propertyAdded(self, obj, prop):
+        #a local reference to prop may now resolve
+        if objectKey(obj) in self.sources:
+            self.indexObject(obj)
+
+    def documentReset(self, doc):
+        """forget the expressions held by doc, references into doc held by other
+        documents are kept since those expressions did not change"""
+        docName = documentName(doc)
+        self.documents.discard(docName)
+        for key in [k for k in self.sources if k[0] == docName]:
+            self.unindexObject(None, key)
+
+
+metadataCache = PropertyMetadataCache()
+ddIndex = DDObjectIndex()
+expressionIndex = ExpressionIndex()
+labelIndex = LabelIndex()
+revisions = DocumentRevisions()
+nameSuffixes = NameSuffixIndex()
+
+
+def getDDObjects(doc=None):
+    """returns the list of dd objects in doc, or in the active document if doc is None"""
+    doc = doc if doc else FreeCAD.ActiveDocument
+    if not doc:
+        return []
+    return ddIndex.getDDObjects(doc)
+
+
+def getObjectByLabel(doc, label):
+    """first object of doc labeled label or None, from the label index while the
+    observer keeps it current"""
+    if observer is None:
+        objs = doc.getObjectsByLabel(label)
+        return objs[0] if objs else None
+    return labelIndex.getObject(doc, label)
+
+
+def getDocumentRevision(doc):
+    """change counter of doc, None if there is no observer to keep it current"""
+    if observer is None:
+        return None
+    return revisions.getRevision(doc)
+
+
+def getSingleDDObject(doc=None):
+    """returns the only dd object in doc (default: active document), or None if
+    there are none or more than one"""
+    doc = doc if doc else FreeCAD.ActiveDocument
+    if not doc:
+        return None
+    return ddIndex.getSingleDDObject(doc)
+
+
+class DynamicDataDocumentObserver:
+    """document observer that keeps the caches in this module current"""
+
+    def __init__(self):
+        self.caches = [metadataCache, ddIndex, expressionIndex, labelIndex, revisions, nameSuffixes]
+
+    def registerCache(self, cache):
+        if not cache in self.caches:
+            self.caches.append(cache)
+
+    def notify(self, hook, *args):
+        for cache in self.caches:
+            try:
+                getattr(cache, hook)(*args)
+            except Exception as ex:
+                FreeCAD.Console.PrintLog(f"DynamicData: cache {type(cache).__name__}.{hook} failed: {ex}\n")
+
+    def slotCreatedObject(self, obj):
+        self.notify("objectCreated", obj)
+
+    def slotDeletedObject(self, obj):
+        self.notify("objectDeleted", obj)
+
+    def slotChangedObject(self, obj, prop):
+        self.notify("objectChanged", obj, prop)
+
+    def slotAppendDynamicProperty(self, obj, prop):
+        self.notify("propertyAdded", obj, prop)
+
+    def slotRemoveDynamicProperty(self, obj, prop):
+        self.notify("propertyRemoved", obj, prop)
+
+    def slotChangePropertyEditor(self, obj, prop):
+        if hasattr(obj, "Document"):
+            self.notify("propertyEditorChanged", obj, prop)
+
+    def slotUndoDocument(self, doc):
+        self.notify("documentReset", doc)
+
+    def slotRedoDocument(self, doc):
+        self.notify("documentReset", doc)
+
+    def slotDeletedDocument(self, doc):
+        self.notify("documentReset", doc)
+
+
+observer = None
+
+def installObserver():
+    """register the document observer with FreeCAD, only done once"""
+    global observer
+    if observer is None:
+        observer = DynamicDataDocumentObserver()
+        FreeCAD.addDocumentObserver(observer)
+    return observer
@@ -0,0 +1,215 @@
+# SPDX-License-Identifier: LGPL-2.1-or-later
+# SPDX-FileNotice: Part of the Dynamic Data addon.
+
+################################################################################
+#                                                                              #
+#   Copyright (c) 2018 Mark Ganson ( TheMarkster )                             #
+#                                                                              #
+#   This library is free software; you can redistribute it and/or modify it    #
+#   under the terms of the GNU Lesser General Public License as published      #
+#   by the Free Software Foundation; either version 2.1 of the License, or     #
+#   (at your option) any later version.                                        #
+#                                                                              #
+#   This library is distributed in the hope that it will be useful,            #
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of             #
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.                       #
+#                                                                              #
+#   See the GNU Lesser General Public License for more details.                #
+#                                                                              #
+#   You should have received a copy of the GNU Lesser General Public License   #
+#   along with this library; if not, write to the Free Software Foundation,    #
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA           #
+#                                                                              #
+################################################################################
+
+"""Lightweight command registration.
+
+The workbench registers a stub for each command that carries only the data
+of GetResources().  DynamicDataCmd, which holds the real command classes, is
+imported the first time one of the commands is activated, and the dialogs are
+imported from the dialogs package only when the command needing them runs."""
+
+import os, sys, importlib
+import FreeCAD
+import FreeCADGui as Gui
+from freecad.Dynamic_Data import metrics
+
+__dir__ = os.path.dirname(__file__)
+iconPath = os.path.join( __dir__, 'Resources', 'icons' )
+uiPath = os.path.join( __dir__, 'Resources', 'ui' )
+
+CMD_MODULE = "freecad.Dynamic_Data.DynamicDataCmd"
+
+#command name: (class name in DynamicDataCmd, GetResources() data, what IsActive() requires
+#until DynamicDataCmd has been loaded: None, "document", or "selection")
+COMMANDS = {
+    "DynamicDataCreateObject": ("DynamicDataCreateObjectCommandClass",
+        {'Pixmap'  : 'CreateObject.svg',
+         'MenuText': "&Create Object",
+         'Accel'   : "Ctrl+Shift+D,C",
+         'ToolTip' : "Create the DynamicData object to contain the custom properties"}, "document"),
+    "DynamicDataAddProperty": ("DynamicDataAddPropertyCommandClass",
+        {'Pixmap'  : 'AddProperty.svg',
+         'MenuText': "&Add Property",
+         'Accel'   : "Ctrl+Shift+D,A",
+         'ToolTip' : "Add a custom property to the DynamicData object"}, "document"),
+    "DynamicDataRemoveProperty": ("DynamicDataRemovePropertyCommandClass",
+        {'Pixmap'  : 'RemoveProperty.svg',
+         'MenuText': "&Remove Property",
+         'Accel'   : "Ctrl+Shift+D,R",
+         'ToolTip' : "Remove a custom property from the DynamicData object"}, "document"),
+    "DynamicDataEditEnumeration": ("DynamicDataEditEnumerationCommandClass",
+        {'Pixmap'  : 'DynamicDataEditEnumerations.svg',
+         'MenuText': "&Edit Enumerations",
+         'Accel'   : "Ctrl+Shift+D,E",
+         'ToolTip' : "Edit properties of type Enumeration in selected object"}, "document"),
+    "DynamicDataCreateConfiguration": ("DynamicDataCreateConfigurationCommandClass",
+        {'Pixmap'  : 'DynamicDataCreateConfiguration.svg',
+         'MenuText': "Create/Edit Con&figuration",
+         'Accel'   : "Ctrl+Shift+D,F",
+         'ToolTip' : "Create or edit an existing configuration in the selected object"}, "document"),
+    "DynamicDataMoveToNewGroup": ("DynamicDataMoveToNewGroupCommandClass",
+        {'Pixmap'  : 'MoveToGroup.svg',
+         'MenuText': "Move to new &group",
+         'Accel'   : "Ctrl+Shift+D,G",
+         'ToolTip' : "Move dynamic properties to new group.\n\
+This effectively renames a group if you move all properties.\n\
+Only works with dynamic properties"}, "document"),
+    "DynamicDataImportNamedConstraints": ("DynamicDataImportNamedConstraintsCommandClass",
+        {'Pixmap'  : 'ImportNamedConstraints.svg',
+         'MenuText': "&Import Named Constraints",
+         'ToolTip' : "Import named constraints from selected sketch(es) into selected dd object"}, "selection"),
+    "DynamicDataImportAliases": ("DynamicDataImportAliasesCommandClass",
+        {'Pixmap'  : 'ImportAliases.svg',
+         'MenuText': "&Import Aliases",
+         'ToolTip' : "Import aliases from selected spreadsheet(s) into selected dd object"}, "selection"),
+    "DynamicDataRenameProperty": ("DynamicDataRenamePropertyCommandClass",
+        {'Pixmap'  : 'RenameProperty.svg',
+         'MenuText': "Re&name Property",
+         'Accel'   : "Ctrl+Shift+D,N",
+         'ToolTip' : "Rename a dynamic property"}, "document"),
+    "DynamicDataRetypeProperty": ("DynamicDataRetyePropertyCommandClass",
+        {'Pixmap'  : 'RetypeProperty.svg',
+         'MenuText': "Ret&ype Property",
+         'Accel'   : "Ctrl+Shift+D,Y",
+         'ToolTip' : "Retype a dynamic property"}, "document"),
+    "DynamicDataSetTooltip": ("DynamicDataSetTooltipCommandClass",
+        {'Pixmap'  : 'SetTooltip.svg',
+         'MenuText': "Se&t Tooltip",
+         'Accel'   : "Ctrl+Shift+D,T",
+         'ToolTip' : "Set the tooltip of a dynamic property"}, "document"),
+    "DynamicDataSweepConfiguration": ("DynamicDataSweepConfigurationCommandClass",
+        {'Pixmap'  : 'SweepConfiguration.svg',
+         'MenuText': "S&weep Configuration",
+         'ToolTip' : "Recompute every enum of a configuration and save metrics such as volume to a CSV or JSON file"}, "document"),
+    "DynamicDataDesignOfExperiments": ("DynamicDataDesignOfExperimentsCommandClass",
+        {'Pixmap'  : 'DesignOfExperiments.svg',
+         'MenuText': "&Design of Experiments",
+         'ToolTip' : "Vary numeric properties of the dd object over ranges, recompute each sample and save metrics to a file"}, "document"),
+    "DynamicDataSettings": ("DynamicDataSettingsCommandClass",
+        {'Pixmap'  : 'Settings.svg',
+         'MenuText': "&Settings",
+         'Accel'   : "Ctrl+Shift+D,S",
+         'ToolTip' : "Workbench settings dialog"}, None),
+    "DynamicDataCopyProperty": ("DynamicDataCopyPropertyCommandClass",
+        {'Pixmap'  : 'CopyProperty.svg',
+         'MenuText': "C&opy Property",
+         'ToolTip' : "Copy/Set property values between selected objects"}, "selection"),
+}
+
+def getResources(name):
+    """returns the GetResources() dictionary of command name"""
+    resources = dict(COMMANDS[name][1])
+    resources['Pixmap'] = os.path.join(iconPath, resources['Pixmap'])
+    return resources
+
+def isLoaded():
+    """True once DynamicDataCmd has been imported"""
+    return CMD_MODULE in sys.modules
+
+def precheck(requirement):
+    """cheap stand-in for IsActive() used until DynamicDataCmd is loaded"""
+    if requirement == "document":
+        return bool(FreeCAD.ActiveDocument)
+    if requirement == "selection":
+        return bool(FreeCAD.ActiveDocument) and bool(Gui.Selection.getSelection())
+    return True
+
+
+class DynamicDataCommandStub:
+    """stands in for a command class of DynamicDataCmd until the command is used"""
+
+    def __init__(self, name):
+        self.name = name
+        self.command = None
+
+    def getCommand(self, load=True):
+        """returns the real command object, importing DynamicDataCmd if load is True,
+        else None if it has not been imported yet"""
+        if self.command is None and (load or isLoaded()):
+            module = importlib.import_module(CMD_MODULE)
+            self.command = getattr(module, COMMANDS[self.name][0])()
+        return self.command
+
+    def GetResources(self):
+        return getResources(self.name)
+
+    def IsActive(self):
+        command = self.getCommand(load=False)
+        if command:
+            with metrics.timed(self.name + ".IsActive"):
+                return command.IsActive()
+        return precheck(COMMANDS[self.name][2])
+
+    def Activated(self):
+        before = dict(metrics.counters)
+        with metrics.timed(self.name + ".Activated") as timer:
+            if metrics.takeProfileRun():
+                metrics.profile(self.name, self.activate)
+            else:
+                self.activate()
+        if metrics.isReporting():
+            metrics.reportCommand(self.name, timer.seconds, before)
+
+    def activate(self):
+        command = self.getCommand()
+        #IsActive() sets up the command's target objects from the selection
+        if not command.IsActive():
+            FreeCAD.Console.PrintMessage(f"DynamicData: {self.name} is not available for the current selection.\n")
+            return
+        command.Activated()
+
+
+class DynamicDataCommands:
+    def GetCommands(self):
+
+        return tuple(["DynamicDataCreateObject", "DynamicDataAddProperty",
+                    "DynamicDataEditEnumeration", "DynamicDataCreateConfiguration",
+                    "DynamicDataRemoveProperty", "DynamicDataImportNamedConstraints",
+                    "DynamicDataImportAliases","DynamicDataCopyProperty",
+                    "DynamicDataRenameProperty","DynamicDataSetTooltip",
+                    "DynamicDataRetypeProperty",
+                    "DynamicDataMoveToNewGroup","DynamicDataSweepConfiguration",
+                    "DynamicDataDesignOfExperiments","DynamicDataSettings"]) # a tuple of command names that you want to group
+
+    def GetDefaultCommand(self): # return the index of the tuple of the default command. This method is optional and when not implemented '0' is used
+        return 0
+
+    def GetResources(self):
+        return {'Pixmap'  : os.path.join( iconPath , 'CreateObject.svg'), 'MenuText': 'DynamicData Commands', 'ToolTip': 'DynamicData commands'}
+
+    def IsActive(self): # optional
+        return True
+
+
+stubs = {}
+
+def registerCommands():
+    """register a stub for every command, only done once"""
+    if stubs:
+        return stubs
+    for name in COMMANDS:
+        stubs[name] = DynamicDataCommandStub(name)
+        Gui.addCommand(name, stubs[name])
+    Gui.addCommand("DynamicDataCommands", DynamicDataCommands())
+    return stubs
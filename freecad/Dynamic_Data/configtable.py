@@ -0,0 +1,250 @@
+# SPDX-License-Identifier: LGPL-2.1-or-later
+# SPDX-FileNotice: Part of the Dynamic Data addon.
+
+################################################################################
+#                                                                              #
+#   Copyright (c) 2018 Mark Ganson ( TheMarkster )                             #
+#                                                                              #
+#   This library is free software; you can redistribute it and/or modify it    #
+#   under the terms of the GNU Lesser General Public License as published      #
+#   by the Free Software Foundation; either version 2.1 of the License, or     #
+#   (at your option) any later version.                                        #
+#                                                                              #
+#   This library is distributed in the hope that it will be useful,            #
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of             #
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.                       #
+#                                                                              #
+#   See the GNU Lesser General Public License for more details.                #
+#                                                                              #
+#   You should have received a copy of the GNU Lesser General Public License   #
+#   along with this library; if not, write to the Free Software Foundation,    #
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA           #
+#                                                                              #
+################################################################################
+
+"""Configuration tables.
+
+A configuration is a table of float values, one row per variable and one
+column per enum, plus a last column of defaults used while the "Select ..."
+enum is selected, which is the layout of the {variable}List properties.  The
+table is kept in one 2-D array so filling in blank cells and validating are
+done on the whole table at once, it is stored on the dd object as a single
+string property, and it can be streamed to and from CSV files so large
+catalogs can be loaded without the editor dialog.
+
+numpy is used when it is available, otherwise the table is a list of lists.
+This module does not import Qt, so it may be used from FreeCADCmd."""
+
+import array, base64, csv, json, math, re, sys
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+FORMAT = "DynamicDataConfiguration1"
+NAME_RE = re.compile(r"[^\W\d]\w*", re.ASCII)
+DEFAULT_HEADER = "Default" #last column of a CSV file
+BLANK = float("nan")
+
+def parseFloat(text):
+    """float value of a cell, NaN if it is blank, raises ValueError if it is not a number"""
+    if text is None:
+        return BLANK
+    if isinstance(text, str):
+        text = text.strip()
+        if not text:
+            return BLANK
+    return float(text)
+
+
+class ConfigurationTable:
+    """enums: the enum names, the first one being the "Select ..." entry
+    variables: the variable names
+    values: one row per variable of len(enums) floats, NaN for blank cells
+
+    The values of row r are, in order, those of enums[1:] followed by the
+    default, as they go in the {variable}List property."""
+
+    def __init__(self, enums, variables, values=None):
+        self.enums = list(enums)
+        self.variables = list(variables)
+        self.errors = [] #(row, col, text) of cells that are not numbers
+        shape = (len(self.variables), len(self.enums))
+        if values is None:
+            self.values = numpy.full(shape, BLANK) if numpy else [[BLANK] * shape[1] for row in range(shape[0])]
+        else:
+            self.values = self.parseRows(values, shape)
+
+    @property
+    def shape(self):
+        return (len(self.variables), len(self.enums))
+
+    def parseRows(self, rows, shape):
+        """rows of floats or strings to a table of shape, padding short rows with blanks"""
+        width = shape[1]
+        rows = [list(row[:width]) + [BLANK] * (width - len(row)) for row in list(rows)[:shape[0]]]
+        rows += [[BLANK] * width for row in range(shape[0] - len(rows))]
+        if numpy:
+            try:
+                #fast path, the whole table at once when every cell is a number
+                return numpy.array([[BLANK if v is None or isinstance(v, str) and not v.strip() else v for v in row]
+                                    for row in rows], dtype=float).reshape(shape)
+            except (TypeError, ValueError):
+                pass
+        table = []
+        for r,row in enumerate(rows):
+            values = []
+            for c,text in enumerate(row):
+                try:
+                    values.append(parseFloat(text))
+                except (TypeError, ValueError):
+                    self.errors.append((r, c, text))
+                    values.append(BLANK)
+            table.append(values)
+        return numpy.array(table, dtype=float).reshape(shape) if numpy else table
+
+    @classmethod
+    def fromColumns(cls, enums, variables, columns):
+        """table from columns of values, columns[c][r] being the value of variable r in column c"""
+        if numpy:
+            rows = numpy.array(columns, dtype=object).reshape(len(enums), len(variables)).T
+        else:
+            rows = [list(row) for row in zip(*columns)] if columns else []
+        return cls(enums, variables, rows)
+
+    def rows(self):
+        """the values as a list of lists of floats"""
+        return self.values.tolist() if numpy else [list(row) for row in self.values]
+
+    def getColumn(self, enum):
+        """the values of all variables for enum, the defaults for the first enum,
+        raises ValueError if enum is not one of the enums"""
+        col = self.enums.index(enum) - 1 #-1: the defaults are last
+        if numpy:
+            return self.values[:, col].tolist()
+        return [row[col] for row in self.values]
+
+    def filled(self):
+        """the values with blank cells replaced by the first cell of their row, or 0
+        if that is blank too"""
+        if numpy:
+            first = numpy.nan_to_num(self.values[:, :1], nan=0.0)
+            return numpy.where(numpy.isnan(self.values), first, self.values)
+        ret = []
+        for row in self.values:
+            first = row[0] if row and not math.isnan(row[0]) else 0.0
+            ret.append([first if math.isnan(v) else v for v in row])
+        return ret
+
+    def fillDefaults(self):
+        self.values = self.filled()
+        return self
+
+    def validate(self):
+        """returns the list of problems with the table, empty if it is fine to apply"""
+        problems = []
+        for kind,names in (("enum", self.enums), ("variable", self.variables)):
+            seen = set()
+            for name in names:
+                if not name:
+                    problems.append(f"empty {kind} name")
+                elif name in seen:
+                    problems.append(f"duplicate {kind} name: {name}")
+                seen.add(name)
+        problems.extend(f"invalid variable name: {name}" for name in self.variables
+                        if name and not NAME_RE.fullmatch(name))
+        if len(self.enums) < 2:
+            problems.append("a configuration needs at least 1 enum besides the first entry")
+        problems.extend(f"not a number: {text} (variable {self.variables[r]}, column {c+1})"
+                        for r,c,text in self.errors)
+        if numpy:
+            bad = numpy.argwhere(numpy.isinf(self.values))
+        else:
+            bad = [(r, c) for r,row in enumerate(self.values) for c,v in enumerate(row) if math.isinf(v)]
+        problems.extend(f"infinite value (variable {self.variables[r]}, column {c+1})" for r,c in bad)
+        return problems
+
+    ####################################################################################
+    # storage on the dd object: a json header followed by the float64 values
+
+    def serialize(self):
+        """the table as a compact string"""
+        if numpy:
+            data = numpy.ascontiguousarray(self.values, dtype="<f8").tobytes()
+        else:
+            flat = array.array("d", (v for row in self.values for v in row))
+            if sys.byteorder == "big":
+                flat.byteswap()
+            data = flat.tobytes()
+        header = json.dumps({"format": FORMAT, "enums": self.enums, "variables": self.variables})
+        return f"{header}\n{base64.b64encode(data).decode('ascii')}"
+
+    @classmethod
+    def deserialize(cls, text):
+        """the table from the string serialize() returned, None if text is not one"""
+        header, _, data = text.partition("\n")
+        try:
+            info = json.loads(header)
+        except ValueError:
+            return None
+        if not isinstance(info, dict) or info.get("format") != FORMAT:
+            return None
+        table = cls(info["enums"], info["variables"])
+        data = base64.b64decode(data)
+        if numpy:
+            table.values = numpy.frombuffer(data, dtype="<f8").astype(float).reshape(table.shape)
+        else:
+            flat = array.array("d")
+            flat.frombytes(data)
+            if sys.byteorder == "big":
+                flat.byteswap()
+            width = table.shape[1]
+            table.values = [flat[r*width:(r+1)*width].tolist() for r in range(table.shape[0])]
+        return table
+
+    ####################################################################################
+    # csv, laid out as in the editor: the enum names in the first row, the variable
+    # names in the first column, the defaults in the last column
+
+    def writeCsv(self, f):
+        """write the table to the open text file f one row at a time, blank cells are empty"""
+        writer = csv.writer(f)
+        writer.writerow(self.enums + [DEFAULT_HEADER])
+        for var,row in zip(self.variables, self.values):
+            writer.writerow([var] + ["" if math.isnan(v) else repr(float(v)) for v in row])
+
+    @classmethod
+    def readCsv(cls, f):
+        """read a table from the open text file f, reading it a row at a time into a
+        flat buffer of floats, so the rows are never all held as strings"""
+        reader = csv.reader(f)
+        header = [text.strip() for text in next(reader, [])]
+        if header and header[-1] == DEFAULT_HEADER:
+            header.pop()
+        if len(header) < 2:
+            raise ValueError("the first row must hold the enum names")
+        width = len(header)
+        variables = []
+        errors = []
+        flat = array.array("d")
+        for row in reader:
+            if not any(text.strip() for text in row):
+                continue
+            r = len(variables)
+            variables.append(row[0].strip())
+            cells = row[1:width+1]
+            cells += [""] * (width - len(cells))
+            for c,text in enumerate(cells):
+                try:
+                    flat.append(parseFloat(text))
+                except ValueError:
+                    errors.append((r, c, text))
+                    flat.append(BLANK)
+        table = cls(header, variables)
+        if numpy:
+            table.values = numpy.frombuffer(flat, dtype=float).copy().reshape(table.shape)
+        else:
+            table.values = [flat[r*width:(r+1)*width].tolist() for r in range(len(variables))]
+        table.errors = errors
+        return table
@@ -0,0 +1,986 @@
+# SPDX-License-Identifier: LGPL-2.1-or-later
+# SPDX-FileNotice: Part of the Dynamic Data addon.
+
+################################################################################
+#                                                                              #
+#   Copyright (c) 2018 Mark Ganson ( TheMarkster )                             #
+#                                                                              #
+#   This library is free software; you can redistribute it and/or modify it    #
+#   under the terms of the GNU Lesser General Public License as published      #
+#   by the Free Software Foundation; either version 2.1 of the License, or     #
+#   (at your option) any later version.                                        #
+#                                                                              #
+#   This library is distributed in the hope that it will be useful,            #
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of             #
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.                       #
+#                                                                              #
+#   See the GNU Lesser General Public License for more details.                #
+#                                                                              #
+#   You should have received a copy of the GNU Lesser General Public License   #
+#   along with this library; if not, write to the Free Software Foundation,    #
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA           #
+#                                                                              #
+################################################################################
+
+"""DynamicData engine.
+
+Everything the workbench commands do to a document, as functions that take
+plain arguments.  This module does not import Qt or FreeCADGui, so it can be
+used from FreeCADCmd, for example:
+
+    import FreeCAD
+    from freecad.Dynamic_Data import core
+    doc = FreeCAD.openDocument("part.FCStd")
+    dd = core.getDDObjects(doc)[0]
+    core.addProperty(dd, "Length", "Width", "Dimensions", "width of the part", "25 mm")
+    core.renameProperty(dd, "Width", "PartWidth")
+    doc.recompute()
+"""
+
+import functools, math, re
+from collections import namedtuple
+import FreeCAD
+from freecad.Dynamic_Data import cache, configtable, expressions, metrics, proptypes
+#parsing of user entered values, see proptypes
+from freecad.Dynamic_Data.proptypes import (EvalError, evalExpression, evalLiteral, parseValue,
+    getColor, getLink, getLinkList, getLinkSubList, getObjectByNameOrLabel, getObjectsByNameOrLabel,
+    getShortType, getTypeId, COLOR_NAMES)
+
+#the caches are only valid while the observer keeps them current
+cache.installObserver()
+
+#property types offered by the Add Property command, without the App::Property prefix
+PROPERTY_TYPES = proptypes.NAMES
+
+
+########################################################################################
+# transactions and recompute
+
+class Batch:
+    """edit session for many calls on one document, see batch()"""
+
+    def __init__(self, doc, name="DynamicData: Batch", recompute=True):
+        self.doc = doc
+        self.name = name
+        self.recompute = recompute
+        self.outer = None #the session of doc this one joined, if nested
+        self.full = False #True if something asked for a full recompute
+        self.scope = {} #objects to recompute with their dependents, by name
+        self.refresh = {} #objects whose property view needs refreshing, by name
+
+    def __enter__(self):
+        self.outer = getBatch(self.doc)
+        if self.outer:
+            return self.outer
+        BATCHES[self.doc.Name] = self
+        self.doc.openTransaction(self.name)
+        metrics.count(metrics.TRANSACTIONS)
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        if self.outer:
+            return False
+        del BATCHES[self.doc.Name]
+        if excType:
+            self.doc.abortTransaction()
+            return False
+        self.doc.commitTransaction()
+        if self.recompute:
+            if self.full:
+                recompute(self.doc)
+            elif self.scope:
+                recomputeDependents(list(self.scope.values()))
+        for obj in self.refresh.values():
+            refreshPropertyView(obj)
+        return False
+
+BATCHES = {} #document name: the Batch open on it
+
+def batch(doc, name="DynamicData: Batch", recompute=True):
+    """context manager making everything done to doc inside it one undo
+    transaction, the transactions of the functions of this module join it.
+    Recomputes and property view refreshes are deferred to the end, where each
+    is done once.  On an exception the whole transaction is aborted, so an
+    exception caught inside the block does not undo the changes made so far.
+    Nested batches on the same document join the outer one.
+
+    with core.batch(doc):
+        for name, value in values:
+            core.addProperty(dd, "Length", name, value=value)
+    """
+    return Batch(doc, name, recompute)
+
+def getBatch(doc):
+    """the Batch open on doc or None"""
+    return BATCHES.get(doc.Name) if BATCHES else None
+
+def openTransaction(doc, name):
+    if not getBatch(doc):
+        doc.openTransaction(name)
+        metrics.count(metrics.TRANSACTIONS)
+
+def commitTransaction(doc):
+    if not getBatch(doc):
+        doc.commitTransaction()
+
+def abortTransaction(doc):
+    if not getBatch(doc):
+        doc.abortTransaction()
+
+def recompute(doc, objs=None):
+    """recompute objs (a list) or the whole document"""
+    session = getBatch(doc)
+    if session:
+        if objs is None:
+            session.full = True
+        else:
+            session.scope.update((o.Name, o) for o in objs)
+        return None
+    metrics.count(metrics.RECOMPUTES)
+    return doc.recompute(objs) if objs is not None else doc.recompute()
+
+def recomputeDependents(obj):
+    """recompute obj (an object or a list of objects of the same document) and
+    the objects depending on it rather than the whole document"""
+    objs = obj if isinstance(obj, (list, tuple)) else [obj]
+    if not objs:
+        return None
+    session = getBatch(objs[0].Document)
+    if session:
+        session.scope.update((o.Name, o) for o in objs)
+        return None
+    scope = {}
+    for o in objs:
+        scope[o.Name] = o
+        for dependent in o.InListRecursive:
+            scope[dependent.Name] = dependent
+    metrics.count(metrics.RECOMPUTES)
+    try:
+        return objs[0].Document.recompute(list(scope.values()))
+    except TypeError: #older FreeCAD without the objects argument
+        return objs[0].Document.recompute()
+
+def refreshPropertyView(obj):
+    """show changed properties of obj in the property view by selecting it
+    again, only if it is selected and the GUI is up"""
+    if not FreeCAD.GuiUp:
+        return
+    session = getBatch(obj.Document)
+    if session:
+        session.refresh[obj.Name] = obj
+        return
+    import FreeCADGui
+    if obj in FreeCADGui.Selection.getSelection():
+        FreeCADGui.Selection.removeSelection(obj)
+        FreeCADGui.Selection.addSelection(obj)
+
+#what an edit needs recomputed, see recomputeAfter()
+METADATA_EDIT = "metadata" #tooltips, groups: nothing
+VALUE_EDIT = "value" #values, expressions, properties added, removed or renamed: the dependents
+FULL_RECOMPUTE_PARAM = "FullRecompute" #+ the command name without DynamicData, e.g. FullRecomputeSetTooltip
+
+def getFullRecomputeParam(command):
+    """the parameter that makes command recompute the whole document"""
+    return FULL_RECOMPUTE_PARAM + command.replace("DynamicData", "", 1)
+
+def isFullRecompute(command):
+    """True if the user wants a full document recompute after command"""
+    pg = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/DynamicData")
+    return pg.GetBool(getFullRecomputeParam(command), False)
+
+def recomputeAfter(obj, edit, command=None):
+    """recompute what an edit of kind edit to obj (an object or a list) needs:
+    nothing after a METADATA_EDIT, obj and its dependents after a VALUE_EDIT, the
+    whole document if the full recompute setting of command is on.  Returns
+    "none", "dependents", or "full"."""
+    objs = obj if isinstance(obj, (list, tuple)) else [obj]
+    objs = [o for o in objs if o]
+    if not objs:
+        return "none"
+    if command and isFullRecompute(command):
+        recompute(objs[0].Document)
+        return "full"
+    if edit == METADATA_EDIT:
+        return "none"
+    recomputeDependents(objs)
+    return "dependents"
+
+
+########################################################################################
+# dd objects and property queries
+
+def getDDObjects(doc=None):
+    """dd objects in doc, default is the active document"""
+    return cache.getDDObjects(doc)
+
+def isDDObject(obj):
+    """checks if this is a DynamicData object"""
+    return hasattr(obj, "DynamicData")
+
+def getDynamicProperties(obj):
+    """get the list of the dynamic properties of obj"""
+    return cache.metadataCache.getDynamicProperties(obj)
+
+def isDynamic(obj, prop):
+    return cache.metadataCache.isDynamic(obj, prop)
+
+def getExpression(obj, prop):
+    """get the expression set for this property, or None"""
+    return cache.metadataCache.getExpression(obj, prop)
+
+def getEnumerationProperties(obj, ignored=("MapMode",)):
+    """names of the properties of type Enumeration in obj, skipping some well known ones"""
+    meta = cache.metadataCache.get(obj)
+    return [prop for prop,info in meta.properties.items()
+            if not prop in ignored and info.typeId and "App::PropertyEnumeration" in info.typeId]
+
+def getInExprs(obj, prop):
+    """get the incoming expressions bound to this property, in any open document
+    and including spreadsheet cells, from the expression index
+       returns a list of cache.ExpressionRef tuples: [(object, propertyname or cell, expression, kind),]
+    """
+    return cache.expressionIndex.getDependents(obj, prop)
+
+def getImpact(obj, props):
+    """what would break if props of obj were removed: {prop: [cache.ExpressionRef,]}
+    for each prop referenced by an expression other than its own"""
+    impact = {}
+    for prop in props:
+        refs = [ref for ref in getInExprs(obj, prop) if not (ref.owner == obj and ref.path in props)]
+        if refs:
+            impact[prop] = refs
+    return impact
+
+def formatImpact(impact):
+    """getImpact() result as text, one line per expression"""
+    lines = []
+    for prop,refs in impact.items():
+        for ref in refs:
+            where = f"{ref.owner.Label}.{ref.path}" if ref.kind == cache.PROPERTY else f"{ref.owner.Label} cell {ref.path}"
+            lines.append(f"{prop}: {where} = {ref.expression}")
+    return "\n".join(lines)
+
+def setReferencingExpression(ref, expression):
+    """replace the expression of cache.ExpressionRef ref"""
+    if ref.kind == cache.CELL:
+        ref.owner.set(ref.path, f"={expression}")
+    else:
+        ref.owner.setExpression(ref.path, expression)
+        metrics.count(metrics.EXPRESSIONS_SET)
+
+
+########################################################################################
+# property names
+
+UNIT_CACHE_SIZE = 4096
+
+@functools.lru_cache(maxsize=UNIT_CACHE_SIZE)
+def isUnit(name):
+    """check if name is a reserved keyword for units, such as T or k.  The
+    quantity parser decides, its answer is cached by name"""
+    #if parsing quantity succeeds, it means this name is a reserved keyword
+    try:
+        FreeCAD.Units.parseQuantity(name)
+        return True
+    except:
+        return False
+
+NAME_SUFFIX_RE = re.compile(r'^(.*?)(\d*)$')
+LEADING_DIGIT_RE = re.compile(r'^\d') #can't begin with a number
+INVALID_CHAR_RE = re.compile(r'[^0-9a-zA-Z]') #no non-alphanumerics
+NAME_REPLACEMENTS = {
+    " ": "_",
+    ".": "_",
+    "ä": "ae",
+    "ö": "oe",
+    "ü": "ue",
+    "Ä": "Ae",
+    "Ö": "Oe",
+    "Ü": "Ue",
+    "ß": "ss",
+    "'": ""
+}
+
+def isValidName(obj, name):
+    return name == fixName(obj, name) and not isUnit(name)
+
+def getNewPropertyNameCandidate(obj, candidate):
+    """arguments: (obj, candidate) Takes candidate as a starting point and finds a new unique name based on it
+    Example: candidate = "Length23" and there already exists in obj a "Length23",
+    so this function would try Length24, Length25, etc. until a new unique name is found"""
+
+    if not hasattr(obj, candidate) and not isUnit(candidate):
+        return candidate
+
+    # Use regular expression to extract base name and number
+    match = NAME_SUFFIX_RE.match(candidate)
+    base_name, number_suffix = match.groups() if match else (candidate, '')
+    idx = int(number_suffix) if number_suffix else 1
+
+    if isUnit(base_name):
+        base_name = f"{base_name}_"
+
+    return f"{base_name}{cache.nameSuffixes.getFreeSuffix(obj, base_name, idx)}"
+
+def fixName(obj, name):
+    """fixes a name so it can be a valid property name"""
+    new_name = name
+    for k,v in NAME_REPLACEMENTS.items():
+        new_name = new_name.replace(k, v)
+    if LEADING_DIGIT_RE.match(new_name):
+        new_name = f"_{new_name}"
+    new_name = INVALID_CHAR_RE.sub('_', new_name) #replace with _'s
+
+    if isUnit(new_name):
+        new_name = getNewPropertyNameCandidate(obj, new_name)
+    return new_name
+
+
+########################################################################################
+# creating objects and adding, changing, removing properties
+
+def getHelp(version):
+    return ["Created with DynamicData (v"+version+") workbench.",
+            "This is a simple container object built",
+            "for holding custom properties."
+]
+
+def createObject(doc, name="dd", container=None, version=None):
+    """create a new dd object in doc, optionally adding it to container (Body or Part)"""
+    if version is None:
+        from freecad.Dynamic_Data import updater
+        version = updater.getLocalVersion()
+    openTransaction(doc, "CreateObject")
+    a = doc.addObject("App::FeaturePython", name)
+    a.addProperty("App::PropertyStringList","DynamicData").DynamicData=getHelp(version)
+    if a.ViewObject:
+        setattr(a.ViewObject,'DisplayMode',['0']) #avoid enumeration -1 warning
+    commitTransaction(doc)
+    if container:
+        container.Group += [a]
+    return a
+
+def setPropertyValue(obj, prop, propertyType, value):
+    """set obj.prop of type propertyType (e.g. "Link") from value, which is either
+    a python value or the string the user typed.  Strings beginning with = are
+    set as expressions"""
+    proptypes.get(propertyType).setter(obj, prop, value)
+
+def addProperty(obj, propertyType, name, group="DefaultGroup", tooltip="", value=None, transaction=True):
+    """add a dynamic property to obj and set its value.  propertyType may be
+    "Length" or "App::PropertyLength".  Returns the name of the new property."""
+    doc = obj.Document
+    if transaction:
+        openTransaction(doc, "DynamicData: Add Property")
+    obj.addProperty(getTypeId(propertyType), name, group, tooltip)
+    metrics.count(metrics.PROPERTIES_ADDED)
+    if value is not None and value != "":
+        setPropertyValue(obj, name, propertyType, value)
+    if transaction:
+        commitTransaction(doc)
+    return name
+
+#one row of a bulk add, see addProperties()
+PropertyRow = namedtuple("PropertyRow", ["name", "type", "group", "tooltip", "value"],
+                         defaults=("DefaultGroup", "", None))
+
+def makePropertyRow(row):
+    """accepts a PropertyRow, a dictionary with the PropertyRow field names, or a
+    tuple/list (name, type[, group[, tooltip[, value]]])"""
+    if isinstance(row, PropertyRow):
+        return row
+    if isinstance(row, dict):
+        return PropertyRow(**row)
+    return PropertyRow(*row)
+
+def addProperties(obj, rows, recompute=True):
+    """add many dynamic properties to obj in a single transaction, followed by a
+    single recompute of obj and its dependents.  rows is an iterable of rows as
+    accepted by makePropertyRow(), string values are parsed as in the Add Property
+    dialog, so "=Box.Height" sets an expression.  A row that fails is reported and
+    skipped, the others are still added.  Returns the list of names added."""
+    doc = obj.Document
+    added = []
+    openTransaction(doc, "DynamicData: Add Properties")
+    try:
+        for row in rows:
+            row = makePropertyRow(row)
+            name = row.name
+            try:
+                if not isValidName(obj, name):
+                    raise ValueError(f"{name} is not a valid name, suggestion: {fixName(obj, name)}")
+                if hasattr(obj, name):
+                    raise ValueError(f"property {name} already exists")
+                value = proptypes.get(row.type).parse(obj, row.value) if isinstance(row.value, str) else row.value
+                obj.addProperty(getTypeId(row.type), name, row.group if row.group else "DefaultGroup", row.tooltip)
+                added.append(name)
+                metrics.count(metrics.PROPERTIES_ADDED)
+                if value is not None and value != "":
+                    setPropertyValue(obj, name, row.type, value)
+            except Exception as ex:
+                FreeCAD.Console.PrintError(f"DynamicData: cannot add {name} to {obj.Label}: {ex}\n")
+    finally:
+        commitTransaction(doc)
+    if recompute and added:
+        recomputeDependents(obj)
+    return added
+
+def removeProperties(obj, props):
+    """remove the properties in props from obj, returns the names removed"""
+    doc = obj.Document
+    removed = []
+    openTransaction(doc, "Remove properties")
+    for item in props:
+        try:
+            obj.removeProperty(item)
+            removed.append(item)
+            metrics.count(metrics.PROPERTIES_REMOVED)
+        except Exception as ex:
+            FreeCAD.Console.PrintError(f"DynamicData::Exception cannot remove {item}\n{ex}")
+    commitTransaction(doc)
+    return removed
+
+def renameProperty(obj, prop, newName):
+    """rename dynamic property prop to newName, keeping its value or expression
+    and updating the expressions that reference it"""
+    doc = obj.Document
+    outExpr = getExpression(obj, prop)
+    if not outExpr:
+        propval = getattr(obj, prop)
+    inExprs = getInExprs(obj, prop)
+    typeId = obj.getTypeIdOfProperty(prop)
+    docu = obj.getDocumentationOfProperty(prop)
+    group = obj.getGroupOfProperty(prop)
+    openTransaction(doc, f"Rename {prop}")
+    obj.addProperty(typeId, newName, group, docu)
+    metrics.count(metrics.PROPERTIES_ADDED)
+    if outExpr:
+        obj.setExpression(newName, outExpr)
+        metrics.count(metrics.EXPRESSIONS_SET)
+    else:
+        setattr(obj, newName, propval)
+    for inExpr in inExprs:
+        if inExpr.owner == obj and inExpr.path == prop:
+            continue
+        newExpr = expressions.renameProperty(inExpr.expression, inExpr.owner, obj, prop, newName)
+        if newExpr != inExpr.expression:
+            setReferencingExpression(inExpr, newExpr)
+    obj.removeProperty(prop)
+    metrics.count(metrics.PROPERTIES_REMOVED)
+    commitTransaction(doc)
+    return newName
+
+def retypeProperty(obj, prop, newType):
+    """replace prop with a property of the same name of type newType, trying to
+    keep its value.  Returns False if the value could not be kept."""
+    newType = getTypeId(newType)
+    docu = obj.getDocumentationOfProperty(prop)
+    group = obj.getGroupOfProperty(prop)
+    val = getattr(obj, prop)
+
+    obj.removeProperty(prop)
+    obj.addProperty(newType, prop, group, docu)
+    metrics.count(metrics.PROPERTIES_REMOVED)
+    metrics.count(metrics.PROPERTIES_ADDED)
+    try:
+        setattr(obj, prop, val)
+    except:
+        FreeCAD.Console.PrintError(f"""
+DynamicData: Unable to reset property value {val} for new property of type {newType}
+for property {prop} of {obj.Label}, using default value for properties of
+this type. You will need to set the value manually.\n""")
+        return False
+    return True
+
+def setTooltip(obj, prop, tooltip):
+    doc = obj.Document
+    openTransaction(doc, f"Set tooltip of {prop}")
+    obj.setDocumentationOfProperty(prop, tooltip)
+    commitTransaction(doc)
+    cache.metadataCache.invalidate(obj)
+
+def moveToGroup(obj, props, group):
+    """move dynamic properties props to group, returns the names moved"""
+    doc = obj.Document
+    moved = []
+    openTransaction(doc, "Move to new group")
+    for prop in props:
+        try:
+            obj.setGroupOfProperty(prop, group)
+            moved.append(prop)
+            FreeCAD.Console.PrintMessage(f"Property {prop} move to group {group}\n")
+        except Exception as ex:
+            FreeCAD.Console.PrintError(f"Cannot move {prop}, only dynamic properties are supported\n")
+    commitTransaction(doc)
+    cache.metadataCache.invalidate(obj)
+    return moved
+
+def setEnumerations(obj, enumDict):
+    """set the properties of type Enumeration of obj from the dictionary
+    {property name: list of enums}"""
+    doc = obj.Document
+    openTransaction(doc, "Edit Enumeration")
+    for k,v in enumDict.items():
+        setattr(obj,k,v)
+    commitTransaction(doc)
+
+
+########################################################################################
+# copy, set, and bind properties between objects
+
+def getPropertyOwner(obj, isView):
+    return obj.ViewObject if isView else obj
+
+def copyProperty(srcObj, srcProp, dstObj, newName, srcIsView=False, expression=None):
+    """create newName in dstObj as a copy of srcObj.srcProp (type, group, tooltip
+    and value), or with expression instead of the value if one is given.
+    Returns True on success, False if there was an error"""
+    src = getPropertyOwner(srcObj, srcIsView)
+    group = src.getGroupOfProperty(srcProp)
+    try:
+        dstObj.addProperty(src.getTypeIdOfProperty(srcProp), newName, group if group else "Base",
+                           src.getDocumentationOfProperty(srcProp))
+    except:
+        FreeCAD.Console.PrintError(f"DynamicData: Error adding {newName} to {dstObj.Label}")
+        return False
+    metrics.count(metrics.PROPERTIES_ADDED)
+    if expression:
+        try:
+            dstObj.setExpression(newName, expression)
+            metrics.count(metrics.EXPRESSIONS_SET)
+            return True
+        except Exception as e:
+            FreeCAD.Console.PrintError(f"DynamicData: error {e} setting {dstObj.Label}.{newName} to {expression}\n")
+            return False
+    try:
+        value = getattr(src, srcProp)
+    except:
+        value = "No python counterpart"
+    try:
+        setattr(dstObj, newName, value)
+        return True
+    except:
+        FreeCAD.Console.PrintError(f"DynamicData: Error setting {newName} to {value}, but property was created.\n")
+        return False
+
+def bindProperty(obj, prop, target, targetProp):
+    """bind obj.prop to target.targetProp via an expression, refused if this would
+    create a cyclic dependency"""
+    if target in obj.InListRecursive:
+        FreeCAD.Console.PrintError(f"""
+DynamicData error: Cannot bind  {obj.Label}.{prop} to {target.Label}.{targetProp}
+because this would create a cyclic dependency.""")
+        return False
+    obj.setExpression(prop, f"{target.Name}.{targetProp}")
+    metrics.count(metrics.EXPRESSIONS_SET)
+    return True
+
+def unbindProperty(obj, prop):
+    """clear the expression binding obj.prop"""
+    obj.setExpression(prop, None)
+    metrics.count(metrics.EXPRESSIONS_SET)
+    return True
+
+
+########################################################################################
+# configurations
+
+def getConfigurationExpression(dd, name, var):
+    """the expression binding variable var to its list in configuration name"""
+    return f"{dd.Label}.<<{dd.Label}>>.{var}List[<<{dd.Label}>>.{name}-1]"
+
+EXPRESSION_MODE = "expression" #each variable indexes its list property with an expression
+SWITCH_MODE = "switch" #the dd proxy writes the variables when the enumeration changes
+CONFIGURATION_MODES = (EXPRESSION_MODE, SWITCH_MODE)
+
+def getProxy(dd, create=False):
+    """the proxy.DynamicDataProxy of dd, given one if create and dd has none, else None"""
+    if not "Proxy" in dd.PropertiesList:
+        return None
+    from freecad.Dynamic_Data import proxy
+    current = dd.Proxy
+    if isinstance(current, proxy.DynamicDataProxy):
+        return current
+    if current is None and create:
+        dd.Proxy = proxy.DynamicDataProxy()
+        return dd.Proxy
+    return None
+
+def getConfigurationMode(dd, name):
+    """SWITCH_MODE or EXPRESSION_MODE"""
+    ddProxy = getProxy(dd)
+    return SWITCH_MODE if ddProxy and name in ddProxy.configurations else EXPRESSION_MODE
+
+def getConfigurationVariables(dd, name):
+    """the variables of configuration name: properties in group name with a
+    matching {variable}List property, or in switch mode those in its table"""
+    meta = cache.metadataCache.get(dd)
+    if getConfigurationMode(dd, name) == SWITCH_MODE:
+        table = getProxy(dd).getTable(dd, name)
+        return [var for var in table.variables if var in meta.properties] if table else []
+    return [prop for prop,info in meta.properties.items()
+            if info.group == name and prop != name and f"{prop}List" in meta.properties]
+
+def getConfigurationTableName(name):
+    """the property holding the table of configuration name"""
+    return f"{name}Table"
+
+def getConfigurationTable(dd, name):
+    """returns the configtable.ConfigurationTable of configuration name in dd.  The
+    stored table is used unless the {variable}List properties were edited since it
+    was written, in which case the lists win as they are what the model uses."""
+    enums = dd.getEnumerationsOfProperty(name)
+    variables = getConfigurationVariables(dd, name)
+    tableName = getConfigurationTableName(name)
+    table = None
+    if tableName in cache.metadataCache.get(dd).properties:
+        table = configtable.ConfigurationTable.deserialize(getattr(dd, tableName))
+    if table and getConfigurationMode(dd, name) == SWITCH_MODE:
+        return table
+    lists = [list(getattr(dd, f"{var}List")) for var in variables]
+    if table and table.enums == list(enums) and table.variables == variables and table.rows() == lists:
+        return table
+    return configtable.ConfigurationTable(enums, variables, lists)
+
+def getConfiguration(dd, name):
+    """returns (enums, variables, values) of configuration name in dd, see applyConfiguration()"""
+    table = getConfigurationTable(dd, name)
+    return table.enums, table.variables, table.rows()
+
+def sameExpression(expr1, expr2):
+    """compare expressions ignoring white space, FreeCAD adds spaces when it stores one"""
+    return expr1 is not None and expr2 is not None and "".join(expr1.split()) == "".join(expr2.split())
+
+def applyConfiguration(dd, name, enums, variables, values, removeMissing=True):
+    """create or update the configuration name in dd.  enums is the list of enum
+    names (including the leading "Select ..." entry), variables the list of
+    variable names, values[row] the list of floats of variable row, one per enum,
+    blank cells (None, "" or NaN) take the first value of the row.
+    See applyConfigurationTable()."""
+    return applyConfigurationTable(dd, name, configtable.ConfigurationTable(enums, variables, values), removeMissing)
+
+def applyConfigurationTable(dd, name, table, removeMissing=True, mode=None):
+    """create or update the configuration name in dd from the
+    configtable.ConfigurationTable table, raises ValueError if it is not valid.
+    mode is EXPRESSION_MODE or SWITCH_MODE, None to keep the current mode (a new
+    configuration gets EXPRESSION_MODE).  Switch mode needs a dd object, one
+    created by the workbench, as the variables are written by its proxy.
+    Only what differs from the configuration stored in dd is changed, so unchanged
+    variables keep their lists and expressions and their dependents are not
+    touched.  Variables no longer in the configuration are removed if removeMissing.
+    Returns the number of properties added, changed, and removed as a dictionary."""
+    problems = table.validate()
+    mode = mode if mode else getConfigurationMode(dd, name)
+    if not mode in CONFIGURATION_MODES:
+        problems.append(f"unknown configuration mode: {mode}")
+    if mode == SWITCH_MODE and not getProxy(dd) and (not "Proxy" in dd.PropertiesList or dd.Proxy is not None):
+        problems.append(f"switch mode needs a dd object, {dd.Label} cannot have a DynamicData proxy")
+    if problems:
+        raise ValueError("; ".join(problems))
+    table.fillDefaults()
+    enums, variables, values = table.enums, table.variables, table.rows()
+    counts = {"added": 0, "changed": 0, "removed": 0}
+    meta = cache.metadataCache.get(dd)
+
+    def hasType(prop, typeId):
+        info = meta.properties.get(prop)
+        return info is not None and info.typeId == typeId
+
+    def replace(prop, typeId, group, tooltip):
+        """add prop, first removing a property of that name but of another type"""
+        if prop in meta.properties:
+            try:
+                dd.removeProperty(prop)
+                metrics.count(metrics.PROPERTIES_REMOVED)
+                FreeCAD.Console.PrintMessage(f"Removed property {prop}\n")
+            except:
+                FreeCAD.Console.PrintWarning(f"Unable to remove property: {prop}\n")
+                return False
+        dd.addProperty(typeId, prop, group, tooltip)
+        metrics.count(metrics.PROPERTIES_ADDED)
+        FreeCAD.Console.PrintMessage(f"Added property {prop}\n")
+        counts["added"] += 1
+        return True
+
+    stored = getConfigurationVariables(dd, name) if hasType(name, "App::PropertyEnumeration") else []
+    if not hasType(name, "App::PropertyEnumeration"):
+        replace(name, "App::PropertyEnumeration", name, "Configuration enumeration")
+        setattr(dd, name, enums)
+    elif list(dd.getEnumerationsOfProperty(name)) != list(enums):
+        current = getattr(dd, name)
+        setattr(dd, name, enums)
+        if current in enums:
+            setattr(dd, name, current)
+        counts["changed"] += 1
+
+    for row,var in enumerate(variables):
+        listName = f"{var}List"
+        rowValues = values[row]
+        if mode == SWITCH_MODE:
+            if not hasType(var, "App::PropertyFloat"):
+                replace(var, "App::PropertyFloat", name, "Property set by the configuration")
+            elif getExpression(dd, var):
+                dd.setExpression(var, None)
+                metrics.count(metrics.EXPRESSIONS_SET)
+                counts["changed"] += 1
+            if listName in meta.properties:
+                dd.removeProperty(listName)
+                metrics.count(metrics.PROPERTIES_REMOVED)
+                FreeCAD.Console.PrintMessage(f"Removed property {listName}\n")
+                counts["removed"] += 1
+            continue
+        if not hasType(listName, "App::PropertyFloatList"):
+            replace(listName, "App::PropertyFloatList", f"{name}Lists", f"List property for {var}")
+            setattr(dd, listName, rowValues)
+        elif list(getattr(dd, listName)) != rowValues:
+            setattr(dd, listName, rowValues)
+            counts["changed"] += 1
+        added = not hasType(var, "App::PropertyFloat")
+        if added:
+            replace(var, "App::PropertyFloat", name, "Property to link to")
+        expr = getConfigurationExpression(dd, name, var)
+        if added or not sameExpression(getExpression(dd, var), expr):
+            dd.setExpression(var, expr)
+            metrics.count(metrics.EXPRESSIONS_SET)
+            counts["changed"] += not added
+
+    tableName = getConfigurationTableName(name)
+    if not hasType(tableName, "App::PropertyString"):
+        replace(tableName, "App::PropertyString", f"{name}Lists", f"Table of configuration {name}")
+        dd.setEditorMode(tableName, 2) #hidden, edit it with the configuration editor
+    serialized = table.serialize()
+    if getattr(dd, tableName) != serialized:
+        setattr(dd, tableName, serialized)
+    ddProxy = getProxy(dd, create=mode == SWITCH_MODE)
+    if mode == SWITCH_MODE:
+        if not name in ddProxy.configurations:
+            ddProxy.configurations.append(name)
+        ddProxy.switch(dd, name)
+    elif ddProxy and name in ddProxy.configurations:
+        ddProxy.configurations.remove(name)
+
+    if removeMissing:
+        for var in stored:
+            if var in variables:
+                continue
+            for prop in (var, f"{var}List"):
+                if not prop in meta.properties:
+                    continue
+                try:
+                    dd.removeProperty(prop)
+                    metrics.count(metrics.PROPERTIES_REMOVED)
+                    FreeCAD.Console.PrintMessage(f"Removed property {prop}\n")
+                    counts["removed"] += 1
+                except:
+                    FreeCAD.Console.PrintWarning(f"Unable to remove property: {prop}\n")
+    return counts
+
+def exportConfigurationCsv(dd, name, path):
+    """write configuration name of dd to the csv file path, laid out as in the editor"""
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        getConfigurationTable(dd, name).writeCsv(f)
+
+def importConfigurationCsv(dd, name, path, removeMissing=True, recompute=True, mode=None):
+    """create or update configuration name of dd from the csv file path in one
+    transaction, see exportConfigurationCsv().  Raises ValueError if the file does
+    not hold a valid table.  Returns the counts of applyConfigurationTable()."""
+    with open(path, "r", newline="", encoding="utf-8-sig") as f:
+        table = configtable.ConfigurationTable.readCsv(f)
+    problems = table.validate()
+    if problems:
+        raise ValueError(f"{path}: " + "; ".join(problems))
+    openTransaction(dd.Document, "dd Import Configuration")
+    try:
+        counts = applyConfigurationTable(dd, name, table, removeMissing, mode)
+    except:
+        abortTransaction(dd.Document)
+        raise
+    commitTransaction(dd.Document)
+    if recompute:
+        recomputeDependents(dd)
+    return counts
+
+########################################################################################
+# importing aliases and named constraints
+
+def getSheetAliases(sheet):
+    """returns {alias: cell address} of sheet"""
+    aliases = {}
+    if hasattr(sheet, "getUsedCells"):
+        for cell in sheet.getUsedCells():
+            alias = sheet.getAlias(cell)
+            if alias:
+                aliases[alias] = cell
+        return aliases
+    #FreeCAD before 0.20 has no getUsedCells(), read the saved cells instead
+    for match in re.finditer(r'<Cell address="([^"]+)"[^>]*?\salias="([^"]+)"', sheet.cells.Content):
+        aliases[match.group(2)] = match.group(1)
+    return aliases
+
+def getAliasExpression(sheet, alias, aliases, cell=None):
+    """Get the expression if there is one, modify it, and return it, else None if there is no expression."""
+
+    cell = cell if cell else sheet.getCellFromAlias(alias)  # e.g. "B2"
+    contents = sheet.getContents(cell)
+    #if an expression contents will be for example: "=B2 + 3 * Box.Height"
+    #this must be modified to be: "href(<<Spreadsheet.Label>>.B2) + 3 * Box.Height"
+    #aliases must also be wrapped in href() and prepended with the sheet label)
+
+    if not contents.startswith("="):
+        return None #not an expression
+
+    if not isinstance(aliases, frozenset):
+        aliases = frozenset(aliases)
+    #cell references like "B2", "ZY179" are treated the same as aliases
+    return expressions.qualify(contents[1:].strip(), aliases, expressions.quoteLabel(sheet.Label, always=True),
+                               href=True, cells=True)
+
+def getAliasPropertyType(value):
+    """returns (property type, value to set) for the value of an alias, or None if not supported"""
+    if isinstance(value, FreeCAD.Units.Quantity):
+        propertyType = value.Unit.Type #e.g. 'Length'
+        #handle inconsistencies in naming convention between unit types and property types
+        if 'Velocity' in propertyType:
+            propertyType = 'Speed'
+        return (propertyType if propertyType else 'Quantity'), value.UserString
+    if isinstance(value, (float, int)) and not isinstance(value, bool):
+        #ints are treated as floats too, since many users no doubt will expect this
+        #behavior for imported aliases
+        return 'Float', value
+    if isinstance(value, str):
+        return 'String', value
+    return None
+
+#one alias to import: the property to add to the dd object and the cell to point to it
+AliasImport = namedtuple("AliasImport", ["sheet", "alias", "cell", "name", "propertyType", "value", "expression"])
+
+def planAliasImport(dd, sheets):
+    """read the aliases of sheets and return the list of AliasImports, nothing is changed yet"""
+    plan = []
+    names = set()
+    for sheet in sheets:
+        aliases = getSheetAliases(sheet)
+        aliasSet = frozenset(aliases)
+        for alias,cell in aliases.items():
+            if alias.endswith("_"): #skip aliases that end in an underscore
+                FreeCAD.Console.PrintWarning(f'DynamicData: skipping alias "{alias}" because it ends in an underscore (_).\n')
+                continue
+            atr = getattr(sheet, alias)
+            typed = getAliasPropertyType(atr)
+            if not typed:
+                FreeCAD.Console.PrintError(f'DynamicData: please report: unknown property type error importing alias from spreadsheet ({type(atr)})\n')
+                continue
+            name = fixName(dd, alias)
+            if hasattr(dd, name) or name in names: #avoid adding the same property again
+                FreeCAD.Console.PrintWarning(f"DynamicData: skipping existing property: {name}\n")
+                continue
+            names.add(name)
+            plan.append(AliasImport(sheet, alias, cell, name, typed[0], typed[1],
+                                    getAliasExpression(sheet, alias, aliasSet, cell)))
+    return plan
+
+def importAliases(dd, sheets, doRecompute=True):
+    """import the aliases of sheets into dd and point the aliased cells to the new
+    dd properties.  All changes are made in one transaction, aborted if anything
+    fails, followed by one recompute of dd and the sheets that changed.  Returns
+    the list of aliases imported."""
+    doc = dd.Document
+    plan = planAliasImport(dd, sheets)
+    if not plan:
+        FreeCAD.Console.PrintMessage('DynamicData: No aliases found.\n')
+        return []
+    openTransaction(doc, "dd Import Aliases") #setup undo
+    try:
+        for item in plan:
+            dd.addProperty(getTypeId(item.propertyType), item.name, item.sheet.Label, item.propertyType)
+            setattr(dd, item.name, item.value)
+            metrics.count(metrics.PROPERTIES_ADDED)
+        for item in plan:
+            if item.expression: #None if not an expression
+                dd.setExpression(item.name, item.expression)
+                metrics.count(metrics.EXPRESSIONS_SET)
+        for item in plan:
+            item.sheet.set(item.cell, f"={dd.Label}.{item.name}")
+            metrics.count(metrics.EXPRESSIONS_SET)
+            FreeCAD.Console.PrintLog(f"DynamicData: added {dd.Label}.{item.name}, {item.sheet.Label}.{item.alias} now points to it\n")
+    except Exception:
+        abortTransaction(doc) #do not leave a half done import in the undo stack
+        raise
+    commitTransaction(doc)
+    changed = []
+    for item in plan:
+        if not item.sheet in changed:
+            changed.append(item.sheet)
+    for sheet in changed:
+        count = len([item for item in plan if item.sheet == sheet])
+        FreeCAD.Console.PrintMessage(f"DynamicData: imported {count} aliases from {sheet.Label} into {dd.Label}\n")
+    if doRecompute:
+        recompute(doc, [dd] + changed)
+    return [item.alias for item in plan]
+
+CONSTRAINTS = frozenset(["Constraints"])
+
+def getConstraintExpression(sketch, constraintName):
+    """Check if sketch.Constraints.constraintName has an expression, if not return None"""
+    for name, value in sketch.ExpressionEngine:
+        if name.split(".")[-1] == constraintName:
+            #.Constraints.xxx of this sketch becomes <<sketch.Label>>.Constraints.xxx,
+            #then any sketch's Constraints.xxx is wrapped in href()
+            expr = expressions.qualify(value, CONSTRAINTS, expressions.quoteLabel(sketch.Label, always=True))
+            return expressions.wrapInHref(expr, CONSTRAINTS)
+    return None
+
+def importNamedConstraints(dd, sketches):
+    """import the named driving constraints of sketches into dd and bind the
+    constraints to the new dd properties.  Returns the number of constraints found."""
+    doc = dd.Document
+    openTransaction(doc, "dd Import Constraints") #setup undo
+    constraints=[]
+    for sketch in sketches:
+        for con in sketch.Constraints:
+            if not con.Name or con.Name[-1:]=='_': #ignore constraint names ending in underscore
+                continue
+            if not con.Driving:
+                FreeCAD.Console.PrintWarning(f"\
+DynamicData: Skipping reference mode constraint: {con.Name} because linking by expression would cause a cyclic \
+dependency and linking by value would produce an incorrect value should the reference value change.\n")
+                continue
+            expr = getConstraintExpression(sketch, con.Name)
+            constraints.append({'expression':expr, 'constraintName':con.Name,'value':con.Value,\
+                        'constraintType':con.Type,'sketchLabel':sketch.Label, 'sketch':sketch, \
+                        'driving': con.Driving})
+
+    if len(constraints) == 0:
+        abortTransaction(doc)
+        FreeCAD.Console.PrintMessage('DynamicData: No named constraints found.\n')
+        return 0
+
+    for con in constraints:
+        propertyType = "Length"
+        value = con['value']
+        if con['constraintType'] == 'Angle':
+            propertyType = "Angle"
+            value *= (180.0 / math.pi)
+
+        sketch = con['sketch']
+        name = fixName(dd, con['constraintName'])
+        importedName = con['sketchLabel'] + name[0].upper() + name[1:]
+
+        if not isValidName(dd, con['constraintName']):
+            for idx,constraint in enumerate(sketch.Constraints):
+                if constraint.Name == con['constraintName']:
+                    sketch.renameConstraint(idx, name)
+                    FreeCAD.Console.PrintWarning(f"DynamicData: Renaming invalid constraint name: {con['constraintName']} to {name}\n")
+                    break
+        if not hasattr(dd,importedName): #avoid adding the same property again
+            dd.addProperty(getTypeId(propertyType), importedName, con['sketchLabel'],f"[{propertyType}] constraint type: [{con['constraintType']}]")
+            setattr(dd, importedName, value)
+            dd.setExpression(importedName, con['expression'])
+            FreeCAD.Console.PrintMessage(f"DynamicData: adding property: {importedName} to dd object\n")
+            sketch.setExpression(f"Constraints.{name}", f"<<{dd.Label}>>.{importedName}")
+            metrics.count(metrics.PROPERTIES_ADDED)
+            metrics.count(metrics.EXPRESSIONS_SET, 2)
+        else:
+            FreeCAD.Console.PrintWarning(f"DynamicData: skipping existing property: {name}\n")
+    commitTransaction(doc)
+    return len(constraints)
@@ -0,0 +1,451 @@
+# SPDX-License-Identifier: LGPL-2.1-or-later
+# SPDX-FileNotice: Part of the Dynamic Data addon.
+
+################################################################################
+#                                                                              #
+#   Copyright (c) 2018 Mark Ganson ( TheMarkster )                             #
+#                                                                              #
+#   This library is free software; you can redistribute it and/or modify it    #
+#   under the terms of the GNU Lesser General Public License as published      #
+#   by the Free Software Foundation; either version 2.1 of the License, or     #
+#   (at your option) any later version.                                        #
+#                                                                              #
+#   This library is distributed in the hope that it will be useful,            #
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of             #
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.                       #
+#                                                                              #
+#   See the GNU Lesser General Public License for more details.                #
+#                                                                              #
+#   You should have received a copy of the GNU Lesser General Public License   #
+#   along with this library; if not, write to the Free Software Foundation,    # 
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA           #
+#                                                                              #
+################################################################################
+
+"""Add Property dialog."""
+
+import threading
+from collections import OrderedDict
+from PySide import QtCore, QtGui
+from freecad.Dynamic_Data import cache, core, proptypes
+from freecad.Dynamic_Data.proptypes import EvalError
+
+PREVIEW_DELAY = 200 #ms without typing before the value preview is evaluated
+PREVIEW_CACHE_SIZE = 256
+
+
+class PreviewCache:
+    """least recently used cache of value previews"""
+
+    def __init__(self, size):
+        self.size = size
+        self.entries = OrderedDict()
+
+    def get(self, key):
+        preview = self.entries.get(key)
+        if preview is not None:
+            self.entries.move_to_end(key)
+        return preview
+
+    def put(self, key, preview):
+        self.entries[key] = preview
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.size:
+            self.entries.popitem(last=False)
+
+
+class PreviewEvaluator(QtCore.QObject):
+    """evaluates python literals in a worker thread, the signal is emitted from
+    that thread and delivered in the GUI thread through a queued connection"""
+    finished = QtCore.Signal(object, object) #key, (text, style sheet)
+
+    def evaluate(self, key, val):
+        threading.Thread(target=self.run, args=(key, val), daemon=True).start()
+
+    def run(self, key, val):
+        try:
+            preview = (f"{core.evalLiteral(val)}", "color: black")
+        except EvalError as ev:
+            preview = (ev.message, "color: red")
+        try:
+            self.finished.emit(key, preview)
+        except RuntimeError:
+            pass #the dialog was closed in the meantime
+
+
+class PropertyTypeDelegate(QtGui.QStyledItemDelegate):
+    """combo box editor for the type column of the bulk table"""
+
+    def __init__(self, types, parent=None):
+        super().__init__(parent)
+        self.types = types
+
+    def createEditor(self, parent, option, index):
+        combo = QtGui.QComboBox(parent)
+        combo.addItems(self.types)
+        return combo
+
+    def setEditorData(self, editor, index):
+        idx = editor.findText(index.data())
+        editor.setCurrentIndex(idx if idx >= 0 else 0)
+
+    def setModelData(self, editor, model, index):
+        model.setData(index, editor.currentText())
+
+
+class MultiTextInput(QtGui.QDialog):
+    def __init__(self, obj, cmd):
+        QtGui.QDialog.__init__(self)
+        self.obj = obj
+        self.cmd = cmd #cmd is the command class
+        layout = QtGui.QGridLayout()
+        #layout.setColumnStretch(1, 1)
+        self.addAnotherProp = False
+        self.label = QtGui.QLabel(self)
+        self.objLabelPrefix = QtGui.QLabel("Target object:")
+        self.objLabel = QtGui.QLabel("")
+        self.objIcon = QtGui.QLabel()
+        obj_label = self.obj.Label
+        if self.obj.Name != obj_label:
+            obj_label = f"{self.obj.Label} ({self.obj.Name})"
+        self.objLabel.setText(obj_label)
+        self.objIcon.setPixmap(self.obj.ViewObject.Icon.pixmap(32,32))
+        self.label.setText("In Value field:\nUse =expr for expressions, e.g. =Box.Height\n")
+        self.propertyTypeLabel = QtGui.QLabel("Select App::Property type:")
+        self.listWidget = QtGui.QListWidget()
+        self.listWidget.currentItemChanged.connect(self.onListWidgetCurrentItemChanged)
+        self.label2 = QtGui.QLabel("")
+        self.label2.setStyleSheet("color: red;")
+        self.label3 = QtGui.QLabel("")
+        self.label3.setStyleSheet("color: red;")
+        self.label4 = QtGui.QLabel("")
+        self.nameLabel = QtGui.QLabel("Name: ")
+        self.nameEdit = QtGui.QLineEdit(self)
+        self.nameEdit.textChanged.connect(self.on_text_changed)
+        self.valueLabel = QtGui.QLabel("Value: ")
+        self.valueEdit = QtGui.QLineEdit(self)
+        self.valueEdit.textChanged.connect(self.on_value_changed)
+        self.previewTimer = QtCore.QTimer(self)
+        self.previewTimer.setSingleShot(True)
+        self.previewTimer.setInterval(PREVIEW_DELAY)
+        self.previewTimer.timeout.connect(self.updatePreview)
+        self.previewCache = PreviewCache(PREVIEW_CACHE_SIZE)
+        self.previewKey = None
+        self.previewEvaluator = PreviewEvaluator(self)
+        self.previewEvaluator.finished.connect(self.showBackgroundPreview)
+        self.groupLabel = QtGui.QLabel("Group: ")
+        self.groupCombo = QtGui.QComboBox(self)
+        self.groupCombo.setEditable(True)
+        self.tooltipLabel = QtGui.QLabel("Tooltip: ")
+        self.tooltipPrependLabel = QtGui.QLabel("")
+        self.tooltipEdit = QtGui.QLineEdit(self)
+
+        layout.addWidget(self.label, 0, 0, 2, 5)
+        layout.addWidget(self.objLabelPrefix, 2, 0, 1, 1)
+        layout.addWidget(self.objLabel, 2, 2, 1, 2)
+        layout.addWidget(self.objIcon, 2, 1, 1, 1)
+        layout.addWidget(self.propertyTypeLabel, 3, 0, 1, 6)
+        layout.addWidget(self.listWidget, 4, 0, 1, 6)
+        layout.addWidget(self.nameLabel, 5, 0, 1, 1)
+        layout.addWidget(self.nameEdit, 5, 1, 1, 5)
+        layout.addWidget(self.label4, 6, 1, 1, 5)
+        layout.addWidget(self.valueLabel, 7, 0, 1, 1)
+        layout.addWidget(self.valueEdit, 7, 1, 1, 5)
+        layout.addWidget(self.groupLabel, 8, 0, 1, 1)
+        layout.addWidget(self.groupCombo, 8, 1 , 1, 5)
+        layout.addWidget(self.tooltipLabel, 9, 0, 1, 1)
+        layout.addWidget(self.tooltipPrependLabel, 9, 1, 1, 1)
+        layout.addWidget(self.tooltipEdit, 9, 2, 1, 4)
+        layout.addWidget(self.label2, 10, 0, 1, 5)
+        layout.addWidget(self.label3, 11, 0, 1, 5)
+        self.singleWidgets = [self.propertyTypeLabel, self.listWidget, self.nameLabel, self.nameEdit,
+                              self.label4, self.valueLabel, self.valueEdit, self.groupLabel,
+                              self.groupCombo, self.tooltipLabel, self.tooltipPrependLabel,
+                              self.tooltipEdit, self.label2, self.label3]
+        self.setupBulkTable(layout)
+        self.buttons = QtGui.QDialogButtonBox(
+            QtGui.QDialogButtonBox.Ok.__or__(QtGui.QDialogButtonBox.Cancel),
+            QtCore.Qt.Horizontal, self)
+        self.buttons.accepted.connect(self.accept)
+        self.buttons.rejected.connect(self.reject)
+        self.buttons.setCenterButtons(True)
+        addAnother = QtGui.QPushButton("Apply", self)
+        self.buttons.addButton(addAnother, QtGui.QDialogButtonBox.ActionRole)
+        addAnother.clicked.connect(self.addAnotherProperty)
+        self.bulkButton = QtGui.QPushButton("Table...", self)
+        self.bulkButton.setCheckable(True)
+        self.bulkButton.setToolTip("Add many properties at once from an editable table.\n\
+Paste rows of tab separated Name, Type, Group, Tooltip, Value with Ctrl+V")
+        self.bulkButton.toggled.connect(self.setBulkMode)
+        self.buttons.addButton(self.bulkButton, QtGui.QDialogButtonBox.ActionRole)
+        layout.addWidget(self.buttons, 12, 0, 1, 5)
+        self.setLayout(layout)
+
+    def setupBulkTable(self, layout):
+        """the table used to add many properties at once, hidden until the Table button is toggled"""
+        self.bulkColumns = list(core.PropertyRow._fields)
+        self.bulkErrorRows = set()
+        self.bulkTable = QtGui.QTableWidget(0, len(self.bulkColumns), self)
+        self.bulkTable.setHorizontalHeaderLabels([c.capitalize() for c in self.bulkColumns])
+        self.bulkTable.horizontalHeader().setStretchLastSection(True)
+        self.bulkTable.setItemDelegateForColumn(1, PropertyTypeDelegate(self.cmd.PropertyTypes, self.bulkTable))
+        self.bulkTable.itemChanged.connect(self.onBulkItemChanged)
+        self.bulkPasteShortcut = QtGui.QShortcut(QtGui.QKeySequence.Paste, self.bulkTable)
+        self.bulkPasteShortcut.activated.connect(self.pasteBulkRows)
+        self.bulkAddRowButton = QtGui.QPushButton("Add row", self)
+        self.bulkAddRowButton.clicked.connect(lambda: self.addBulkRow())
+        self.bulkRemoveRowsButton = QtGui.QPushButton("Remove rows", self)
+        self.bulkRemoveRowsButton.clicked.connect(self.removeBulkRows)
+        self.bulkStatusLabel = QtGui.QLabel("")
+        layout.addWidget(self.bulkTable, 3, 0, 7, 6)
+        layout.addWidget(self.bulkAddRowButton, 10, 0, 1, 1)
+        layout.addWidget(self.bulkRemoveRowsButton, 10, 1, 1, 1)
+        layout.addWidget(self.bulkStatusLabel, 11, 0, 1, 5)
+        self.bulkWidgets = [self.bulkTable, self.bulkAddRowButton, self.bulkRemoveRowsButton, self.bulkStatusLabel]
+        for widget in self.bulkWidgets:
+            widget.setVisible(False)
+
+    @property
+    def bulkMode(self):
+        return self.bulkButton.isChecked()
+
+    def setBulkMode(self, bulk):
+        """switch between adding one property and the table of properties"""
+        for widget in self.singleWidgets:
+            widget.setVisible(not bulk)
+        for widget in self.bulkWidgets:
+            widget.setVisible(bulk)
+        if bulk and self.bulkTable.rowCount() == 0:
+            self.addBulkRow([self.nameEdit.text().split(";")[0], self.Current,
+                             self.groupCombo.currentText(), self.tooltipEdit.text(), self.valueEdit.text()])
+        if bulk:
+            self.resize(max(self.width(), 700), self.height())
+
+    def addBulkRow(self, values=None, validate=True):
+        """append a row, values is a list of strings in the column order of core.PropertyRow.
+        With validate False the caller validates the table once it has added its rows"""
+        if not values:
+            last = self.getBulkRowValues(self.bulkTable.rowCount()-1) if self.bulkTable.rowCount() else None
+            propType = last[1] if last else self.Current
+            group = last[2] if last else self.groupCombo.currentText()
+            values = ["", propType, group, "", ""]
+        row = self.bulkTable.rowCount()
+        self.bulkTable.blockSignals(True)
+        self.bulkTable.insertRow(row)
+        for col,text in enumerate(values[:len(self.bulkColumns)]):
+            self.bulkTable.setItem(row, col, QtGui.QTableWidgetItem(text))
+        if not values[0]:
+            self.bulkTable.item(row, 0).setText(self.getBulkNameCandidate(values[1]))
+        self.bulkTable.blockSignals(False)
+        if validate:
+            self.validateBulkRows()
+
+    def removeBulkRows(self):
+        rows = sorted(set(index.row() for index in self.bulkTable.selectedIndexes()), reverse=True)
+        for row in rows:
+            self.bulkTable.removeRow(row)
+        self.validateBulkRows()
+
+    def pasteBulkRows(self):
+        """paste tab separated rows, for example copied from a spreadsheet"""
+        text = QtGui.QApplication.clipboard().text()
+        for line in text.splitlines():
+            if not line.strip():
+                continue
+            values = line.split("\t")
+            values += [""] * (len(self.bulkColumns) - len(values))
+            if not values[1]:
+                values[1] = self.Current
+            self.addBulkRow(values, validate=False)
+        self.validateBulkRows()
+
+    def getBulkRowValues(self, row):
+        values = []
+        for col in range(len(self.bulkColumns)):
+            item = self.bulkTable.item(row, col)
+            values.append(item.text() if item else "")
+        return values
+
+    def getBulkNameCandidate(self, candidate):
+        """a name not in the object nor in the table"""
+        taken = set(self.getBulkRowValues(row)[0] for row in range(self.bulkTable.rowCount()))
+        name = self.cmd.getNewPropertyNameCandidate(self.obj, candidate)
+        base = name.rstrip("0123456789") or name
+        idx = 1
+        while name in taken:
+            idx += 1
+            name = self.cmd.getNewPropertyNameCandidate(self.obj, f"{base}{idx}")
+        return name
+
+    def onBulkItemChanged(self, item):
+        self.validateBulkRows()
+
+    def validateBulkRows(self):
+        """mark the rows whose name is invalid, already taken, or repeated in the
+        table, and those whose value is not valid for their type"""
+        seen = set()
+        self.bulkErrorRows = set()
+        self.bulkTable.blockSignals(True)
+        for row in range(self.bulkTable.rowCount()):
+            values = self.getBulkRowValues(row)
+            name, propType, value = values[0], values[1], values[4]
+            error = ""
+            if not name:
+                error = "Name cannot be empty"
+            elif not self.cmd.isValidName(self.obj, name):
+                error = f"{name} is not a valid name, suggestion: {self.cmd.fixName(self.obj, name)}"
+            elif hasattr(self.obj, name) or name in seen:
+                error = "Property name already exists"
+            elif not proptypes.isKnown(propType):
+                error = f"Unknown property type {propType}"
+            else:
+                validate = proptypes.get(propType).validate
+                text, status = validate(self.obj, value) if validate and value else ("", proptypes.VALID)
+                if status == proptypes.INVALID:
+                    error = text
+            seen.add(name)
+            item = self.bulkTable.item(row, 0)
+            if item:
+                item.setToolTip(error)
+                item.setForeground(QtGui.QBrush(QtGui.QColor("red" if error else "black")))
+            if error:
+                self.bulkErrorRows.add(row)
+        errors = len(self.bulkErrorRows)
+        self.bulkTable.blockSignals(False)
+        self.bulkStatusLabel.setText(f"{errors} row(s) with errors will be skipped" if errors else
+                                     f"{self.bulkTable.rowCount()} properties to add")
+
+    def getBulkRows(self):
+        """the table as a list of core.PropertyRow, skipping rows with errors"""
+        rows = []
+        for row in range(self.bulkTable.rowCount()):
+            values = self.getBulkRowValues(row)
+            if values[0] and not row in self.bulkErrorRows:
+                rows.append(core.PropertyRow(*values))
+        return rows
+
+    def addAnotherProperty(self):
+        """user has clicked Apply button, so this informs parent command
+        class to reopen the dialog after adding property"""
+        self.addAnotherProp = True
+        self.accept()
+
+    @property
+    def Current(self):
+        return self.listWidget.currentItem().text()
+
+    def onListWidgetCurrentItemChanged(self,current,previous):
+        """when the user selects a different property type, suggest a name for the property"""
+        candidate = self.cmd.getNewPropertyNameCandidate(self.obj, current.text())
+        self.nameEdit.setText(candidate)
+        self.tooltipPrependLabel.setText(f"[{current.text()}]")
+        self.valueEdit.setPlaceholderText(proptypes.get(current.text()).placeholder)
+        self.updatePreview()
+
+    def on_value_changed(self):
+        """restart the preview timer, the preview is only evaluated once the user
+        pauses typing"""
+        self.previewTimer.start()
+
+    def updatePreview(self):
+        """this just provides a pre-evaluation of the value and displays in a label,
+        the results are cached with the document revision, since the value of an
+        expression such as Body.Shape.Volume changes with the document"""
+        self.previewTimer.stop()
+        val = self.valueEdit.text()
+        key = (self.Current, val, cache.getDocumentRevision(self.obj.Document))
+        self.previewKey = key
+        preview = self.previewCache.get(key) if key[2] is not None else None
+        if preview is None:
+            preview = self.getPreview(self.Current, val, key)
+            if preview is None: #evaluating in the background, see showBackgroundPreview()
+                return
+            if key[2] is not None:
+                self.previewCache.put(key, preview)
+        self.showPreview(*preview)
+
+    def showPreview(self, text, style):
+        self.label4.setText(text)
+        self.label4.setStyleSheet(style)
+
+    def showBackgroundPreview(self, key, preview):
+        """result of a background evaluation, delivered in the GUI thread"""
+        if key[2] is not None:
+            self.previewCache.put(key, preview)
+        if key == self.previewKey:
+            self.showPreview(*preview)
+
+    def getPreview(self, current, val, key):
+        """returns (text, style sheet) of the preview of val as a value of type
+        current, or None if it is being evaluated in the background"""
+        validate = proptypes.get(current).validate
+        if validate:
+            text, status = validate(self.obj, val)
+            if status == proptypes.VALID:
+                return (text, "color:black;" if text else "")
+            if status == proptypes.INVALID:
+                return (text, "color:red;")
+            color = tuple(255-c for c in status) #a valid color, show it
+            return (text, f"color: rgb{color};background-color: rgb{status};")
+        if not val:
+            return ("", "")
+        if val.startswith("="):
+            val = val[1:]
+        #FreeCAD expressions must be evaluated in the GUI thread, python literals need not
+        try:
+            return (f"{self.obj.evalExpression(val)}", "color: black")
+        except Exception:
+            pass
+        self.previewEvaluator.evaluate(key, val)
+        return None
+
+    def on_text_changed(self):
+        """handler for the property name field when it changes"""
+        name = self.nameEdit.text()
+        if ";" in name:
+            name = name[:name.index(";")]
+        #label2 is for invalid name messages
+        #later label3 shows where there is a conflict with an existing name
+        if not self.cmd.isValidName(self.obj, name):
+            if name:
+                self.label2.setText(f"{name} is not a valid name, suggestion: {self.cmd.fixName(self.obj, name)}")
+            else:
+                self.label2.setText("Name field cannot be empty.")
+        else:
+            self.label2.setText("")
+
+        self.on_edit_finished()
+
+    def on_edit_finished(self):
+        """we still support the original semicolon-delimited way of adding properties
+        in a single QLineEdit even though that was very user-unfriendly"""
+        if ";" in self.nameEdit.text():
+            hasValue = False
+            propertyName = self.nameEdit.text()
+            split = propertyName.split(';')
+            propertyName = split[0].replace(' ','_')
+            if len(propertyName) == 0:
+                propertyName = "Prop"
+            if len(split)>1: #has a group name
+                if len(split[1])>0: #allow for ;; empty string to mean use current group name
+                    self.groupCombo.setCurrentText(split[1])
+            if len(split)>2: #has a tooltip
+                if len(split[2])>0:
+                    self.tooltipEdit.setText(split[2])
+            if len(split)==4: #has a value
+                hasValue = True
+                val = split[3]
+            self.groupCombo.setEnabled(False)
+            if hasValue:
+                self.valueEdit.setText(val)
+            self.valueEdit.setEnabled(False)
+            self.tooltipEdit.setEnabled(False)
+        else:
+            self.groupCombo.setEnabled(True)
+            self.valueEdit.setEnabled(True)
+            self.tooltipEdit.setEnabled(True)
+            propertyName = self.nameEdit.text()
+        if hasattr(self.obj,propertyName):
+            self.label3.setText(f"Property name already exists, suggestion: {self.cmd.getNewPropertyNameCandidate(self.obj, propertyName)}")
+        else:
+            self.label3.setText('')
@@ -0,0 +1,532 @@
+# SPDX-License-Identifier: LGPL-2.1-or-later
+# SPDX-FileNotice: Part of the Dynamic Data addon.
+
+################################################################################
+#                                                                              #
+#   Copyright (c) 2018 Mark Ganson ( TheMarkster )                             #
+#                                                                              #
+#   This library is free software; you can redistribute it and/or modify it    #
+#   under the terms of the GNU Lesser General Public License as published      #
+#   by the Free Software Foundation; either version 2.1 of the License, or     #
+#   (at your option) any later version.                                        #
+#                                                                              #
+#   This library is distributed in the hope that it will be useful,            #
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of             #
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.                       #
+#                                                                              #
+#   See the GNU Lesser General Public License for more details.                #
+#                                                                              #
+#   You should have received a copy of the GNU Lesser General Public License   #
+#   along with this library; if not, write to the Free Software Foundation,    # 
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA           #
+#                                                                              #
+################################################################################
+
+"""Configuration editor dialog."""
+
+import csv, math
+from PySide import QtCore, QtGui
+import FreeCAD, FreeCADGui
+Gui = FreeCADGui
+from freecad.Dynamic_Data import configtable, core
+from freecad.Dynamic_Data.DynamicDataCmd import __version__
+
+
+MAX_COUNT = 100000 #enums or variables, the table only draws the visible cells
+
+class ConfigurationModel(QtCore.QAbstractTableModel):
+    """the configuration table, row 0 holds the enum names, column 0 the variable
+    names and the last column the default values (used for the "Select ..." enum).
+    Values are kept as text by column, values[col][row] is the value of variable
+    row for enum col+1, values[-1] the defaults.  A blank value means use the
+    first value of the row."""
+
+    countsChanged = QtCore.Signal(int, int) #enum count, variable count
+
+    def __init__(self, enums, variables, values=None, parent=None):
+        super(ConfigurationModel, self).__init__(parent)
+        self.setContents(enums, variables, values)
+
+    def setContents(self, enums, variables, values):
+        self.enums = list(enums)
+        self.variables = list(variables)
+        self.values = [[""] * len(self.variables) for col in range(len(self.enums))]
+        if values:
+            for row,rowValues in enumerate(values[:len(self.variables)]):
+                for col,val in enumerate(rowValues[:len(self.enums)]):
+                    self.values[col][row] = "" if math.isnan(val) else str(round(val, 6))
+
+    def setTable(self, table):
+        """replace everything with the configtable.ConfigurationTable table"""
+        self.beginResetModel()
+        self.setContents(table.enums, table.variables, table.rows())
+        self.endResetModel()
+        self.countsChanged.emit(self.enumCount, self.variableCount)
+
+    def getTable(self):
+        """the configtable.ConfigurationTable of what is in the editor"""
+        return configtable.ConfigurationTable.fromColumns(self.enums, self.variables, self.values)
+
+    @property
+    def enumCount(self):
+        return len(self.enums) - 1
+
+    @property
+    def variableCount(self):
+        return len(self.variables)
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.variables) + 1
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.enums) + 1
+
+    def isDefaultColumn(self, col):
+        return col == len(self.enums)
+
+    def getText(self, row, col):
+        if row == 0:
+            return "" if self.isDefaultColumn(col) else self.enums[col]
+        if col == 0:
+            return self.variables[row-1]
+        return self.values[col-1][row-1]
+
+    def setText(self, row, col, text):
+        """set the text of a cell without notifying the views, returns False if it is read only"""
+        if row == 0:
+            if self.isDefaultColumn(col):
+                return False
+            self.enums[col] = text
+        elif col == 0:
+            self.variables[row-1] = text
+        else:
+            self.values[col-1][row-1] = text
+        return True
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row,col = index.row(), index.column()
+        if role in (QtCore.Qt.DisplayRole, QtCore.Qt.EditRole):
+            return self.getText(row, col)
+        if role == QtCore.Qt.FontRole and (row == 0 or col == 0):
+            font = QtGui.QFont()
+            font.setBold(True)
+            return font
+        if role == QtCore.Qt.ToolTipRole:
+            if row == 0 and col == 0:
+                return "Enum shown until a configuration is selected"
+            if row == 0:
+                return "" if self.isDefaultColumn(col) else "Enum name"
+            if col == 0:
+                return "Variable name"
+            return f"{self.variables[row-1]} for {self.enums[0] if self.isDefaultColumn(col) else self.enums[col]}"
+        return None
+
+    def setData(self, index, value, role=QtCore.Qt.EditRole):
+        if not index.isValid() or role != QtCore.Qt.EditRole:
+            return False
+        if not self.setText(index.row(), index.column(), str(value).strip()):
+            return False
+        self.dataChanged.emit(index, index)
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return QtCore.Qt.NoItemFlags
+        if index.row() == 0 and self.isDefaultColumn(index.column()):
+            return QtCore.Qt.ItemIsEnabled
+        return QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable | QtCore.Qt.ItemIsEditable
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if role != QtCore.Qt.DisplayRole:
+            return None
+        if orientation == QtCore.Qt.Horizontal:
+            if section == 0:
+                return "Variable"
+            return "Default" if self.isDefaultColumn(section) else str(section)
+        return "Enum" if section == 0 else str(section)
+
+    def setCounts(self, enumCount, variableCount):
+        """grow or shrink the table, new enums and variables get generic names,
+        the data of removed ones is lost"""
+        oldEnums = self.enumCount
+        if enumCount < oldEnums:
+            self.beginRemoveColumns(QtCore.QModelIndex(), enumCount+1, oldEnums)
+            del self.enums[enumCount+1:]
+            del self.values[enumCount:oldEnums]
+            self.endRemoveColumns()
+        elif enumCount > oldEnums:
+            self.beginInsertColumns(QtCore.QModelIndex(), oldEnums+1, enumCount)
+            self.enums.extend(f"Enum{col}" for col in range(oldEnums+1, enumCount+1))
+            self.values[oldEnums:oldEnums] = [[""] * len(self.variables) for col in range(enumCount-oldEnums)]
+            self.endInsertColumns()
+        oldVariables = self.variableCount
+        if variableCount < oldVariables:
+            self.beginRemoveRows(QtCore.QModelIndex(), variableCount+1, oldVariables)
+            del self.variables[variableCount:]
+            for column in self.values:
+                del column[variableCount:]
+            self.endRemoveRows()
+        elif variableCount > oldVariables:
+            self.beginInsertRows(QtCore.QModelIndex(), oldVariables+1, variableCount)
+            self.variables.extend(f"Variable{row}" for row in range(oldVariables+1, variableCount+1))
+            for column in self.values:
+                column.extend([""] * (variableCount-oldVariables))
+            self.endInsertRows()
+        if (enumCount, variableCount) != (oldEnums, oldVariables):
+            self.countsChanged.emit(self.enumCount, self.variableCount)
+
+    def paste(self, text, row, col):
+        """paste tab separated text (as copied from a spreadsheet) with its top left
+        cell at row, col, growing the table to fit.  Returns the number of cells set."""
+        lines = text.splitlines()
+        while lines and not lines[-1]:
+            lines.pop()
+        cells = [line.split("\t") for line in lines]
+        if not cells:
+            return 0
+        width = max(len(line) for line in cells)
+        enumCount = self.enumCount
+        if not self.isDefaultColumn(col):
+            enumCount = min(max(enumCount, col + width - 1), MAX_COUNT)
+        variableCount = min(max(self.variableCount, row + len(cells) - 1), MAX_COUNT)
+        self.setCounts(enumCount, variableCount)
+        count = 0
+        lastCol = col
+        for r,line in enumerate(cells):
+            if row + r >= self.rowCount():
+                break
+            for c,text in enumerate(line):
+                if col + c >= self.columnCount() - (0 if self.isDefaultColumn(col) else 1):
+                    break
+                count += self.setText(row + r, col + c, text.strip())
+                lastCol = max(lastCol, col + c)
+        lastRow = min(row + len(cells), self.rowCount()) - 1
+        self.dataChanged.emit(self.index(row, col), self.index(lastRow, lastCol))
+        return count
+
+    def copy(self, indexes):
+        """the text of indexes as tab separated rows, for the clipboard"""
+        if not indexes:
+            return ""
+        rows = sorted(set(index.row() for index in indexes))
+        cols = sorted(set(index.column() for index in indexes))
+        selected = set((index.row(), index.column()) for index in indexes)
+        return "\n".join("\t".join(self.getText(row, col) if (row, col) in selected else "" for col in cols)
+                         for row in rows)
+
+    def clear(self, indexes):
+        """blank the values of indexes, names are left alone"""
+        cells = [(index.row(), index.column()) for index in indexes if index.row() > 0 and index.column() > 0]
+        for row,col in cells:
+            self.values[col-1][row-1] = ""
+        if cells:
+            self.dataChanged.emit(self.index(min(r for r,c in cells), min(c for r,c in cells)),
+                                  self.index(max(r for r,c in cells), max(c for r,c in cells)))
+
+
+class ConfigurationView(QtGui.QTableView):
+    """table view with copy, paste, and delete of blocks of cells"""
+
+    def keyPressEvent(self, event):
+        model = self.model()
+        if event.matches(QtGui.QKeySequence.Paste):
+            index = self.currentIndex()
+            if index.isValid():
+                model.paste(QtGui.QApplication.clipboard().text(), index.row(), index.column())
+            return
+        if event.matches(QtGui.QKeySequence.Copy):
+            QtGui.QApplication.clipboard().setText(model.copy(self.selectedIndexes()))
+            return
+        if event.key() in (QtCore.Qt.Key_Delete, QtCore.Qt.Key_Backspace) and self.state() != self.EditingState:
+            model.clear(self.selectedIndexes())
+            return
+        super(ConfigurationView, self).keyPressEvent(event)
+
+
+class DynamicDataConfigurationDlg(QtGui.QDialog):
+    def __init__(self,dd):
+        super(DynamicDataConfigurationDlg, self).__init__(Gui.getMainWindow())
+        self.setAttribute(QtCore.Qt.WA_WindowPropagation, True)
+        self.setAttribute(QtCore.Qt.WA_DeleteOnClose, True)
+        self.setWindowTitle(f"DynamicData v{__version__} Configuration Editor")
+        self.setWindowIcon(QtGui.QIcon("Resources/icons/DynamicDataCreateConfiguration.svg"))
+        self.dd = dd
+        self.configuration = {}
+        self.getConfigurationFromObject()
+        self.model = ConfigurationModel(self.configuration["enums"], self.configuration["variables"],
+                                        self.configuration["values"], self)
+        lay = QtGui.QVBoxLayout(self)
+        self.setLayout(lay)
+        self.nameRow = QtGui.QHBoxLayout()
+        lay.addLayout(self.nameRow)
+        self.configurationNameLabel = QtGui.QLabel("Configuration name:")
+        self.nameRow.addWidget(self.configurationNameLabel)
+        self.configurationName = QtGui.QLineEdit()
+        self.configurationName.setToolTip(\
+"Configuration name will be the name given to \n\
+the Enumeration property created and to the Group \n\
+all the properties go into.")
+        self.configurationName.setText(self.configuration["name"])
+        self.configurationName.selectAll()
+        self.configurationName.textChanged.connect(self.updateName)
+        self.nameRow.addWidget(self.configurationName)
+        self.enumCountLabel = QtGui.QLabel("Enum count:")
+        self.enumCount = QtGui.QSpinBox()
+        self.enumCount.setMinimum(2)
+        self.enumCount.setMaximum(MAX_COUNT)
+        self.enumCount.setSingleStep(1)
+        self.enumCount.setValue(self.model.enumCount)
+        self.enumCount.valueChanged.connect(self.updateCounts)
+        self.enumCount.setToolTip( \
+"This is the number of configuration options you \n\
+will have, for example: small, medium, large would \n\
+be 3.")
+        self.nameRow.addWidget(self.enumCountLabel)
+        self.nameRow.addWidget(self.enumCount)
+        self.variableCountLabel = QtGui.QLabel("Variable count:")
+        self.nameRow.addWidget(self.variableCountLabel)
+        self.variableCount = QtGui.QSpinBox()
+        self.variableCount.setMinimum(2)
+        self.variableCount.setMaximum(MAX_COUNT)
+        self.variableCount.setSingleStep(1)
+        self.variableCount.setValue(self.model.variableCount)
+        self.variableCount.valueChanged.connect(self.updateCounts)
+        self.variableCount.setToolTip( \
+"This is the number of variables you will have \n\
+in the configuration.  For example, if you want \n\
+Height, Width, and Length, enter 3 here.")
+        self.nameRow.addWidget(self.variableCount)
+        self.switchModeCheckBox = QtGui.QCheckBox("Switch mode")
+        self.switchModeCheckBox.setChecked(self.configuration["mode"] == core.SWITCH_MODE)
+        #switch mode needs our proxy, or no proxy yet so one can be given
+        self.switchModeCheckBox.setEnabled(bool(core.getProxy(self.dd)) or \
+            ("Proxy" in self.dd.PropertiesList and self.dd.Proxy is None))
+        self.switchModeCheckBox.setToolTip( \
+"Checked: the variables are set directly when the \n\
+enumeration changes, faster with many variables. \n\
+Unchecked: each variable gets an expression indexing \n\
+its List property.  Switch mode needs a dd object.")
+        self.nameRow.addWidget(self.switchModeCheckBox)
+
+        self.table = ConfigurationView(self)
+        self.table.setModel(self.model)
+        self.table.setToolTip("Ctrl+V pastes cells copied from a spreadsheet at the current cell\n\
+Ctrl+C copies the selected cells, Delete clears them")
+        #fixed section sizes, resizing to contents would have to measure every cell
+        self.table.horizontalHeader().setDefaultSectionSize(90)
+        self.table.verticalHeader().setDefaultSectionSize(self.table.fontMetrics().height() + 8)
+        self.table.setColumnWidth(0, 140)
+        self.model.countsChanged.connect(self.onCountsChanged)
+        lay.addWidget(self.table)
+        self.buttonLayout = QtGui.QHBoxLayout()
+        lay.addLayout(self.buttonLayout)
+        self.buttons = QtGui.QDialogButtonBox(QtGui.QDialogButtonBox.Ok.__or__(QtGui.QDialogButtonBox.Cancel),\
+            QtCore.Qt.Horizontal, self)
+        self.buttons.accepted.connect(self.accept)
+        self.buttons.rejected.connect(self.reject)
+        self.helpCheckBox = QtGui.QCheckBox("Show help")
+        self.helpCheckBox.setChecked(False)
+        self.helpCheckBox.clicked.connect(self.showHelp)
+        self.buttonLayout.addWidget(self.helpCheckBox)
+        self.importButton = QtGui.QPushButton("Import CSV...")
+        self.importButton.setToolTip("Replace the table with one read from a CSV file laid out as the table here")
+        self.importButton.clicked.connect(self.importCsv)
+        self.buttonLayout.addWidget(self.importButton)
+        self.exportButton = QtGui.QPushButton("Export CSV...")
+        self.exportButton.setToolTip("Save the table to a CSV file")
+        self.exportButton.clicked.connect(self.exportCsv)
+        self.buttonLayout.addWidget(self.exportButton)
+        self.buttonLayout.addWidget(self.buttons)
+        self.helpLabel = QtGui.QLabel("Help goes here.")
+        self.setupHelpText()
+        self.scroll_area = QtGui.QScrollArea()
+        lay.addWidget(self.scroll_area)
+        self.scroll_area.setWidget(self.helpLabel)
+        self.scroll_area.setVisible(False)
+        self.resize(max(self.width(), 800), max(self.height(), 400))
+
+    def setupHelpText(self):
+        txt = """\
+A configuration is a set of properties that work together to allow you to set multiple
+properties by selecting the configuration you want in an enumeration property.  The
+enumeration property is at the heart of the configuration.  The Configuration name: field
+will be the name of this enumeration property.  It will also be the name of the group that
+the variable properties go into and the name of another group + the word "Lists" that the
+list properties will go into.
+
+For example, if the name of the configuration is "Configuration" then you will have a group
+named "Configuration" and inside that group an Enumeration property also named "Configuration".
+Plus, you will have another group named "Configuration Lists" and inside that group will be a
+number of FloatList properties, one for each variable you have.  If you have these 3 variables:
+"Height", "Width", and "Length", then in the Configuration group you will have 3 Float properties
+of the same name and in the Configration List group there will be "Height List", "Width List",
+and "Length List", all FloatList types.
+
+We have 3 different property types: 1) the enumeration property that serves as the configuration
+selector; 2) the variable properties (whose names are in the left column, e.g. Height, or Radius);
+and 3) the list properties that hold the values the variable properties index into based on which
+configuration has been selected.  All variable properties are of type Float and all list properties
+are of type FloatList.  (You can replace them with Integer or String property types if you like
+after building the configuration by deleting them and adding new properties with the same name,
+but if you use the configuration editor to edit the configuration later they will be replaced
+again with Float and FloatList types.)
+
+Enum count is how many enums we have in this configuration.  The default is 5, which are "Extra
+Small", "Small", "Medium", "Large", and "Extra Large".  "Select size" is not really an enum, but
+it will go into the enumeration as a default message to the user.  Edit this so it makes sense
+for the enums you are using.  Edit all of these enums by changing their text in the first row of
+the table.  You can remove some by reducing the Enum count.  You must have at least 2 enums
+in the configuration.  Note: when you reduct Enum count or Variable count you lose those rows or
+columns, including any data contained in the cells, even if you increase the count afterwards.
+When you increase the count you get another row or column with generic names like Variable5 or
+Enum7.
+
+Enter the values in the cells that you want for each enum and variable.  In the example default
+configuration you have Height, for example.  If you want the Height for the Extra Small enum to
+be 2, enter 2 in the cell that aligns with Height and Extra Small.  Any cells left blank will be
+filled with the value from the first cell in that row, or 0.0 if it is also blank.  The Default
+column holds the values used when "Select size" is selected.
+
+You can paste a block of cells copied from a spreadsheet (Ctrl+V), it goes in at the current cell
+and the table grows to fit it.  Ctrl+C copies the selected cells and Delete clears them.
+
+Note: when the "Select size" enum is selected in the enumeration property all of the variable
+values will be the value from the first enum, so that it won't break your model until you can
+select one of the enums.  Select size is actually an additional extra set of values added to the
+ends of the List properties, these are in the Default column.
+
+With Switch mode checked the variables have no expressions and there are no List properties, the
+values are kept in a hidden Table property and written to all the variables at once when the
+enumeration changes.  This is faster when there are many variables, but only a dd object can
+do it.  Unchecked, each variable gets an expression indexing its List property.
+
+You may apply a configuration to an existing object, such as a Part::Cylinder, and if your variable
+names are the same as existing properties, those properties will be incorporated into the configuration.
+
+You may have multiple configurations in the same object, but if you do so you should ensure none of
+the variable are the same or else there will be a conflict and the new properties will overwrite the
+existing ones.  It is recommended to only have 1 configuration per object.
+
+Variable count is how many variables to have in the configuration.  By default we have 3.  These are:
+"Height", "Length", and "Radius".  This are likely not to be the names you will want for your
+configuration.  They are just there as placeholders to serve as examples in the default configuration.
+You can add more or remove some by changing the Variable count value.
+
+If you click Cancel your changes will be discarded.  If you click OK your configuration will be added
+to the selected object.  ANY EXISTING PROPERTIES of the same names WILL BE REPLACED.  But have no fear,
+you can use Undo to revert all your changes to the selected object.
+
+"""
+        self.helpLabel.setText(txt)
+
+    def showHelp(self):
+        self.scroll_area.setVisible(self.helpCheckBox.isChecked())
+
+    def updateName(self, text):
+        self.configuration["name"] = text
+
+    def updateCounts(self):
+        """called when the enum count or variable count spin box changes"""
+        self.model.setCounts(self.enumCount.value(), self.variableCount.value())
+
+    def onCountsChanged(self, enumCount, variableCount):
+        """the model grew from a paste, keep the spin boxes in step"""
+        for spinBox,value in ((self.enumCount, enumCount), (self.variableCount, variableCount)):
+            spinBox.blockSignals(True)
+            spinBox.setValue(value)
+            spinBox.blockSignals(False)
+
+    def setConfiguration(self, table):
+        """setup the configuration"""
+        mode = core.SWITCH_MODE if self.switchModeCheckBox.isChecked() else core.EXPRESSION_MODE
+        counts = core.applyConfigurationTable(self.dd, self.configuration["name"], table, mode=mode)
+        FreeCAD.Console.PrintMessage(f"DynamicData: configuration {self.configuration['name']}: {counts['added']} added, \
+{counts['changed']} changed, {counts['removed']} removed\n")
+
+    def importCsv(self):
+        fileName, filt = QtGui.QFileDialog.getOpenFileName(self, "Import configuration", "", "CSV files (*.csv)")
+        if not fileName:
+            return
+        try:
+            with open(fileName, "r", newline="", encoding="utf-8-sig") as f:
+                table = configtable.ConfigurationTable.readCsv(f)
+        except (OSError, ValueError, csv.Error) as e:
+            QtGui.QMessageBox.warning(self, "Import configuration", f"Unable to read {fileName}:\n{e}")
+            return
+        if len(table.enums) < 3 or len(table.variables) < 2:
+            QtGui.QMessageBox.warning(self, "Import configuration", "The file needs at least 2 enums and 2 variables.")
+            return
+        self.model.setTable(table)
+        for r,c,text in table.errors:
+            FreeCAD.Console.PrintWarning(f"Couldn't convert to float: {text} row,col = {r},{c}\n")
+
+    def exportCsv(self):
+        fileName, filt = QtGui.QFileDialog.getSaveFileName(self, "Export configuration", \
+                                                           f"{self.configuration['name']}.csv", "CSV files (*.csv)")
+        if not fileName:
+            return
+        try:
+            with open(fileName, "w", newline="", encoding="utf-8") as f:
+                self.model.getTable().writeCsv(f)
+        except OSError as e:
+            QtGui.QMessageBox.warning(self, "Export configuration", f"Unable to write {fileName}:\n{e}")
+
+    def getConfigurationFromObject(self):
+        """return True if we imported one from an object, else False if this is a new configuration"""
+        props = core.getEnumerationProperties(self.dd)
+
+        if len(props) >= 1:
+            default_item = 0
+            props = ["New configuration"] + props
+            prop, ok = QtGui.QInputDialog.getItem(self, "Select configuration", \
+                                                  "Choose an enumeration to edit or create a new one\n (Cancel for a new default configuration)",\
+                                                   props, default_item, editable=False)
+            if not ok or prop == props[0]:
+                self.makeDefaultConfiguration()
+                return False
+            else:
+                self.importConfiguration(prop)
+                return True
+
+        else: #no existing enumerations
+            self.makeDefaultConfiguration()
+            return False
+
+    def importConfiguration(self,prop):
+        """imports the configuration from the object where prop is the name of the enumeration"""
+        enums, variables, values = core.getConfiguration(self.dd, prop)
+        self.configuration["name"] = prop
+        self.configuration["enums"] = enums
+        self.configuration["variables"] = variables
+        self.configuration["values"] = values
+        self.configuration["mode"] = core.getConfigurationMode(self.dd, prop)
+
+    def makeDefaultConfiguration(self):
+        self.configuration["name"] = "Configuration"
+        self.configuration["enums"] = ["Select size","Extra Small","Small","Medium",\
+                                    "Large","Extra Large"]
+        self.configuration["variables"] = ["Length", "Height", "Radius"]
+        self.configuration["values"] = None
+        self.configuration["mode"] = core.EXPRESSION_MODE
+
+    def accept(self):
+        table = self.model.getTable()
+        problems = table.validate()
+        if problems:
+            QtGui.QMessageBox.warning(self, "Configuration", "\n".join(problems[:20]))
+            return
+        doc = self.dd.Document
+        core.openTransaction(doc, "Create/Edit Configuration")
+        try:
+            self.setConfiguration(table)
+        except Exception as e: #ValueError from the table or FreeCAD errors part way
+            core.abortTransaction(doc)
+            QtGui.QMessageBox.warning(self, "Configuration", str(e))
+            return
+        core.commitTransaction(doc)
+        super().accept()
+
+    def reject(self):
+        super().reject()
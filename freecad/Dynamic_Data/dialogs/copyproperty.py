@@ -0,0 +1,717 @@
+# SPDX-License-Identifier: LGPL-2.1-or-later
+# SPDX-FileNotice: Part of the Dynamic Data addon.
+
+################################################################################
+#                                                                              #
+#   Copyright (c) 2018 Mark Ganson ( TheMarkster )                             #
+#                                                                              #
+#   This library is free software; you can redistribute it and/or modify it    #
+#   under the terms of the GNU Lesser General Public License as published      #
+#   by the Free Software Foundation; either version 2.1 of the License, or     #
+#   (at your option) any later version.                                        #
+#                                                                              #
+#   This library is distributed in the hope that it will be useful,            #
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of             #
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.                       #
+#                                                                              #
+#   See the GNU Lesser General Public License for more details.                #
+#                                                                              #
+#   You should have received a copy of the GNU Lesser General Public License   #
+#   along with this library; if not, write to the Free Software Foundation,    # 
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA           #
+#                                                                              #
+################################################################################
+
+"""Copy / Set / Bind property dialog."""
+
+from PySide import QtCore, QtGui
+import FreeCAD, os
+import FreeCADGui as Gui
+from freecad.Dynamic_Data import core, expressions
+from freecad.Dynamic_Data.DynamicDataCmd import __version__, iconPath
+
+
+class CopyDlg(QtGui.QDialog):
+
+    pg = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/DynamicData")
+
+    def __init__(self, cmd, obj1, obj2):
+        super(CopyDlg, self).__init__(Gui.getMainWindow())
+        self.setAttribute(QtCore.Qt.WA_WindowPropagation, True)
+        self.setWindowTitle(f"DynamicData v{__version__} Copy / Set / Bind")
+        icon = QtGui.QIcon(os.path.join(iconPath, 'CopyProperty.svg'))
+        self.setWindowIcon(icon)
+        self.applied = False #apply button clicked
+        self.obj1 = obj1
+        self.obj2 = obj2 if obj2 else obj1
+        self.cmd = cmd
+        self.blockSignals(True)
+        self.layout = QtGui.QGridLayout()
+        for ii in range(1,10):
+            self.layout.setRowStretch(ii, 1)
+        self.layout.setRowStretch(0, 0)
+        self.setLayout(self.layout)
+        label = self.obj1.Label
+        name = self.obj1.Name
+        same = bool(label == name)
+        label = label if same else f"{label} ({name})"
+        self.obj1Label = QtGui.QLabel(label)
+        self.layout.addWidget(self.obj1Label, 0, 0, 1, 2)
+
+        label = self.obj2.Label if self.obj2 else self.obj1.Label
+        name = self.obj2.Name if self.obj2 else self.obj1.Name
+        same = bool(label == name)
+        label = label if same else f"{label} ({name})"
+        self.obj2Label = QtGui.QLabel(label)
+        self.layout.addWidget(self.obj2Label, 0, 3, 1, 2)
+
+        self.obj1List = QtGui.QListWidget()
+        self.obj1List.itemSelectionChanged.connect(self.updateStatus)
+        self.layout.addWidget(self.obj1List, 1, 0, 9, 2)
+        self.obj2List = QtGui.QListWidget()
+        self.obj2List.itemSelectionChanged.connect(self.updateStatus)
+        self.layout.addWidget(self.obj2List, 1, 3, 9, 2)
+        self.fillUpList(self.obj1, self.obj1List, 1)
+        self.fillUpList(self.obj2, self.obj2List, 2)
+
+        self.btnGroup = QtGui.QButtonGroup()
+        self.btnGroup.buttonClicked.connect(self.radioBtnClicked)
+        self.copyRightBtn = QtGui.QRadioButton("Copy ->")
+        self.copyRightBtn.setChecked(True)
+        self.btnGroup.addButton(self.copyRightBtn)
+        self.copyRightBtn.setToolTip(f"""
+Arrow points in direction of data flow.
+Creates copy of selected property in {self.obj1.Label} -> to new property of same type in {self.obj2.Label}""")
+        self.copyRightBtn.setObjectName("copyRightBtn")
+        self.layout.addWidget(self.copyRightBtn, 1, 2, 1, 1)
+        self.copyLeftBtn = QtGui.QRadioButton("<- Copy")
+        self.btnGroup.addButton(self.copyLeftBtn)
+        self.copyLeftBtn.setToolTip(f"""
+Arrow points in direction of data flow.
+Creates new property in {self.obj1.Label} <- from selected property of {self.obj2.Label}""")
+        self.copyLeftBtn.setObjectName("copyLeftBtn")
+        self.layout.addWidget(self.copyLeftBtn, 2, 2, 1, 1)
+
+        self.setRightBtn = QtGui.QRadioButton("Set ->")
+        self.btnGroup.addButton(self.setRightBtn)
+        self.setRightBtn.setToolTip(f"""
+Arrow points in direction of data flow.
+Sets selected existing property in {self.obj2.Label} to value of selected property in {self.obj1.Label}""")
+        self.setRightBtn.setObjectName("setRightBtn")
+        self.layout.addWidget(self.setRightBtn, 3, 2, 1, 1)
+        self.setLeftBtn = QtGui.QRadioButton("<- Set")
+        self.btnGroup.addButton(self.setLeftBtn)
+        self.setLeftBtn.setToolTip(f"Sets selected existing property in {self.obj1.Label} to value of selected property in {self.obj2.Label}")
+        self.setLeftBtn.setObjectName("setLeftBtn")
+        self.layout.addWidget(self.setLeftBtn, 4, 2, 1, 1)
+
+        self.bindRightBtn = QtGui.QRadioButton("Bind to ->")
+        self.btnGroup.addButton(self.bindRightBtn)
+        self.bindRightBtn.setToolTip(f"""
+Arrow points in direction of binding, left is bound to right.
+Bind selected property of {self.obj1.Label} to selected property of {self.obj2.Label} via Expressions""")
+        self.bindRightBtn.setObjectName("bindRightBtn")
+        self.layout.addWidget(self.bindRightBtn, 5, 2, 1, 1)
+        self.bindLeftBtn = QtGui.QRadioButton("<- Bind to")
+        self.btnGroup.addButton(self.bindLeftBtn)
+        self.bindLeftBtn.setToolTip(f"""
+Arrow points in direction of binding, right is bound to left.
+Bind selected property of {self.obj2.Label} to selected property of {self.obj1.Label} via Expressions""")
+        self.bindLeftBtn.setObjectName("bindLeftBtn")
+        self.layout.addWidget(self.bindLeftBtn, 6, 2, 1, 1)
+
+        self.breakBindRightBtn = QtGui.QRadioButton("Break binding ->")
+        self.btnGroup.addButton(self.breakBindRightBtn)
+        self.breakBindRightBtn.setToolTip(f"""
+Arrow points to object being affected.
+Break expression binding for selected property of {self.obj2.Label}""")
+        self.breakBindRightBtn.setObjectName("breakBindRightBtn")
+        self.layout.addWidget(self.breakBindRightBtn, 7, 2, 1, 1)
+        self.breakBindLeftBtn = QtGui.QRadioButton("<- Break binding")
+        self.btnGroup.addButton(self.breakBindLeftBtn)
+        self.breakBindLeftBtn.setToolTip(f"""
+Arrow points to object being affected.
+Break expression binding for selected property of {self.obj1.Label}""")
+        self.breakBindLeftBtn.setObjectName("breakBindLeftBtn")
+        self.layout.addWidget(self.breakBindLeftBtn, 8, 2, 1, 1)
+
+        self.statusLabel = QtGui.QLabel()
+        self.statusLabel.setToolTip("Messages go here: blue text = normal message, red text = critical error in proposed action.")
+        self.layout.addWidget(self.statusLabel, 11, 0, 2, 5)
+
+        self.buttons = QtGui.QDialogButtonBox(
+            QtGui.QDialogButtonBox.Ok.__or__(QtGui.QDialogButtonBox.Cancel),
+            QtCore.Qt.Horizontal, self)
+        self.okBtn = self.buttons.button(QtGui.QDialogButtonBox.Ok)
+        self.okBtn.setText(self.copyRightBtn.text())
+        self.okBtn.setToolTip("Apply action and close dialog")
+        self.applyBtn = QtGui.QPushButton("Apply")
+        self.buttons.addButton(self.applyBtn, QtGui.QDialogButtonBox.ApplyRole)
+        # --- Container for checkbox + button box ---
+        hbox = QtGui.QHBoxLayout()
+
+        # Checkbox on the left
+        self.byExpressionCheckBox = QtGui.QCheckBox("Copy expressions")
+        self.byExpressionCheckBox.setToolTip(
+            "If checked, properties that have expressions are set as expressions on the other side."
+        )
+        self.byExpressionCheckBox.stateChanged.connect(self.checkBoxClicked)
+        self.byExpressionCheckBox.setChecked(self.pg.GetBool("UseExpression", False))
+        self.byExpressionCheckBox.setObjectName("byExpressionCheckBox")
+        self.byExpressionCheckBox.setEnabled(False)  # initially disabled
+
+        hbox.addWidget(self.byExpressionCheckBox)
+
+        # Spacer in between
+        hbox.addStretch(1)
+
+        # Button box (Ok / Cancel / Apply) on the right
+        hbox.addWidget(self.buttons)
+
+        # Put the whole row into the grid
+        self.layout.addLayout(hbox, 14, 0, 1, 5)
+
+        self.buttons.accepted.connect(self.accept)
+        self.buttons.rejected.connect(self.reject)
+        self.applyBtn.clicked.connect(self.apply)
+        self.blockSignals(False)
+        self.updateStatus()
+
+    @property
+    def Obj1Item(self):
+        """currently selected item, might be None"""
+        return self.obj1List.currentItem()
+
+    @property
+    def Obj2Item(self):
+        """currently selected item, might be None"""
+        return self.obj2List.currentItem()
+
+    @property
+    def Obj1IsView(self):
+        """boolean, true if obj1 selected property is a view property"""
+        item = self.Obj1Item
+        if not item:
+            return False
+        txt = item.text()
+        return txt.startswith("(view) ")
+
+    @property
+    def Obj2IsView(self):
+        """boolean, true if obj2 selected property is a view property"""
+        item = self.Obj2Item
+        if not item:
+            return False
+        txt = item.text()
+        return txt.startswith("(view) ")
+
+    @property
+    def Obj1PropName(self):
+        """property name selected in left list"""
+        item = self.Obj1Item
+        if not item:
+            return None
+        txt = item.text()
+        if txt.startswith("(view) "):
+            return txt[7:]
+        else:
+            return txt
+
+    @property
+    def Obj2PropName(self):
+        """property name selected in right list"""
+        item = self.Obj2Item
+        if not item:
+            return None
+        txt = item.text()
+        if txt.startswith("(view) "):
+            return txt[7:]
+        else:
+            return txt
+
+    @property
+    def Obj1Group(self):
+        """group of the currently selected property"""
+        item = self.Obj1Item
+        if not item:
+            return None
+        if self.Obj1IsView:
+            obj = self.obj1.ViewObject
+        else:
+            obj = self.obj1
+        grp = obj.getGroupOfProperty(self.Obj1PropName)
+        return grp if grp else "Base"
+
+    @property
+    def Obj2Group(self):
+        """group of the currently selected property"""
+        item = self.Obj2Item
+        if not item:
+            return None
+        if self.Obj2IsView:
+            obj = self.obj2.ViewObject
+        else:
+            obj = self.obj2
+        grp = obj.getGroupOfProperty(self.Obj2PropName)
+        return grp if grp else "Base"
+
+    @property
+    def Obj1Value(self):
+        """value of selected property"""
+        item = self.Obj1Item
+        if not item:
+            return None
+        if not self.Obj1IsView:
+            return getattr(self.obj1, self.Obj1PropName)
+        else:
+            try:
+                return getattr(self.obj1.ViewObject, self.Obj1PropName)
+            except:
+                return "No python counterpart"
+
+    @property
+    def Obj2Value(self):
+        """value of selected property"""
+        item = self.Obj2Item
+        if not item:
+            return None
+        if not self.Obj2IsView:
+            return getattr(self.obj2, self.Obj2PropName)
+        else:
+            try:
+                return getattr(self.obj2.ViewObject, self.Obj2PropName)
+            except:
+                return "No python counterpart"
+
+    @property
+    def Obj1Type(self):
+        """type id of selected property, with 'App::Property' prefix"""
+        item = self.Obj1Item
+        if not item:
+            return None
+        if not self.Obj1IsView:
+            return self.obj1.getTypeIdOfProperty(self.Obj1PropName)
+        else:
+            return self.obj1.ViewObject.getTypeIdOfProperty(self.Obj1PropName)
+
+    @property
+    def Obj2Type(self):
+        """type id of selected property, with 'App::Property' prefix"""
+        item = self.Obj2Item
+        if not item:
+            return None
+        if not self.Obj2IsView:
+            return self.obj2.getTypeIdOfProperty(self.Obj2PropName)
+        else:
+            return self.obj2.ViewObject.getTypeIdOfProperty(self.Obj2PropName)
+
+    @property
+    def Obj1Expression(self):
+        """expression engine value for this property, if any"""
+        item = self.Obj1Item
+        if not item:
+            return None
+        if self.Obj1IsView:
+            return None
+        expr = self.obj1.ExpressionEngine
+        exp_dict = {xp[0]:xp[1] for xp in expr}
+        if self.Obj1PropName in exp_dict:
+            return exp_dict[self.Obj1PropName]
+        else:
+            return None
+
+    @property
+    def Obj2Expression(self):
+        """expression engine value for this property, if any"""
+        item = self.Obj2Item
+        if not item:
+            return None
+        if self.Obj2IsView:
+            return None
+        expr = self.obj2.ExpressionEngine
+        exp_dict = {xp[0]:xp[1] for xp in expr}
+        if self.Obj2PropName in exp_dict:
+            return exp_dict[self.Obj2PropName]
+        else:
+            return None
+
+    @property
+    def Obj1Tip(self):
+        """documentation of property, tooltip shown"""
+        item = self.Obj1Item
+        if not item:
+            return None
+        if not self.Obj1IsView:
+            return self.obj1.getDocumentationOfProperty(self.Obj1PropName)
+        else:
+            return self.obj1.ViewObject.getDocumentationOfProperty(self.Obj1PropName)
+
+    @property
+    def Obj2Tip(self):
+        """documentation of property, tooltip shown"""
+        item = self.Obj2Item
+        if not item:
+            return None
+        if not self.Obj2IsView:
+            return self.obj2.getDocumentationOfProperty(self.Obj2PropName)
+        else:
+            return self.obj2.ViewObject.getDocumentationOfProperty(self.Obj2PropName)
+
+    def radioBtnClicked(self, btn):
+        self.updateOkButtonText()
+        self.updateStatus()
+
+    def checkBoxClicked(self, state):
+        """called when checkbox is clicked, updates ok button text"""
+        self.updateOkButtonText()
+        self.updateStatus()
+
+    def updateOkButtonText(self):
+        btn = self.btnGroup.checkedButton()
+        text = btn.text()
+        if self.hasExpr() and self.byExpressionCheckBox.isChecked():
+            text += " (Expr)"
+        self.okBtn.setText(text)
+
+    def updateStatus(self):
+        """updates the status label to give a preview of the action to be performed"""
+        if not hasattr(self, "btnGroup"):
+            return #not fully initialized yet
+        vobj1 = "" if not self.Obj1IsView else ".ViewObject"
+        vobj2 = "" if not self.Obj2IsView else ".ViewObject"
+
+        cyclicMatch1 = bool(self.obj2 in self.obj1.InListRecursive) #if true, obj2 depends on obj1, so obj1 cannot bind to obj2
+        cyclicMatch2 = bool(self.obj1 in self.obj2.InListRecursive)
+        cyclicMsg1 = f"\nCircular dependency because {self.obj2.Label} already depends on {self.obj1.Label}." if cyclicMatch1 else ""
+        cyclicMsg2 = f"\nCircular dependency because {self.obj1.Label} already depends on {self.obj2.Label}." if cyclicMatch2 else ""
+
+        typeMismatch = bool(self.Obj1Type != self.Obj2Type)
+        typeMsg = f"\nType mismatch detected: {self.Obj1Type} and {self.Obj2Type}" if typeMismatch else ""
+        typeClr = ["blue","red"][int(typeMismatch)]
+        typeClr1 = ["blue","red"][int(typeMismatch or cyclicMatch1)]
+        typeClr2 = ["blue","red"][int(typeMismatch or cyclicMatch2)]
+
+        cyclicMatch1 = bool(self.obj2 in self.obj1.InListRecursive) #if true, obj2 depends on obj1, so obj1 cannot bind to obj2
+        cyclicMatch2 = bool(self.obj1 in self.obj2.InListRecursive)
+        cyclicMsg1 = f"\nCircular dependency because {self.obj2.Label} already depends on {self.obj1.Label}." if cyclicMatch1 else ""
+        cyclicMsg2 = f"\nCircular dependency because {self.obj1.Label} already depends on {self.obj2.Label}." if cyclicMatch2 else ""
+        cyclicClr1 = ["blue","red"][int(cyclicMatch1 or typeMismatch)]
+        cyclicClr2 = ["blue","red"][int(cyclicMatch2 or typeMismatch)]
+        radioBtn = self.btnGroup.checkedButton()
+        msg = ""
+        value_or_expression = "value"
+        if radioBtn.objectName() in ["setLeftBtn", "setRightBtn", "copyLeftBtn", "copyRightBtn"]:
+            if self.hasExpr():
+                self.byExpressionCheckBox.setEnabled(True)
+                if self.byExpressionCheckBox.isChecked():
+                    value_or_expression = "expression"
+            else:
+                self.byExpressionCheckBox.setEnabled(False)
+        elif radioBtn.objectName() in ["bindLeftBtn", "bindRightBtn", "breakBindLeftBtn", "breakBindRightBtn"]:
+            self.byExpressionCheckBox.setEnabled(False)
+        copyLeftMsg = (f"Copy {self.obj2.Label}{vobj2}.{self.Obj2PropName} {value_or_expression} to a new property in {self.obj1.Label}","blue")
+        copyRightMsg = (f"Copy {self.obj1.Label}{vobj1}.{self.Obj1PropName} {value_or_expression} to a new property in {self.obj2.Label}","blue")
+        setLeftMsg = (f"Set {self.obj1.Label}{vobj1}.{self.Obj1PropName} to {value_or_expression} of {self.obj2.Label}{vobj2}.{self.Obj2PropName}{typeMsg}",typeClr)
+        setRightMsg = (f"Set {self.obj2.Label}{vobj2}.{self.Obj2PropName} to {value_or_expression} of {self.obj1.Label}{vobj1}.{self.Obj1PropName}{typeMsg}",typeClr)
+        if not vobj2:
+            bindLeftMsg = (f"Bind {self.obj2.Label}.{self.Obj2PropName} to {self.obj1.Label}.{self.Obj1PropName}{typeMsg}{cyclicMsg2}",typeClr2)
+        else:
+            bindLeftMsg = (f"Cannot bind {self.obj2.Label}{vobj2}.{self.Obj2PropName} because it is a view object property.{typeMsg}","red")
+        if not vobj1:
+            bindRightMsg = (f"Bind {self.obj1.Label}.{self.Obj1PropName} to {self.obj2.Label}.{self.Obj2PropName}{typeMsg}{cyclicMsg1}",typeClr1)
+        else:
+            bindRightMsg = (f"Cannot bind {self.obj1.Label}{vobj1}.{self.Obj1PropName} because it is a view object property.","red")
+        if self.Obj1Expression:
+            breakBindLeftMsg = (f"Break binding of {self.obj1.Label}.{self.Obj1PropName}.","blue")
+        else:
+            breakBindLeftMsg = (f"No expression binding to break for {self.obj1.Label}.{self.Obj1PropName}.","red")
+        if self.Obj1IsView:
+            breakBindLeftMsg = (breakBindLeftMsg[0] + "\nView objects cannot be bound or unbound via expressions", "red")
+        if self.Obj2Expression:
+            breakBindRightMsg = (f"Break binding of {self.obj2.Label}.{self.Obj2PropName}.","blue")
+        else:
+            breakBindRightMsg = (f"No expression binding to break for {self.obj2.Label}.{self.Obj2PropName}.","red")
+        if self.Obj2IsView:
+            breakBindRightMsg = (breakBindRightMsg[0] + "\nView objects cannot be bound or unbound via expressions", "red")
+
+        msg_map = {
+            "copyLeftBtn" : copyLeftMsg,
+            "copyRightBtn" : copyRightMsg,
+            "setLeftBtn" : setLeftMsg,
+            "setRightBtn" : setRightMsg,
+            "bindLeftBtn" : bindLeftMsg,
+            "bindRightBtn" : bindRightMsg,
+            "breakBindLeftBtn" : breakBindLeftMsg,
+            "breakBindRightBtn" : breakBindRightMsg,
+        }
+
+        dq = "\"" #double quote
+        self.updateOkButtonText()
+        self.okBtn.setToolTip(f"Apply {dq}{radioBtn.text()}{dq} action and close dialog")
+        self.applyBtn.setToolTip(f"Apply {dq}{radioBtn.text()}{dq} action and reopen dialog")
+        msgTuple = msg_map[radioBtn.objectName()]
+        self.statusLabel.setStyleSheet(f"color:{msgTuple[1]};")
+        self.statusLabel.setText(f"{msgTuple[0]}{msg}")
+
+    def hasExpr(self):
+        btn = self.btnGroup.checkedButton()
+        return btn and btn.objectName() in ["setLeftBtn", "copyLeftBtn"] and not self.Obj1IsView and self.Obj2Expression or \
+                btn.objectName() in ["setRightBtn", "copyRightBtn"] and not self.Obj2IsView and self.Obj1Expression
+
+    def validateExpr(self, srcObj, dstObj, expr):
+        previous = expr
+        failed = False
+        try:
+            #references local to srcObj must name it once the expression moves to dstObj
+            label = expressions.quoteLabel(srcObj.Label)
+            expr = expressions.qualify(expr, frozenset(srcObj.PropertiesList), label)
+            dstObj.evalExpression(expr) #will raise if invalid
+        except Exception as e:
+            FreeCAD.Console.PrintWarning(f"DynamicData: expression validation failed: {expr}\n{e}\n")
+            failed = True
+            expr = previous
+        # qt dialog to edit expression if user wants
+        if previous != expr or failed:
+            new_expr, ok = QtGui.QInputDialog.getText(self, "Edit Ambiguous Local Expression",
+                                            f"Edit expression with label added for {dstObj.Label}.{self.Obj1PropName if dstObj==self.obj1 else self.Obj2PropName}: ", text=expr)
+            if not new_expr or not ok:
+                FreeCAD.Console.PrintError("DynamicData: operation cancelled by user.\n")
+            expr = new_expr
+        # no need to validate again, let setExpression handle it if it's bad
+        return expr
+
+    def getNewPropertyName(self, obj, candidate):
+        """When creating a new property and already there is a property with that
+        same name, we can ask the user for a preferred new property name"""
+        new_candidate = self.cmd.getNewPropertyNameCandidate(obj, candidate)
+        new_name, ok = QtGui.QInputDialog.getText(self, "Attribute already exists",
+                                                "Enter name for new property: ", text=new_candidate)
+        if not new_name or not ok:
+            return None
+
+        return new_name
+
+    def copyLeft(self):
+        """copy the selected property from the list on the right to the object (self.obj1) on the left
+        returns None if user aborts, False if there was some error, True on success
+        """
+        propName = self.getNewPropertyName(self.obj1, self.Obj2PropName)
+        if not propName:
+           return None
+        expression = None
+        if self.hasExpr() and self.byExpressionCheckBox.isChecked():
+            expression = self.validateExpr(self.obj2, self.obj1, self.Obj2Expression)
+        return core.copyProperty(self.obj2, self.Obj2PropName, self.obj1, propName, self.Obj2IsView, expression)
+
+    def copyRight(self):
+        """copy the selected property from the list on the left to the object (self.obj2) on the right
+        returns None if user aborts, False if there was some error, True on success
+        """
+        propName = self.getNewPropertyName(self.obj2, self.Obj1PropName)
+        if not propName:
+           return None
+
+        expression = None
+        if self.hasExpr() and self.byExpressionCheckBox.isChecked():
+            expression = self.validateExpr(self.obj1, self.obj2, self.Obj1Expression)
+        return core.copyProperty(self.obj1, self.Obj1PropName, self.obj2, propName, self.Obj1IsView, expression)
+
+    def setLeft(self):
+        """sets an existing property of self.obj1 to the same value of selected property in right side list"""
+        #first check that the property types are a match
+        if self.Obj1Type != self.Obj2Type:
+            FreeCAD.Console.PrintError(f"""
+DynamicData: Type mismatch: {self.obj2.Label}.{self.Obj2PropName} is type {self.Obj2Type}
+while {self.obj1.Label}.{self.Obj1PropName} is type {self.Obj1Type}""")
+            return False
+        #now check to see if the property is bound by an expression already
+        if self.Obj1Expression:
+            FreeCAD.Console.PrintWarning(f"""
+DynamicData warning: {self.obj1.Label}.{self.Obj1PropName} was bound by an expression:\n{self.Obj1Expression}\nbut it has now been cleared.""")
+            self.obj1.setExpression(self.Obj1PropName, None)
+        if self.hasExpr() and self.byExpressionCheckBox.isChecked():
+            try:
+                self.obj1.setExpression(self.Obj1PropName, self.validateExpr(self.obj2, self.obj1, self.Obj2Expression))
+                return True
+            except Exception as e:
+                FreeCAD.Console.PrintError(f"DynamicData: error {e} setting {self.obj1.Label}.{self.Obj1PropName} to {self.Obj2Expression}\n")
+                return False
+        else:
+            try:
+                if not self.Obj2IsView:
+                    setattr(self.obj1, self.Obj1PropName, self.Obj2Value)
+                else:
+                    setattr(self.obj1.ViewObject, self.Obj1PropName, self.Obj2Value)
+                return True
+            except Exception as e:
+                FreeCAD.Console.PrintError(f"DynamicData: error {e} setting {self.obj1.Label}.{self.Obj1PropName} to {self.Obj2Value}\n")
+                return False
+
+    def setRight(self):
+        """sets an existing property of self.obj2 to the same value of selected property in left side list"""
+        #first check that the property types are a match
+        if self.Obj1Type != self.Obj2Type:
+            FreeCAD.Console.PrintError(f"""
+DynamicData: Type mismatch: {self.obj2.Label}.{self.Obj2PropName} is type {self.Obj2Type}
+while {self.obj1.Label}.{self.Obj1PropName} is type {self.Obj1Type}""")
+            return False
+        #now check to see if the property is bound by an expression already
+        if self.Obj2Expression:
+            FreeCAD.Console.PrintWarning(f"""
+DynamicData warning: {self.obj2.Label}.{self.Obj2PropName} was bound by an expression:\n{self.Obj2Expression}\nbut it has now been cleared.""")
+            self.obj2.setExpression(self.Obj2PropName, None)
+        if not self.Obj1IsView and self.hasExpr() and self.byExpressionCheckBox.isChecked():
+            try:
+                self.obj2.setExpression(self.Obj2PropName, self.validateExpr(self.obj1, self.obj2, self.Obj1Expression))
+                return True
+            except Exception as e:
+                FreeCAD.Console.PrintError(f"DynamicData: error {e} setting {self.obj2.Label}.{self.Obj2PropName} to {self.Obj1Expression}\n")
+                return False
+        else:
+            try:
+                if not self.Obj1IsView:
+                    setattr(self.obj2, self.Obj2PropName, self.Obj1Value)
+                else:
+                    setattr(self.obj2.ViewObject, self.Obj2PropName, self.Obj1Value)
+                return True
+            except Exception as e:
+                FreeCAD.Console.PrintError(f"DynamicData: error {e} setting {self.obj2.Label}.{self.Obj2PropName} to {self.Obj1Value}\n")
+                return False
+
+    def bindRight(self):
+        """bind to the property on the right"""
+        #check for a type mismatch
+        if self.Obj1Type != self.Obj2Type:
+            FreeCAD.Console.PrintError(f"""
+DynamicData error: Type mismatch.  {self.obj1.Label}.{self.Obj1PropName} is type {self.Obj1Type} where
+{self.obj2.Label}.{self.Obj2PropName} is type {self.Obj2Type}""")
+            return False
+        # check for cyclic dependency
+        # objects in obj.InList and obj.InListRecursive are dependent on obj
+        # since this command binds a property of obj1 to obj2 we must check
+        # to see if obj2 is in obj1's inlist
+        if self.obj2 in self.obj1.InListRecursive:
+            FreeCAD.Console.PrintError(f"""
+DynamicData error: Cannot bind  {self.obj1.Label}.{self.Obj1PropName} to {self.obj2.Label}.{self.Obj2PropName}
+because this would create a cyclic dependency.""")
+            return False
+        if self.Obj1IsView:
+            FreeCAD.Console.PrintError(f"""
+DynamicData error: {self.obj1.Label}.ViewObject.{self.Obj1PropName} is a view object expression,
+which cannot be bound by expression.\n""")
+            return False
+        FreeCAD.Console.PrintMessage(f"""
+DynamicData: binding {self.obj1.Label}.{self.Obj1PropName} to {self.obj2.Label}.{self.Obj2PropName}""")
+        return core.bindProperty(self.obj1, self.Obj1PropName, self.obj2, self.Obj2PropName)
+
+    def bindLeft(self):
+        """bind to the property selected on the left"""
+        #check for a type mismatch
+        if self.Obj2Type != self.Obj1Type:
+            FreeCAD.Console.PrintError(f"""
+DynamicData error: Type mismatch.  {self.obj2.Label}.{self.Obj2PropName} is type {self.Obj2Type} where
+{self.obj1.Label}.{self.Obj1PropName} is type {self.Obj1Type}""")
+            return False
+        # check for cyclic dependency
+        # objects in obj.InList and obj.InListRecursive are dependent on obj
+        # since this command binds a property of obj2 to obj1 we must check
+        # to see if obj1 is in obj2's inlist
+        if self.obj1 in self.obj2.InListRecursive:
+            FreeCAD.Console.PrintError(f"""
+DynamicData error: Cannot bind  {self.obj2.Label}.{self.Obj2PropName} to {self.obj1.Label}.{self.Obj1PropName}
+because this would create a cyclic dependency.""")
+            return False
+        if self.Obj2IsView:
+            FreeCAD.Console.PrintError(f"""
+DynamicData error: {self.obj2.Label}.ViewObject.{self.Obj2PropName} is a view object expression,
+which cannot be bound by expression.\n""")
+            return False
+        FreeCAD.Console.PrintMessage(f"""
+DynamicData: binding {self.obj2.Label}.{self.Obj2PropName} to {self.obj1.Label}.{self.Obj1PropName}""")
+        return core.bindProperty(self.obj2, self.Obj2PropName, self.obj1, self.Obj1PropName)
+
+    def breakBindLeft(self):
+        """Clears the expression binding the property on the left that is bound to the property on the right"""
+        # check if the property on the left is already bound or not
+        # if it's not bound by an expression, then the user might have selected the wrong
+        # radio button by mistake, so alert to the error and return
+        if not self.Obj1Expression:
+            FreeCAD.Console.PrintError(f"""
+DynamicData error: {self.obj1.Label}.{self.Obj1PropName} is not bound by an expression.\n""")
+            return False
+        if self.Obj2IsView:
+            FreeCAD.Console.PrintError(f"""
+DynamicData error: {self.obj2.Label}.ViewObject.{self.Obj2PropName} is a view object expression,
+which cannot be bound by expression.\n""")
+            return False
+        return core.unbindProperty(self.obj1, self.Obj1PropName)
+
+    def breakBindRight(self):
+        """Clears the expression binding the property on the right that is bound to the property on the left"""
+        # check if the property on the right is already bound or not
+        # if it's not bound by an expression, then the user might have selected the wrong
+        # radio button by mistake, so alert to the error and return
+        if not self.Obj2Expression:
+            FreeCAD.Console.PrintError(f"""
+DynamicData error: {self.obj2.Label}.{self.Obj2PropName} is not bound by an expression.\n""")
+            return False
+        #check if this is a view object property, which cannot be bound by expression
+        if self.Obj2IsView:
+            FreeCAD.Console.PrintError(f"""
+DynamicData error: {self.obj2.Label}.ViewObject.{self.Obj2PropName} is a view object expression,
+which cannot be bound by expression.\n""")
+            return False
+        return core.unbindProperty(self.obj2, self.Obj2PropName)
+
+
+    def fillUpList(self, obj, objList, idx):
+        pg = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/DynamicData")
+        supportViewObjectProperties = pg.GetBool('SupportViewObjectProperties', False)
+        blacklist = ["ExpressionEngine","Proxy","Shape","DynamicData"]
+        props = self.cmd.getAllProperties(obj, supportViewObjectProperties, blacklist)
+        for prop in props:
+            item = QtGui.QListWidgetItem(prop)
+            objList.addItem(item)
+            objList.setCurrentItem(item)
+            if idx == 1:
+                tip = f"[{self.Obj1Type}]\nGroup: {self.Obj1Group}\nTooltip: {self.Obj1Tip}\nvalue: {self.Obj1Value}\nExpr: {self.Obj1Expression}"
+            elif idx == 2:
+                tip = f"[{self.Obj2Type}]\nGroup: {self.Obj2Group}\nTooltip: {self.Obj2Tip}\nvalue: {self.Obj2Value}\nExpr: {self.Obj2Expression}"
+            item.setToolTip(tip)
+        if props:
+            objList.setCurrentRow(0)
+
+    def accept(self):
+        func_map = {
+            "copyLeftBtn" : self.copyLeft,
+            "copyRightBtn" : self.copyRight,
+            "setLeftBtn" : self.setLeft,
+            "setRightBtn" : self.setRight,
+            "bindLeftBtn" : self.bindLeft,
+            "bindRightBtn" : self.bindRight,
+            "breakBindLeftBtn" : self.breakBindLeft,
+            "breakBindRightBtn" : self.breakBindRight,
+        }
+        radioBtn = self.btnGroup.checkedButton()
+        if radioBtn:
+            func = func_map.get(radioBtn.objectName())
+            self.obj1.Document.openTransaction(f"DynamicData: {func.__name__}")
+            retval = func()
+            if retval == None: #user aborted
+                self.obj1.Document.abortTransaction()
+                return #doesn't close dialog
+            elif retval == False: #error, but already reported in func(), so don't repeat it here
+                self.obj1.Document.abortTransaction()
+            else:
+                self.obj1.Document.commitTransaction()
+        self.pg.SetBool("UseExpression", self.byExpressionCheckBox.isChecked())
+        super().accept()
+
+    def reject(self):
+        self.pg.SetBool("UseExpression", self.byExpressionCheckBox.isChecked())
+        print("rejected")
+        super().reject()
+
+    def apply(self):
+        self.applied = True
+        self.accept()
@@ -0,0 +1,174 @@
+# SPDX-License-Identifier: LGPL-2.1-or-later
+# SPDX-FileNotice: Part of the Dynamic Data addon.
+
+################################################################################
+#                                                                              #
+#   Copyright (c) 2018 Mark Ganson ( TheMarkster )                             #
+#                                                                              #
+#   This library is free software; you can redistribute it and/or modify it    #
+#   under the terms of the GNU Lesser General Public License as published      #
+#   by the Free Software Foundation; either version 2.1 of the License, or     #
+#   (at your option) any later version.                                        #
+#                                                                              #
+#   This library is distributed in the hope that it will be useful,            #
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of             #
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.                       #
+#                                                                              #
+#   See the GNU Lesser General Public License for more details.                #
+#                                                                              #
+#   You should have received a copy of the GNU Lesser General Public License   #
+#   along with this library; if not, write to the Free Software Foundation,    # 
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA           #
+#                                                                              #
+################################################################################
+
+"""Design of experiments dialog."""
+
+from PySide import QtCore, QtGui
+import FreeCAD
+import FreeCADGui as Gui
+from freecad.Dynamic_Data import doe, sweep
+from freecad.Dynamic_Data.DynamicDataCmd import __version__
+
+
+class DynamicDataDOEDlg(QtGui.QDialog):
+    """choose the parameters and their ranges, the sampling method, and the metrics"""
+
+    COLUMNS = ["Property", "Type", "Low", "High", "Levels"]
+
+    def __init__(self, dd, others):
+        super(DynamicDataDOEDlg, self).__init__(Gui.getMainWindow())
+        self.setAttribute(QtCore.Qt.WA_WindowPropagation, True)
+        self.setWindowTitle(f"DynamicData v{__version__} Design of Experiments")
+        self.dd = dd
+        self.params = []
+        self.samples = []
+        pg = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/DynamicData")
+        lay = QtGui.QVBoxLayout(self)
+        self.setLayout(lay)
+        lay.addWidget(QtGui.QLabel("Check the properties to vary and enter their ranges:"))
+        self.table = QtGui.QTableWidget(0, len(self.COLUMNS), self)
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.horizontalHeader().setStretchLastSection(True)
+        for prop in doe.getNumericProperties(dd):
+            self.addPropertyRow(prop)
+        self.table.itemChanged.connect(self.updateCount)
+        lay.addWidget(self.table)
+
+        form = QtGui.QFormLayout()
+        lay.addLayout(form)
+        self.methodCombo = QtGui.QComboBox()
+        self.methodCombo.addItems(list(doe.METHODS))
+        self.methodCombo.setCurrentIndex(doe.METHODS.index(doe.LATIN_HYPERCUBE))
+        self.methodCombo.currentIndexChanged.connect(self.updateCount)
+        form.addRow("Method:", self.methodCombo)
+        self.countSpin = QtGui.QSpinBox()
+        self.countSpin.setRange(1, 1000000)
+        self.countSpin.setValue(100)
+        self.countSpin.setToolTip("Number of samples of the random and latin hypercube methods")
+        self.countSpin.valueChanged.connect(self.updateCount)
+        form.addRow("Samples:", self.countSpin)
+        self.seedSpin = QtGui.QSpinBox()
+        self.seedSpin.setRange(0, 2**31 - 1)
+        self.seedSpin.setToolTip("The same seed gives the same samples, 0 for different ones each time")
+        form.addRow("Seed:", self.seedSpin)
+        self.workersSpin = QtGui.QSpinBox()
+        self.workersSpin.setRange(1, 256)
+        self.workersSpin.setValue(pg.GetInt("SweepWorkers", 1))
+        self.workersSpin.setToolTip("Number of FreeCADCmd processes, each on its own copy of the document.\n\
+1 runs the samples here, in this FreeCAD session.")
+        form.addRow("Workers:", self.workersSpin)
+        self.metricsEdit = QtGui.QPlainTextEdit()
+        self.metricsEdit.setPlainText("\n".join(sweep.getDefaultMetrics(others)))
+        self.metricsEdit.setToolTip("One per line: object name or label followed by a property path, e.g. Body.Shape.Volume")
+        form.addRow("Metrics:", self.metricsEdit)
+        self.countLabel = QtGui.QLabel("")
+        lay.addWidget(self.countLabel)
+        self.buttons = QtGui.QDialogButtonBox(QtGui.QDialogButtonBox.Ok.__or__(QtGui.QDialogButtonBox.Cancel),\
+            QtCore.Qt.Horizontal, self)
+        self.buttons.accepted.connect(self.accept)
+        self.buttons.rejected.connect(self.reject)
+        lay.addWidget(self.buttons)
+        self.updateCount()
+        self.resize(max(self.width(), 600), max(self.height(), 500))
+
+    def addPropertyRow(self, prop):
+        """a row for prop, ranging from half to one and a half times its value"""
+        value = getattr(self.dd, prop)
+        value = float(getattr(value, "Value", value))
+        low, high = (value * 0.5, value * 1.5) if value else (0.0, 1.0)
+        row = self.table.rowCount()
+        self.table.insertRow(row)
+        nameItem = QtGui.QTableWidgetItem(prop)
+        nameItem.setFlags(QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsUserCheckable)
+        nameItem.setCheckState(QtCore.Qt.Unchecked)
+        typeItem = QtGui.QTableWidgetItem(self.dd.getTypeIdOfProperty(prop).replace("App::Property", ""))
+        typeItem.setFlags(QtCore.Qt.ItemIsEnabled)
+        self.table.setItem(row, 0, nameItem)
+        self.table.setItem(row, 1, typeItem)
+        for col,text in ((2, f"{min(low, high):g}"), (3, f"{max(low, high):g}"), (4, "3")):
+            self.table.setItem(row, col, QtGui.QTableWidgetItem(text))
+
+    def getParameters(self):
+        """the Parameters of the checked rows, raises ValueError if a range is not valid"""
+        params = []
+        for row in range(self.table.rowCount()):
+            if self.table.item(row, 0).checkState() != QtCore.Qt.Checked:
+                continue
+            prop = self.table.item(row, 0).text()
+            try:
+                low = float(self.table.item(row, 2).text())
+                high = float(self.table.item(row, 3).text())
+                levels = int(self.table.item(row, 4).text())
+            except ValueError:
+                raise ValueError(f"{prop}: low and high must be numbers and levels an integer")
+            if high < low or levels < 2:
+                raise ValueError(f"{prop}: high must not be less than low, and levels at least 2")
+            params.append(doe.makeParameter(self.dd, prop, low, high, levels))
+        return params
+
+    @property
+    def method(self):
+        return self.methodCombo.currentText()
+
+    def getSampleCount(self, params):
+        if self.method != doe.FULL_FACTORIAL:
+            return self.countSpin.value()
+        count = 1
+        for param in params:
+            count *= len(doe.getLevels(param))
+        return count
+
+    def updateCount(self):
+        self.countSpin.setEnabled(self.method != doe.FULL_FACTORIAL)
+        try:
+            params = self.getParameters()
+        except ValueError as e:
+            self.countLabel.setText(str(e))
+            return
+        if not params:
+            self.countLabel.setText("Check at least one property.")
+            return
+        self.countLabel.setText(f"{self.getSampleCount(params)} samples of {len(params)} parameters")
+
+    @property
+    def metrics(self):
+        return [line.strip() for line in self.metricsEdit.toPlainText().splitlines() if line.strip()]
+
+    @property
+    def workers(self):
+        return self.workersSpin.value()
+
+    def accept(self):
+        try:
+            self.params = self.getParameters()
+        except ValueError as e:
+            QtGui.QMessageBox.warning(self, "Design of experiments", str(e))
+            return
+        if not self.params:
+            QtGui.QMessageBox.warning(self, "Design of experiments", "Check at least one property to vary.")
+            return
+        seed = self.seedSpin.value() or None
+        self.samples = doe.makeSamples(self.params, self.method, self.countSpin.value(), seed)
+        FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/DynamicData").SetInt("SweepWorkers", self.workers)
+        super().accept()
@@ -0,0 +1,120 @@
+# SPDX-License-Identifier: LGPL-2.1-or-later
+# SPDX-FileNotice: Part of the Dynamic Data addon.
+
+################################################################################
+#                                                                              #
+#   Copyright (c) 2018 Mark Ganson ( TheMarkster )                             #
+#                                                                              #
+#   This library is free software; you can redistribute it and/or modify it    #
+#   under the terms of the GNU Lesser General Public License as published      #
+#   by the Free Software Foundation; either version 2.1 of the License, or     #
+#   (at your option) any later version.                                        #
+#                                                                              #
+#   This library is distributed in the hope that it will be useful,            #
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of             #
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.                       #
+#                                                                              #
+#   See the GNU Lesser General Public License for more details.                #
+#                                                                              #
+#   You should have received a copy of the GNU Lesser General Public License   #
+#   along with this library; if not, write to the Free Software Foundation,    # 
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA           #
+#                                                                              #
+################################################################################
+
+"""Enumeration editor dialog."""
+
+from PySide import QtCore, QtGui
+import FreeCADGui as Gui
+from freecad.Dynamic_Data.DynamicDataCmd import __version__
+
+
+class DynamicDataEnumerationDlg(QtGui.QDialog):
+    def __init__(self,dd,props):
+        super(DynamicDataEnumerationDlg, self).__init__(Gui.getMainWindow())
+        self.dd = dd
+        self.ok = False
+        self.props = props
+        self.items = []
+        self.enumerations = {}
+        self.setupEnumerations()
+        self.setAttribute(QtCore.Qt.WA_WindowPropagation, True)
+        self.setWindowTitle(f"DynamicData v{__version__} Enumeration Editor")
+        lay = QtGui.QVBoxLayout(self)
+        self.setLayout(lay)
+        self.propertiesLabel = QtGui.QLabel("Enumeration Properties:")
+        self.propertiesListBox = QtGui.QListWidget(self)
+
+        for prop in self.props:
+            item = QtGui.QListWidgetItem(prop)
+            self.items.append(item)
+            self.propertiesListBox.addItem(item)
+
+        self.propertiesListBox.setSelectionMode(QtGui.QListWidget.SingleSelection)
+        self.propertiesListBox.itemClicked.connect(self.handlePropertiesListBoxItemClicked)
+        if self.items:
+            self.propertiesListBox.setCurrentItem(self.items[0])
+        lay.addWidget(self.propertiesLabel)
+        lay.addWidget(self.propertiesListBox)
+        self.textEditLabel = QtGui.QLabel("Edit the selected property by typing here:")
+        lay.addWidget(self.textEditLabel)
+
+        self.textEdit = QtGui.QPlainTextEdit()
+        self.textEdit.textChanged.connect(self.textChanged)
+        lay.addWidget(self.textEdit)
+        self.buttons = QtGui.QDialogButtonBox(QtGui.QDialogButtonBox.Ok.__or__(QtGui.QDialogButtonBox.Cancel),\
+            QtCore.Qt.Horizontal, self)
+        self.buttons.accepted.connect(self.accept)
+        self.buttons.rejected.connect(self.reject)
+        lay.addWidget(self.buttons)
+        self.setupTextEdit()
+
+    def handlePropertiesListBoxItemClicked(self, item):
+        """a new enumeration property was selected, so set the QPlainTextEdit"""
+        self.updateTextEdit()
+
+    def textChanged(self):
+        """The QPlainTextEdit changed, so update enums"""
+        self.updateEnumerations()
+
+    def setupEnumerations(self):
+        """setup enums from the dd object enumerations"""
+        for prop in self.props:
+            if not prop in self.enumerations:
+                self.enumerations[prop] = self.dd.getEnumerationsOfProperty(prop)
+
+    def updateEnumerations(self):
+        """update enums from QPlainTextEdit"""
+        prop = self.getCurrentProp()
+        self.enumerations[prop] = self.getTextEditStrings()
+
+    def getCurrentProp(self):
+        return self.props[self.propertiesListBox.currentRow()]
+
+    def setupTextEdit(self):
+        """puts the text into the QPlainTextEdit from the dd object enumeration properties"""
+        if self.props:
+            prop = self.props[self.propertiesListBox.currentRow()]
+            enums = self.dd.getEnumerationsOfProperty(prop)
+            textString = "\n".join(enums)
+            self.textEdit.setPlainText(textString)
+
+    def updateTextEdit(self):
+        """update the QPlainTextEdit from enums"""
+        prop = self.props[self.propertiesListBox.currentRow()]
+        enums = self.enumerations[prop]
+        textString = "\n".join(enums)
+        self.textEdit.setPlainText(textString)
+
+    def getTextEditStrings(self):
+        """return the text edit contents as a list of strings"""
+        txt = self.textEdit.toPlainText()
+        split_text = txt.split("\n")
+        return split_text
+
+    def accept(self):
+        self.ok = True
+        super().accept()
+
+    def reject(self):
+        super().reject()
@@ -0,0 +1,252 @@
+# SPDX-License-Identifier: LGPL-2.1-or-later
+# SPDX-FileNotice: Part of the Dynamic Data addon.
+
+################################################################################
+#                                                                              #
+#   Copyright (c) 2018 Mark Ganson ( TheMarkster )                             #
+#                                                                              #
+#   This library is free software; you can redistribute it and/or modify it    #
+#   under the terms of the GNU Lesser General Public License as published      #
+#   by the Free Software Foundation; either version 2.1 of the License, or     #
+#   (at your option) any later version.                                        #
+#                                                                              #
+#   This library is distributed in the hope that it will be useful,            #
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of             #
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.                       #
+#                                                                              #
+#   See the GNU Lesser General Public License for more details.                #
+#                                                                              #
+#   You should have received a copy of the GNU Lesser General Public License   #
+#   along with this library; if not, write to the Free Software Foundation,    # 
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA           #
+#                                                                              #
+################################################################################
+
+"""Dialog with a checkable list of items, used to select properties.
+
+The items are held in a model and shown in a view that only draws the visible
+rows, so the dialog opens at once and checking everything is a single model
+update even with thousands of properties."""
+
+from PySide import QtCore, QtGui
+
+
+def isChecked(value):
+    """True if value, as passed for the CheckStateRole, means checked, it may be
+    an int or a Qt.CheckState depending on the binding"""
+    return getattr(value, "value", value) == getattr(QtCore.Qt.Checked, "value", QtCore.Qt.Checked)
+
+
+class CheckListModel(QtCore.QAbstractTableModel):
+    """the items as rows of (name, group, type), names are checkable.  items may
+    be plain names, then only the name column is shown"""
+
+    HEADERS = ("Name", "Group", "Type")
+
+    checkedCountChanged = QtCore.Signal(int)
+
+    def __init__(self, items, parent=None):
+        super(CheckListModel, self).__init__(parent)
+        self.items = []
+        self.columns = 1
+        for item in items:
+            if isinstance(item, str):
+                item = (item,)
+            else:
+                self.columns = len(self.HEADERS)
+            item = tuple(str(v) if v is not None else "" for v in item)
+            self.items.append((item + ("",) * len(self.HEADERS))[:len(self.HEADERS)])
+        self.checked = [False] * len(self.items)
+        self.checkedCount = 0
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.items)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else self.columns
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if orientation == QtCore.Qt.Horizontal and role == QtCore.Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row,col = index.row(), index.column()
+        if role == QtCore.Qt.DisplayRole:
+            return self.items[row][col]
+        if role == QtCore.Qt.CheckStateRole and col == 0:
+            return QtCore.Qt.Checked if self.checked[row] else QtCore.Qt.Unchecked
+        return None
+
+    def setData(self, index, value, role=QtCore.Qt.EditRole):
+        if not index.isValid() or role != QtCore.Qt.CheckStateRole or index.column() != 0:
+            return False
+        self.setChecked([index.row()], isChecked(value))
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return QtCore.Qt.NoItemFlags
+        flags = QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable
+        if index.column() == 0:
+            flags |= QtCore.Qt.ItemIsUserCheckable
+        return flags
+
+    def setChecked(self, rows, checked):
+        """check or uncheck rows (source row numbers), the views are notified once"""
+        changed = [row for row in rows if self.checked[row] != checked]
+        if not changed:
+            return
+        for row in changed:
+            self.checked[row] = checked
+        self.checkedCount += len(changed) if checked else -len(changed)
+        self.dataChanged.emit(self.index(min(changed), 0), self.index(max(changed), 0))
+        self.checkedCountChanged.emit(self.checkedCount)
+
+    def invert(self, rows):
+        checked = [row for row in rows if self.checked[row]]
+        unchecked = [row for row in rows if not self.checked[row]]
+        self.setChecked(checked, False)
+        self.setChecked(unchecked, True)
+
+    def getChecked(self):
+        """names of the checked items, in the order they were given"""
+        return [item[0] for item,checked in zip(self.items, self.checked) if checked]
+
+
+class SelectObjects(QtGui.QDialog):
+    """objects are the names to choose from, or (name, group, type) tuples to
+    show group and type columns too.  After exec_() the checked names are in
+    selected.  The All checkbox and the bulk buttons act on the rows that pass
+    the filter."""
+
+    def __init__(self, objects, label=""):
+        QtGui.QDialog.__init__(self)
+        self.signalsBlocked = False
+        self.selected = []
+        self.model = CheckListModel(objects, self)
+        self.proxy = QtCore.QSortFilterProxyModel(self)
+        self.proxy.setSourceModel(self.model)
+        self.proxy.setFilterKeyColumn(-1)
+        self.proxy.setFilterCaseSensitivity(QtCore.Qt.CaseInsensitive)
+
+        vBoxLayout = QtGui.QVBoxLayout(self)
+        vBoxLayout.addWidget(QtGui.QLabel(label))
+
+        filterLayout = QtGui.QHBoxLayout()
+        self.filterEdit = QtGui.QLineEdit()
+        self.filterEdit.setPlaceholderText("Filter")
+        self.filterEdit.setClearButtonEnabled(True)
+        self.filterEdit.setToolTip("Show only the items containing this text in any column")
+        self.filterEdit.textChanged.connect(self.updateFilter)
+        filterLayout.addWidget(self.filterEdit)
+        self.regex = QtGui.QCheckBox("Regex")
+        self.regex.setToolTip("Filter with a regular expression instead of plain text")
+        self.regex.stateChanged.connect(self.updateFilter)
+        filterLayout.addWidget(self.regex)
+        vBoxLayout.addLayout(filterLayout)
+
+        checkLayout = QtGui.QHBoxLayout()
+        self.all = QtGui.QCheckBox("All")
+        self.all.setToolTip("Check or uncheck all the items shown")
+        self.all.stateChanged.connect(self.allStateChanged)
+        checkLayout.addWidget(self.all)
+        checkLayout.addStretch()
+        for text,tooltip,slot in (("Check selected", "Check the highlighted items", self.checkSelected),
+                                  ("Uncheck selected", "Uncheck the highlighted items", self.uncheckSelected),
+                                  ("Invert", "Invert the check state of the items shown", self.invert)):
+            button = QtGui.QPushButton(text)
+            button.setToolTip(tooltip)
+            button.setAutoDefault(False)
+            button.clicked.connect(slot)
+            checkLayout.addWidget(button)
+        vBoxLayout.addLayout(checkLayout)
+
+        self.view = QtGui.QTreeView()
+        self.view.setRootIsDecorated(False)
+        self.view.setUniformRowHeights(True)
+        self.view.setAlternatingRowColors(True)
+        self.view.setSelectionMode(QtGui.QAbstractItemView.ExtendedSelection)
+        self.view.setModel(self.proxy)
+        self.view.header().setSortIndicator(-1, QtCore.Qt.AscendingOrder) #keep the given order until a header is clicked
+        self.view.setSortingEnabled(True)
+        self.view.setColumnWidth(0, 250)
+        self.view.setColumnWidth(1, 150)
+        vBoxLayout.addWidget(self.view)
+
+        self.countLabel = QtGui.QLabel()
+        vBoxLayout.addWidget(self.countLabel)
+        self.model.checkedCountChanged.connect(self.checkStateChanged)
+
+        buttons = QtGui.QDialogButtonBox(
+            QtGui.QDialogButtonBox.Ok.__or__(QtGui.QDialogButtonBox.Cancel),
+            QtCore.Qt.Horizontal, self)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        vBoxLayout.addWidget(buttons)
+        self.setLayout(vBoxLayout)
+        self.resize(600, 500)
+        self.updateCount()
+
+    def getVisibleRows(self):
+        """source rows of the items that pass the filter"""
+        if self.proxy.rowCount() == self.model.rowCount():
+            return range(self.model.rowCount())
+        return [self.proxy.mapToSource(self.proxy.index(row, 0)).row() for row in range(self.proxy.rowCount())]
+
+    def getSelectedRows(self):
+        """source rows of the highlighted items"""
+        return [self.proxy.mapToSource(index).row() for index in self.view.selectionModel().selectedRows()]
+
+    def updateFilter(self, arg=None):
+        text = self.filterEdit.text()
+        if self.regex.isChecked():
+            regex = QtCore.QRegularExpression(text, QtCore.QRegularExpression.CaseInsensitiveOption)
+            if not regex.isValid():
+                self.filterEdit.setStyleSheet("color: red")
+                self.filterEdit.setToolTip(f"Invalid regular expression: {regex.errorString()}")
+                return
+            self.proxy.setFilterRegularExpression(regex)
+        else:
+            self.proxy.setFilterFixedString(text)
+        self.filterEdit.setStyleSheet("")
+        self.filterEdit.setToolTip("Show only the items containing this text in any column")
+        self.updateCount()
+
+    def updateCount(self):
+        visible = self.proxy.rowCount()
+        total = self.model.rowCount()
+        shown = f", {visible} shown" if visible != total else ""
+        self.countLabel.setText(f"{self.model.checkedCount} of {total} checked{shown}")
+        rows = self.getVisibleRows()
+        allChecked = bool(rows) and all(self.model.checked[row] for row in rows)
+        self.signalsBlocked = True
+        self.all.setCheckState(QtCore.Qt.Checked if allChecked else QtCore.Qt.Unchecked)
+        self.signalsBlocked = False
+
+    def checkStateChanged(self, arg):
+        self.updateCount()
+
+    def allStateChanged(self, arg):
+        if self.signalsBlocked:
+            return
+        self.checkAll(self.all.checkState())
+        self.updateCount()
+
+    def checkAll(self, state):
+        self.model.setChecked(self.getVisibleRows(), isChecked(state))
+
+    def checkSelected(self):
+        self.model.setChecked(self.getSelectedRows(), True)
+
+    def uncheckSelected(self):
+        self.model.setChecked(self.getSelectedRows(), False)
+
+    def invert(self):
+        self.model.invert(self.getVisibleRows())
+
+    def accept(self):
+        self.selected = self.model.getChecked()
+        super().accept()
@@ -0,0 +1,75 @@
+# SPDX-License-Identifier: LGPL-2.1-or-later
+# SPDX-FileNotice: Part of the Dynamic Data addon.
+
+################################################################################
+#                                                                              #
+#   Copyright (c) 2018 Mark Ganson ( TheMarkster )                             #
+#                                                                              #
+#   This library is free software; you can redistribute it and/or modify it    #
+#   under the terms of the GNU Lesser General Public License as published      #
+#   by the Free Software Foundation; either version 2.1 of the License, or     #
+#   (at your option) any later version.                                        #
+#                                                                              #
+#   This library is distributed in the hope that it will be useful,            #
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of             #
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.                       #
+#                                                                              #
+#   See the GNU Lesser General Public License for more details.                #
+#                                                                              #
+#   You should have received a copy of the GNU Lesser General Public License   #
+#   along with this library; if not, write to the Free Software Foundation,    # 
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA           #
+#                                                                              #
+################################################################################
+
+"""Workbench settings dialog."""
+
+from PySide import QtCore, QtGui
+import FreeCAD
+import FreeCADGui as Gui
+from freecad.Dynamic_Data.DynamicDataCmd import __version__, uiPath
+
+
+class DynamicDataSettingsDlg(QtGui.QDialog):
+
+    pg = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/DynamicData")
+
+    def __init__(self):
+        super(DynamicDataSettingsDlg, self).__init__(Gui.getMainWindow())
+        self.setAttribute(QtCore.Qt.WA_DeleteOnClose, True)
+        self.setAttribute(QtCore.Qt.WA_WindowPropagation, True)
+        self.form = Gui.PySideUic.loadUi(uiPath + "/dynamicdataprefs.ui")
+        self.setWindowTitle(self.form.windowTitle()+" v."+__version__)
+        self.setWindowIcon(QtGui.QIcon("Resources/icons/Settings.svg"))
+        lay = QtGui.QVBoxLayout(self)
+        lay.addWidget(self.form)
+        self.setLayout(lay)
+        self.form.KeepToolbar.setChecked(self.pg.GetBool('KeepToolbar', True))
+        self.form.CondensedToolbar.setChecked(self.pg.GetBool('CondensedToolbar', True))
+        self.form.SupportViewObjectProperties.setChecked(self.pg.GetBool('SupportViewObjectProperties', False))
+        self.form.AddToActiveContainer.setChecked(self.pg.GetBool('AddToActiveContainer', False))
+        self.form.CheckForUpdates.setChecked(self.pg.GetBool('CheckForUpdates', True))
+        self.form.AddToFreeCADPreferences.setChecked(self.pg.GetBool("AddToFreeCADPreferences",True))
+        self.form.ReportCommandTimings.setChecked(self.pg.GetBool('ReportCommandTimings', False))
+        self.form.ProfileNextCommands.setValue(self.pg.GetInt('ProfileNextCommands', 0))
+        self.form.mruLength.setValue(self.pg.GetInt('mruLength', 5))
+        for checkBox in self.getFullRecomputeCheckBoxes():
+            checkBox.setChecked(self.pg.GetBool(checkBox.objectName(), False))
+
+    def getFullRecomputeCheckBoxes(self):
+        """one check box per command, named after its parameter, see core.getFullRecomputeParam()"""
+        return [box for box in self.form.findChildren(QtGui.QCheckBox) if box.objectName().startswith("FullRecompute")]
+
+    def closeEvent(self, event):
+        self.pg.SetBool('KeepToolbar', self.form.KeepToolbar.isChecked())
+        self.pg.SetBool('CondensedToolbar', self.form.CondensedToolbar.isChecked())
+        self.pg.SetBool('SupportViewObjectProperties', self.form.SupportViewObjectProperties.isChecked())
+        self.pg.SetBool('AddToActiveContainer', self.form.AddToActiveContainer.isChecked())
+        self.pg.SetBool('CheckForUpdates', self.form.CheckForUpdates.isChecked())
+        self.pg.SetBool('AddToFreeCADPreferences',self.form.AddToFreeCADPreferences.isChecked())
+        self.pg.SetBool('ReportCommandTimings', self.form.ReportCommandTimings.isChecked())
+        self.pg.SetInt('ProfileNextCommands', self.form.ProfileNextCommands.value())
+        self.pg.SetInt('mruLength', self.form.mruLength.value())
+        for checkBox in self.getFullRecomputeCheckBoxes():
+            self.pg.SetBool(checkBox.objectName(), checkBox.isChecked())
+        super(DynamicDataSettingsDlg, self).closeEvent(event)
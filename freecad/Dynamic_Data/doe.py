@@ -0,0 +1,157 @@
+# SPDX-License-Identifier: LGPL-2.1-or-later
+# SPDX-FileNotice: Part of the Dynamic Data addon.
+
+################################################################################
+#                                                                              #
+#   Copyright (c) 2018 Mark Ganson ( TheMarkster )                             #
+#                                                                              #
+#   This library is free software; you can redistribute it and/or modify it    #
+#   under the terms of the GNU Lesser General Public License as published      #
+#   by the Free Software Foundation; either version 2.1 of the License, or     #
+#   (at your option) any later version.                                        #
+#                                                                              #
+#   This library is distributed in the hope that it will be useful,            #
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of             #
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.                       #
+#                                                                              #
+#   See the GNU Lesser General Public License for more details.                #
+#                                                                              #
+#   You should have received a copy of the GNU Lesser General Public License   #
+#   along with this library; if not, write to the Free Software Foundation,    #
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA           #
+#                                                                              #
+################################################################################
+
+"""Design of experiments over the numeric properties of a dd object.
+
+Parameters are numeric dynamic properties of the dd object, each with a range.
+Samples are generated full-factorial, random, or by Latin hypercube, then each
+sample is set on the dd object, the document recomputed, and metrics collected
+as in a configuration sweep (see sweep.py), optionally shared among FreeCADCmd
+worker processes, for example in FreeCADCmd:
+
+    from freecad.Dynamic_Data import doe, sweep
+    params = [doe.Parameter("Width", 10, 20), doe.Parameter("Angle", 0, 45)]
+    samples = doe.makeSamples(params, doe.LATIN_HYPERCUBE, count=200, seed=1)
+    rows = doe.runParallel(dd, params, samples, ["Body.Shape.Volume"], workers=8)
+    sweep.writeResults(rows, "doe.json")
+
+This module does not import Qt."""
+
+import itertools, random
+from collections import namedtuple
+from freecad.Dynamic_Data import cache, core, sweep
+
+NUMERIC_TYPES = ("App::PropertyFloat", "App::PropertyLength", "App::PropertyDistance",
+                 "App::PropertyAngle", "App::PropertyInteger")
+INTEGER_TYPES = ("App::PropertyInteger",)
+
+FULL_FACTORIAL = "full factorial"
+RANDOM = "random"
+LATIN_HYPERCUBE = "latin hypercube"
+METHODS = (FULL_FACTORIAL, RANDOM, LATIN_HYPERCUBE)
+
+#a property of the dd object varied between low and high, levels is the number
+#of values it takes in a full factorial design, integer rounds its values
+Parameter = namedtuple("Parameter", ["name", "low", "high", "levels", "integer"], defaults=[3, False])
+
+def getNumericProperties(dd):
+    """the dynamic properties of dd a design can vary: numeric and not set by an expression"""
+    meta = cache.metadataCache.get(dd)
+    return [prop for prop,info in meta.properties.items()
+            if info.status == [cache.PROP_DYNAMIC] and info.typeId in NUMERIC_TYPES and not core.getExpression(dd, prop)]
+
+def makeParameter(dd, name, low, high, levels=3):
+    """Parameter for property name of dd, integer if the property is an Integer"""
+    integer = core.getTypeId(dd.getTypeIdOfProperty(name)) in INTEGER_TYPES
+    return Parameter(name, low, high, levels, integer)
+
+def getValue(param, fraction):
+    """the value of param at fraction (0 to 1) of its range"""
+    value = param.low + (param.high - param.low) * fraction
+    return int(round(value)) if param.integer else value
+
+def getLevels(param):
+    levels = max(2, int(param.levels))
+    values = [getValue(param, idx / (levels - 1)) for idx in range(levels)]
+    return list(dict.fromkeys(values)) #integers may round to the same value
+
+def fullFactorial(params):
+    """every combination of the levels of params"""
+    return [list(sample) for sample in itertools.product(*[getLevels(param) for param in params])]
+
+def randomSamples(params, count, seed=None):
+    """count samples uniformly distributed in the ranges of params"""
+    rng = random.Random(seed)
+    return [[getValue(param, rng.random()) for param in params] for idx in range(count)]
+
+def latinHypercube(params, count, seed=None):
+    """count samples such that each parameter's range, divided into count equal
+    strata, has exactly one sample in each stratum"""
+    rng = random.Random(seed)
+    columns = []
+    for param in params:
+        strata = list(range(count))
+        rng.shuffle(strata)
+        columns.append([getValue(param, (stratum + rng.random()) / count) for stratum in strata])
+    return [list(sample) for sample in zip(*columns)]
+
+def makeSamples(params, method, count=None, seed=None):
+    """the list of samples, each a list of values in the order of params"""
+    if method == FULL_FACTORIAL:
+        return fullFactorial(params)
+    if not count or count < 1:
+        raise ValueError(f"{method} needs a sample count")
+    if method == RANDOM:
+        return randomSamples(params, count, seed)
+    if method == LATIN_HYPERCUBE:
+        return latinHypercube(params, count, seed)
+    raise ValueError(f"unknown method: {method}, use one of {', '.join(METHODS)}")
+
+def runSamples(dd, names, samples, metrics, first=0, progress=None):
+    """set the properties names of dd to the values of each sample, recompute and
+    collect metrics.  Rows are numbered from first.  progress(done, total) is
+    called after each sample, if it returns False the run stops.  The properties
+    get their values back at the end.  Returns the list of rows."""
+    doc = dd.Document
+    current = [getattr(dd, name) for name in names]
+    rows = []
+    try:
+        for idx,sample in enumerate(samples):
+            for name,value in zip(names, sample):
+                setattr(dd, name, value)
+            row = {"sample": first + idx}
+            row.update(zip(names, sample))
+            row.update(sweep.evaluate(doc, metrics))
+            rows.append(row)
+            if progress and progress(idx + 1, len(samples)) is False:
+                break
+    finally:
+        for name,value in zip(names, current):
+            setattr(dd, name, value)
+        doc.recompute()
+    return rows
+
+def runJob(doc, job):
+    """worker side of runParallel()"""
+    dd = doc.getObject(job["dd"])
+    return runSamples(dd, job["names"], job["samples"], job["metrics"], job["first"])
+
+def runParallel(dd, params, samples, metrics, workers=0, freecadCmd=None, timeout=None):
+    """runSamples() shared among workers FreeCADCmd processes (0: one per core but
+    one), each on its own copy of the document.  Rows of a worker that failed only
+    have the sample number and an error column."""
+    from freecad.Dynamic_Data import worker
+    names = [param.name for param in params]
+    count = min(worker.getWorkerCount(workers), len(samples))
+    size = -(-len(samples) // count) if count else 0
+    jobs = [{"task": "doe", "dd": dd.Name, "names": names, "samples": samples[first:first+size],
+             "metrics": list(metrics), "first": first} for first in range(0, len(samples), size or 1)]
+    results = worker.runJobs(dd.Document, jobs, freecadCmd, timeout) if jobs else []
+    rows = []
+    for job,result in zip(jobs, results):
+        if result:
+            rows.extend(result)
+        else:
+            rows.extend({"sample": job["first"] + idx, "error": "worker failed"} for idx in range(len(job["samples"])))
+    return rows
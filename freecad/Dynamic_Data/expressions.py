@@ -0,0 +1,319 @@
+# SPDX-License-Identifier: LGPL-2.1-or-later
+# SPDX-FileNotice: Part of the Dynamic Data addon.
+
+################################################################################
+#                                                                              #
+#   Copyright (c) 2018 Mark Ganson ( TheMarkster )                             #
+#                                                                              #
+#   This library is free software; you can redistribute it and/or modify it    #
+#   under the terms of the GNU Lesser General Public License as published      #
+#   by the Free Software Foundation; either version 2.1 of the License, or     #
+#   (at your option) any later version.                                        #
+#                                                                              #
+#   This library is distributed in the hope that it will be useful,            #
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of             #
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.                       #
+#                                                                              #
+#   See the GNU Lesser General Public License for more details.                #
+#                                                                              #
+#   You should have received a copy of the GNU Lesser General Public License   #
+#   along with this library; if not, write to the Free Software Foundation,    #
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA           #
+#                                                                              #
+################################################################################
+
+"""Parser for FreeCAD expressions and the references they contain.
+
+An expression such as "Doc#<<My Box>>.Height * 2 + .Constraints.Width" is split
+into tokens, and the object.property chains in it are found so we can tell
+exactly which properties an expression depends on and rewrite those references
+(rename a property, qualify with an object label, wrap in href()) without
+matching substrings of other names or relying on white space.
+
+Parsing is cached by expression text, so the same expression is only parsed
+once however many times it is queried or rewritten.
+
+This module does not import Qt, so it may be used from FreeCADCmd."""
+
+import functools, re
+from collections import namedtuple
+
+PARSE_CACHE_SIZE = 4096
+
+#token kinds
+IDENT = "ident"
+QUOTED = "quoted" #<<label or string>>
+NUMBER = "number"
+SPACE = "space"
+OP = "op"
+
+Token = namedtuple("Token", ["kind", "text"])
+
+TOKEN_RE = re.compile(r"""
+    (?P<quoted><<.*?>>)
+   |(?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+   |(?P<ident>\$?[^\W\d]\w*(?:\$\d+)?)
+   |(?P<space>\s+)
+   |(?P<op>\*\*|==|!=|<=|>=|.)
+""", re.VERBOSE | re.UNICODE | re.DOTALL)
+
+def tokenize(expression):
+    """returns the list of Tokens of expression, joining their texts gives back expression"""
+    return [Token(m.lastgroup, m.group(0)) for m in TOKEN_RE.finditer(expression)]
+
+def untokenize(tokens):
+    return "".join(token.text for token in tokens)
+
+def unquote(text):
+    """<<My Box>> -> My Box"""
+    return text[2:-2] if text.startswith("<<") and text.endswith(">>") else text
+
+
+#a chain of identifiers joined by dots, optionally prefixed by a document:
+#  document: token index of the document name or None
+#  parts: token indices of the chain, e.g. for Box.Placement.Base the indices of Box, Placement, Base
+#  local: True if the chain began with a dot, e.g. .Constraints.Width
+Chain = namedtuple("Chain", ["document", "parts", "local"])
+
+def nextSignificant(tokens, idx):
+    """index of the next token after idx that is not white space, or None"""
+    idx += 1
+    while idx < len(tokens) and tokens[idx].kind == SPACE:
+        idx += 1
+    return idx if idx < len(tokens) else None
+
+def getChains(tokens):
+    """find the identifier chains in tokens, function calls and string literals are skipped"""
+    chains = []
+    idx = 0
+    count = len(tokens)
+    previous = None #previous significant token
+    while idx < count:
+        token = tokens[idx]
+        if token.kind == SPACE:
+            idx += 1
+            continue
+        local = False
+        start = idx
+        afterOperand = previous is not None and (previous.kind != OP or previous.text in (")", "]", "."))
+        if token.text == "." and not afterOperand:
+            nxt = nextSignificant(tokens, idx)
+            if nxt is not None and tokens[nxt].kind in (IDENT, QUOTED):
+                local = True
+                start = nxt
+        #skip anything but names, attributes of something else such as the x in
+        #List[0].x, and units right after a number as in 10 mm
+        if not local and (not token.kind in (IDENT, QUOTED) or afterOperand):
+            previous = token
+            idx += 1
+            continue
+        document = None
+        parts = [start]
+        idx = start
+        nxt = nextSignificant(tokens, idx)
+        if not local and nxt is not None and tokens[nxt].text == "#":
+            after = nextSignificant(tokens, nxt)
+            if after is not None and tokens[after].kind in (IDENT, QUOTED):
+                document = start
+                parts = [after]
+                idx = after
+                nxt = nextSignificant(tokens, idx)
+        while nxt is not None and tokens[nxt].text == ".":
+            after = nextSignificant(tokens, nxt)
+            if after is None or not tokens[after].kind in (IDENT, QUOTED):
+                break
+            parts.append(after)
+            idx = after
+            nxt = nextSignificant(tokens, idx)
+        isCall = nxt is not None and tokens[nxt].text == "("
+        isString = len(parts) == 1 and document is None and not local and tokens[parts[0]].kind == QUOTED
+        if not isCall and not isString:
+            chains.append(Chain(document, parts, local))
+        previous = tokens[idx]
+        idx += 1
+    return chains
+
+
+#a resolved reference to obj.prop, token is the index of the property name token
+Reference = namedtuple("Reference", ["object", "property", "token"])
+
+def findObject(doc, text):
+    """object of doc with name text, or label text, or None"""
+    from freecad.Dynamic_Data import cache
+    if text.startswith("<<"):
+        return cache.getObjectByLabel(doc, unquote(text))
+    obj = doc.getObject(text)
+    if obj:
+        return obj
+    return cache.getObjectByLabel(doc, text)
+
+def findDocument(text):
+    import FreeCAD
+    name = unquote(text)
+    docs = FreeCAD.listDocuments()
+    if name in docs:
+        return docs[name]
+    for doc in docs.values():
+        if doc.Label == name:
+            return doc
+    return None
+
+def hasProperty(obj, prop):
+    try:
+        return prop in obj.PropertiesList or hasattr(obj, prop)
+    except Exception:
+        return False
+
+def resolveChain(tokens, chain, owner):
+    """returns the Reference the chain points to in the context of owner (the
+    object holding the expression), or None if it does not point to a property.
+    An object name or label takes precedence over a property of owner, as in
+    FreeCAD, a leading dot forces a property of owner"""
+    first = tokens[chain.parts[0]].text
+    if chain.local:
+        return Reference(owner, unquote(first), chain.parts[0])
+    doc = owner.Document
+    if chain.document is not None:
+        doc = findDocument(tokens[chain.document].text)
+        if not doc or len(chain.parts) < 2:
+            return None
+    if len(chain.parts) >= 2:
+        obj = findObject(doc, first)
+        if obj:
+            return Reference(obj, unquote(tokens[chain.parts[1]].text), chain.parts[1])
+        if chain.document is not None:
+            return None
+    if hasProperty(owner, first):
+        return Reference(owner, first, chain.parts[0])
+    return None
+
+#parsed expression: the tokens and the reference chains found in them
+ParsedExpression = namedtuple("ParsedExpression", ["tokens", "chains"])
+
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse(expression):
+    """returns the ParsedExpression of expression, cached by expression text"""
+    tokens = tuple(tokenize(expression))
+    chains = tuple(Chain(c.document, tuple(c.parts), c.local) for c in getChains(tokens))
+    return ParsedExpression(tokens, chains)
+
+def getReferences(expression, owner):
+    """returns the list of References to object properties in expression, which is
+    held by owner"""
+    parsed = parse(expression)
+    refs = []
+    for chain in parsed.chains:
+        ref = resolveChain(parsed.tokens, chain, owner)
+        if ref:
+            refs.append(ref)
+    return refs
+
+def renameProperty(expression, owner, obj, prop, newName):
+    """returns expression with the references to obj.prop renamed to newName, the
+    expression being held by owner.  Other names containing prop are left alone."""
+    parsed = parse(expression)
+    tokens = list(parsed.tokens)
+    changed = False
+    for chain in parsed.chains:
+        ref = resolveChain(tokens, chain, owner)
+        if ref and ref.property == prop and ref.object == obj:
+            tokens[ref.token] = Token(IDENT, newName)
+            changed = True
+    return untokenize(tokens) if changed else expression
+
+
+########################################################################################
+# rewriting references without resolving them in a document, these are cached too
+
+def quoteLabel(label, always=False):
+    """label as it must be written in an expression, <<My Box>> if it is not a plain name"""
+    if always or not re.fullmatch(r"[^\W\d]\w*", label):
+        return f"<<{label}>>"
+    return label
+
+def chainStart(tokens, chain):
+    """index of the first token of chain, its document or leading dot if any"""
+    if chain.document is not None:
+        return chain.document
+    idx = chain.parts[0]
+    if chain.local:
+        idx -= 1
+        while tokens[idx].kind == SPACE:
+            idx -= 1
+    return idx
+
+def isInHref(tokens, chain):
+    """True if chain is the argument of href() or hiddenref() already"""
+    idx = chainStart(tokens, chain) - 1
+    while idx >= 0 and tokens[idx].kind == SPACE:
+        idx -= 1
+    if idx < 0 or tokens[idx].text != "(":
+        return False
+    idx -= 1
+    while idx >= 0 and tokens[idx].kind == SPACE:
+        idx -= 1
+    return idx >= 0 and tokens[idx].text in ("href", "hiddenref")
+
+def replaceChains(parsed, replace):
+    """returns the expression with each chain for which replace(chain) returns a
+    string replaced by that string, white space between the chains is kept"""
+    tokens = parsed.tokens
+    pieces = []
+    last = 0
+    for chain in parsed.chains:
+        text = replace(chain)
+        if text is None:
+            continue
+        start = chainStart(tokens, chain)
+        pieces.append(untokenize(tokens[last:start]))
+        pieces.append(text)
+        last = chain.parts[-1] + 1
+    if not pieces:
+        return untokenize(tokens)
+    pieces.append(untokenize(tokens[last:]))
+    return "".join(pieces)
+
+CELL_RE = re.compile(r"\$?[A-Z]+\$?[0-9]+")
+
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def qualify(expression, names, label, href=False, cells=False):
+    """prefix the unqualified references to names with label (already quoted, see
+    quoteLabel()).  For example with names {"Width"} and label "<<Sketch>>",
+    "Width*2" or ".Width*2" becomes "<<Sketch>>.Width*2", or "href(<<Sketch>>.Width)*2"
+    if href is True.  With cells True cell addresses such as B2 are qualified too.
+    names must be hashable, e.g. a frozenset"""
+    parsed = parse(expression)
+    tokens = parsed.tokens
+
+    def replace(chain):
+        if chain.document is not None:
+            return None
+        first = tokens[chain.parts[0]].text
+        if not first in names and not (cells and len(chain.parts) == 1 and CELL_RE.fullmatch(first)):
+            return None
+        text = f"{label}.{untokenize(tokens[chain.parts[0]:chain.parts[-1]+1])}"
+        return f"href({text})" if href and not isInHref(tokens, chain) else text
+
+    return replaceChains(parsed, replace)
+
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def wrapInHref(expression, properties):
+    """wrap the references to another object's properties in href(), e.g. with
+    properties {"Constraints"} "Sketch.Constraints.Width*2" becomes
+    "href(Sketch.Constraints.Width)*2".  properties must be hashable"""
+    parsed = parse(expression)
+    tokens = parsed.tokens
+
+    def replace(chain):
+        if chain.local or len(chain.parts) < 2 or isInHref(tokens, chain):
+            return None
+        if not tokens[chain.parts[1]].text in properties:
+            return None
+        return f"href({untokenize(tokens[chainStart(tokens, chain):chain.parts[-1]+1])})"
+
+    return replaceChains(parsed, replace)
+
+def clearCache():
+    parse.cache_clear()
+    qualify.cache_clear()
+    wrapInHref.cache_clear()
@@ -36,6 +36,10 @@ global contextMenuAdded
 contextMenuAdded = False
 global pg
 pg = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/DynamicData")
+global updateCheckStarted
+updateCheckStarted = False
+global updateNotifier
+updateNotifier = None
 
 #def myFunc(string):
 #    print (string)
@@ -52,7 +56,6 @@ pg = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/DynamicData")
 class DynamicDataWorkbench(Gui.Workbench):
 
     global main_dynamicdataWB_Icon
-    global hasRequests
 
     MenuText = "DynamicData"
     ToolTip = "DynamicData workbench"
@@ -65,86 +68,53 @@ class DynamicDataWorkbench(Gui.Workbench):
 
     def Initialize(self):
         """This function is executed when FreeCAD starts"""
-        import freecad.Dynamic_Data.DynamicDataCmd as DynamicDataCmd #needed files for FreeCAD commands
+        #register lightweight stubs, DynamicDataCmd is imported when a command is first activated
+        import freecad.Dynamic_Data.commands as commands
+        commands.registerCommands()
         self.list = ["DynamicDataCreateObject", "DynamicDataAddProperty",
                     "DynamicDataEditEnumeration", "DynamicDataCreateConfiguration",
                     "DynamicDataRemoveProperty", "DynamicDataImportNamedConstraints",
                     "DynamicDataImportAliases","DynamicDataCopyProperty",
                     "DynamicDataRenameProperty","DynamicDataRetypeProperty",
                     "DynamicDataSetTooltip",
-                    "DynamicDataMoveToNewGroup","DynamicDataSettings",
-                    "DynamicDataCommands"] # A list of command names created in the line above
+                    "DynamicDataMoveToNewGroup","DynamicDataSweepConfiguration",
+                    "DynamicDataDesignOfExperiments","DynamicDataSettings","DynamicDataCommands"] # A list of command names created in the line above
         if pg.GetBool("CondensedToolbar", True):
             self.appendToolbar("DynamicData Commands",  [self.list[-1]]) # leave DDCommands off toolbar
         else:
-            self.appendToolbar("DynamicData Commands", self.list[:-6])
+            self.appendToolbar("DynamicData Commands", self.list[:-8])
         self.appendMenu("&DynamicData", self.list) # creates a new menu
         #considered putting the menu inside the Edit menu, but decided against it
         #self.appendMenu(["&Edit","DynamicData"],self.list) # appends a submenu to an existing menu
 
         if pg.GetBool("AddToFreeCADPreferences",True):
-            Gui.addPreferencePage(DynamicDataCmd.uiPath + "/dynamicdataprefs.ui", "DynamicData")
+            Gui.addPreferencePage(commands.uiPath + "/dynamicdataprefs.ui", "DynamicData")
             Gui.addIcon("preferences-dynamicdata",dynamicdataWB_icons_path + "/DynamicDataPreferencesLogo.svg")
 
     def Activated(self):
         """This function is executed when the workbench is activated."""
-        try:
-            import requests
-            global hasRequests
-            hasRequests = True
-            hasRequests = False #testing
-        except:
-            hasRequests = False
-        import xml.etree.ElementTree as ET
-
-        def get_remote_version(user, repo, branch='master'):
-            # GitHub raw URL for package.xml
-            global hasRequests
-            if not hasRequests:
-                # check again if requests module is now available
-                try:
-                    import requests
-                    hasRequests = True
-                except:
-                    FreeCAD.Console.PrintWarning("DynamicData updater: The requests package was not found, cannot check for updates.  Install requests package or disable auotomatic update checking in DynamicData settings to prevent this warning message.\n")
-                    return None
-            url = f"https://raw.githubusercontent.com/{user}/{repo}/{branch}/package.xml"
-            try:
-                response = requests.get(url)
-                if response.status_code == 200:
-                    # Parse the XML content of package.xml
-                    xml_content = response.content
-                    tree = ET.ElementTree(ET.fromstring(xml_content))
-                    root = tree.getroot()
-                    # Find the version element and return its text
-                    version = root.find("version").text
-                    return version
-                else:
-                    print(f"Failed to fetch package.xml: {response.status_code}")
-                    return None
-            except Exception as e:
-                print(f"Error fetching or parsing package.xml: {e}")
-                return None
-
-        def check_for_update(current_version, user, repo, branch, callback):
-            latest_version = get_remote_version(user, repo, branch)
-            if latest_version and latest_version > current_version:
-                callback(latest_version)
+        global updateCheckStarted
+        checkUpdates = pg.GetBool("CheckForUpdates", True)
+        if not checkUpdates or updateCheckStarted:
+            return
+        updateCheckStarted = True #once per session is enough
+        from PySide import QtCore
+        import freecad.Dynamic_Data.updater as updater
+
+        class UpdateNotifier(QtCore.QObject):
+            """lives in the GUI thread, the signal is emitted from the worker thread
+            and delivered here through a queued connection"""
+            available = QtCore.Signal(str)
 
         def update_callback(latest_version):
             FreeCAD.Console.PrintWarning(f"DynamicData {latest_version} is now available in the Addon Manager.\n")
 
-        import freecad.Dynamic_Data.DynamicDataCmd as DynamicDataCmd
-        current_version = DynamicDataCmd.__version__
-        user = "mwganson"
-        repo = "DynamicData"
-        branch = "master"
-
-        checkUpdates = pg.GetBool("CheckForUpdates", True)
-
-        if checkUpdates:
-            check_for_update(current_version, user, repo, branch, update_callback)
-
+        global updateNotifier
+        updateNotifier = UpdateNotifier()
+        updateNotifier.available.connect(update_callback)
+        hours = pg.GetInt("UpdateCheckIntervalHours", 24)
+        updater.checkForUpdate(updater.getLocalVersion(), updateNotifier.available.emit,
+                               cacheFile=updater.getCacheFile(), ttl=hours * 3600)
         return
 
     def Deactivated(self):
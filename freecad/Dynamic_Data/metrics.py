@@ -0,0 +1,185 @@
+# SPDX-License-Identifier: LGPL-2.1-or-later
+# SPDX-FileNotice: Part of the Dynamic Data addon.
+
+################################################################################
+#                                                                              #
+#   Copyright (c) 2018 Mark Ganson ( TheMarkster )                             #
+#                                                                              #
+#   This library is free software; you can redistribute it and/or modify it    #
+#   under the terms of the GNU Lesser General Public License as published      #
+#   by the Free Software Foundation; either version 2.1 of the License, or     #
+#   (at your option) any later version.                                        #
+#                                                                              #
+#   This library is distributed in the hope that it will be useful,            #
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of             #
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.                       #
+#                                                                              #
+#   See the GNU Lesser General Public License for more details.                #
+#                                                                              #
+#   You should have received a copy of the GNU Lesser General Public License   #
+#   along with this library; if not, write to the Free Software Foundation,    #
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA           #
+#                                                                              #
+################################################################################
+
+
+"""Timings and counters of the workbench.
+
+The commands time their IsActive() and Activated() calls and the construction
+of their dialogs, and core counts what it does to documents: transactions
+opened, properties added and removed, expressions set, recomputes.  Both are
+cheap enough to be always on.  From the Python console:
+
+    from freecad.Dynamic_Data import metrics
+    metrics.printReport()          # slowest first, in the Report view
+    metrics.dump("metrics.json")   # or metrics.dump() for the JSON text
+    metrics.reset()
+
+With the ProfileNextCommands setting at n the next n commands are run under
+cProfile, see profile().
+
+This module does not import Qt, so it may be used from FreeCADCmd."""
+
+import json, os, time
+import FreeCAD
+
+#counters
+TRANSACTIONS = "transactions"
+PROPERTIES_ADDED = "properties_added"
+PROPERTIES_REMOVED = "properties_removed"
+EXPRESSIONS_SET = "expressions_set"
+RECOMPUTES = "recomputes"
+COUNTERS = (TRANSACTIONS, PROPERTIES_ADDED, PROPERTIES_REMOVED, EXPRESSIONS_SET, RECOMPUTES)
+
+REPORT_PARAM = "ReportCommandTimings" #print each command's timing in the Report view
+PROFILE_PARAM = "ProfileNextCommands" #how many of the next commands to profile
+PROFILE_FOLDER = "DynamicDataProfiles"
+PROFILE_TOP = 20 #functions in the summary
+
+counters = dict.fromkeys(COUNTERS, 0)
+timings = {} #name: [calls, total seconds, max seconds]
+
+def count(counter, n=1):
+    counters[counter] = counters.get(counter, 0) + n
+
+def addTiming(name, seconds):
+    timing = timings.get(name)
+    if timing is None:
+        timings[name] = [1, seconds, seconds]
+        return
+    timing[0] += 1
+    timing[1] += seconds
+    if seconds > timing[2]:
+        timing[2] = seconds
+
+
+class timed:
+    """context manager adding the time spent in it to the timing of name:
+
+    with metrics.timed("DynamicDataAddProperty.Activated"):
+        ...
+    """
+    __slots__ = ("name", "start", "seconds")
+
+    def __init__(self, name):
+        self.name = name
+        self.seconds = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.seconds = time.perf_counter() - self.start
+        addTiming(self.name, self.seconds)
+        return False
+
+
+def reset():
+    counters.update(dict.fromkeys(counters, 0))
+    timings.clear()
+
+def getMetrics():
+    """returns {"counters": {name: count}, "timings": {name: {...}}}"""
+    result = {}
+    for name, (calls, total, longest) in timings.items():
+        result[name] = {"calls": calls, "total_seconds": total,
+                        "mean_seconds": total / calls, "max_seconds": longest}
+    return {"counters": dict(counters), "timings": result}
+
+def dump(path=None):
+    """returns the metrics as JSON text, also written to path if given"""
+    text = json.dumps(getMetrics(), indent=2, sort_keys=True)
+    if path:
+        with open(path, "w") as f:
+            f.write(text)
+    return text
+
+def formatReport(limit=None):
+    """the metrics as a text table, the timings with the largest total first"""
+    data = getMetrics()
+    rows = sorted(data["timings"].items(), key=lambda item: -item[1]["total_seconds"])
+    if limit:
+        rows = rows[:limit]
+    width = max([len(name) for name, _ in rows] + [len("timing")])
+    lines = [f"{'timing':<{width}} {'calls':>7} {'total ms':>10} {'mean ms':>9} {'max ms':>9}"]
+    for name, t in rows:
+        lines.append(f"{name:<{width}} {t['calls']:>7} {t['total_seconds']*1000:>10.2f} "
+                     f"{t['mean_seconds']*1000:>9.3f} {t['max_seconds']*1000:>9.3f}")
+    lines.append("")
+    lines.extend(f"{name}: {value}" for name, value in data["counters"].items())
+    return "\n".join(lines) + "\n"
+
+def printReport(limit=None):
+    FreeCAD.Console.PrintMessage("DynamicData metrics:\n" + formatReport(limit))
+
+def isReporting():
+    return getParams().GetBool(REPORT_PARAM, False)
+
+def reportCommand(name, seconds, before):
+    """print how long command name took and what it did, before being a copy of
+    the counters taken when it started"""
+    changes = ", ".join(f"{counter} {value - before.get(counter, 0)}"
+                        for counter, value in counters.items() if value != before.get(counter, 0))
+    FreeCAD.Console.PrintMessage(f"DynamicData: {name} took {seconds*1000:.1f} ms"
+                                 + (f" ({changes})" if changes else "") + "\n")
+
+
+########################################################################################
+# profiling commands on demand
+
+def getParams():
+    return FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/DynamicData")
+
+def takeProfileRun():
+    """True if the next command is to be profiled, counting down the setting"""
+    pg = getParams()
+    remaining = pg.GetInt(PROFILE_PARAM, 0)
+    if remaining <= 0:
+        return False
+    pg.SetInt(PROFILE_PARAM, remaining - 1)
+    return True
+
+def getProfileFolder():
+    return os.path.join(FreeCAD.getUserAppDataDir(), PROFILE_FOLDER)
+
+def profile(name, function, folder=None):
+    """call function under cProfile, then save name-<time>.pstats and a text
+    summary of the PROFILE_TOP functions with the most cumulative time next to it.
+    Returns the path of the .pstats file."""
+    import cProfile, io, pstats
+    profiler = cProfile.Profile()
+    try:
+        profiler.runcall(function)
+    finally:
+        folder = folder if folder else getProfileFolder()
+        os.makedirs(folder, exist_ok=True)
+        now = time.time()
+        base = os.path.join(folder, f"{name}-{time.strftime('%Y%m%d-%H%M%S', time.localtime(now))}-{int(now % 1 * 1000):03d}")
+        profiler.dump_stats(base + ".pstats")
+        summary = io.StringIO()
+        pstats.Stats(profiler, stream=summary).sort_stats("cumulative").print_stats(PROFILE_TOP)
+        with open(base + ".txt", "w") as f:
+            f.write(summary.getvalue())
+        FreeCAD.Console.PrintMessage(f"DynamicData: profile of {name} saved to {base}.pstats and {base}.txt\n")
+    return base + ".pstats"
@@ -0,0 +1,352 @@
+# SPDX-License-Identifier: LGPL-2.1-or-later
+# SPDX-FileNotice: Part of the Dynamic Data addon.
+
+################################################################################
+#                                                                              #
+#   Copyright (c) 2018 Mark Ganson ( TheMarkster )                             #
+#                                                                              #
+#   This library is free software; you can redistribute it and/or modify it    #
+#   under the terms of the GNU Lesser General Public License as published      #
+#   by the Free Software Foundation; either version 2.1 of the License, or     #
+#   (at your option) any later version.                                        #
+#                                                                              #
+#   This library is distributed in the hope that it will be useful,            #
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of             #
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.                       #
+#                                                                              #
+#   See the GNU Lesser General Public License for more details.                #
+#                                                                              #
+#   You should have received a copy of the GNU Lesser General Public License   #
+#   along with this library; if not, write to the Free Software Foundation,    #
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA           #
+#                                                                              #
+################################################################################
+
+
+"""Registry of the property types offered by the Add Property command.
+
+Everything that depends on the type of a new property is in one table, shared
+by the Add Property dialog, core.addProperty() and the bulk add: the hint shown
+in the empty value field, the parser turning the text the user typed into a
+value, the validator giving the preview of that text in the dialog, and the
+setter.  Looking a type up is one dictionary access:
+
+    propertyType = proptypes.get("LinkList")
+    value = propertyType.parse(obj, "[Box, Cylinder]")
+    propertyType.setter(obj, "Parts", value)
+
+This module does not import Qt, so it may be used from FreeCADCmd."""
+
+import ast, re
+from collections import namedtuple
+import FreeCAD
+from freecad.Dynamic_Data import cache, metrics
+
+
+class EvalError(Exception):
+    def __init__(self, message="Evaluation error occurred"):
+        self.message = message
+        super().__init__(self.message)
+
+
+########################################################################################
+# parsing user entered values
+
+COLOR_TUPLE_RE = re.compile(r'\((\d+),(\d+),(\d+)\)')
+COLOR_HEX_RE = re.compile(r'#([0-9a-fA-F]{6})')
+WORD_RE = re.compile(r'(\w+)')
+
+#color names understood without Qt, in the GUI QColor knows many more
+COLOR_NAMES = {
+    "black": (0,0,0), "white": (255,255,255), "red": (255,0,0), "lime": (0,255,0),
+    "green": (0,128,0), "blue": (0,0,255), "yellow": (255,255,0), "cyan": (0,255,255),
+    "aqua": (0,255,255), "magenta": (255,0,255), "fuchsia": (255,0,255),
+    "silver": (192,192,192), "gray": (128,128,128), "grey": (128,128,128),
+    "maroon": (128,0,0), "olive": (128,128,0), "purple": (128,0,128), "teal": (0,128,128),
+    "navy": (0,0,128), "orange": (255,165,0), "brown": (165,42,42), "pink": (255,192,203),
+    "gold": (255,215,0), "violet": (238,130,238), "indigo": (75,0,130),
+    "darkgray": (169,169,169), "darkgrey": (169,169,169), "lightgray": (211,211,211),
+    "lightgrey": (211,211,211), "darkred": (139,0,0), "darkgreen": (0,100,0),
+    "darkblue": (0,0,139), "lightblue": (173,216,230), "lightgreen": (144,238,144),
+}
+
+def getColor(userstring):
+    """user might enter 'red' or 'green' or (255,255,255)
+       all should be returned in form of (255,255,255)"""
+    userstring = userstring.replace(";",",")
+    # Try to match the input with a tuple
+    tuple_match = COLOR_TUPLE_RE.match(userstring)
+    if tuple_match:
+        return tuple(map(int, tuple_match.groups()))
+
+    # Check if the input matches a color name
+    name = userstring.strip().lower()
+    if name in COLOR_NAMES:
+        return COLOR_NAMES[name]
+    import sys
+    if "PySide" in sys.modules: #only if the GUI already loaded it, never import Qt here
+        color = sys.modules["PySide"].QtGui.QColor(userstring)
+        if color.isValid():
+            return color.red(), color.green(), color.blue()
+
+    # Try to match the input as a hexadecimal value
+    hex_match = COLOR_HEX_RE.match(userstring)
+    if hex_match:
+        hex_value = hex_match.group(1)
+        return tuple(int(hex_value[i:i+2], 16) for i in (0, 2, 4))
+
+    # If none of the patterns match, return None or handle the case accordingly
+    return None
+
+def getObjectByNameOrLabel(doc, nameOrLabel):
+    """returns None if object is not found"""
+    retval = doc.getObject(nameOrLabel)
+    if retval:
+        return retval
+    return cache.getObjectByLabel(doc, nameOrLabel)
+
+def getObjectsByNameOrLabel(doc, names):
+    """{name or label: object or None} resolving each distinct entry of names once"""
+    return {name: getObjectByNameOrLabel(doc, name) for name in set(names)}
+
+def getLink(doc, userstring):
+    """userstring will be of the form ObjectNameOrLabel"""
+    return getObjectByNameOrLabel(doc, userstring)
+
+def getLinkList(doc, userstring):
+    """userstring will be in the form:
+    [ObjectNameOrLabel,Object2NameOrLabel,...]
+    this converts to [<Part::Feature>,<Part::Feature>]"""
+    if not userstring:
+        return []
+    cleaned = WORD_RE.sub(r'"\1"', userstring)
+    try:
+        names = ast.literal_eval(cleaned)
+    except:
+        raise EvalError(f"cannot evaluate {userstring}")
+    objs = getObjectsByNameOrLabel(doc, names)
+    return [objs[name] for name in names]
+
+def getLinkSubList(doc, userstring):
+    """userstring will be in form
+    [(ObjectNameOrLabel,(Sub1,Sub2,Sub3...),(Object2NameOrLabel,(Face1,Vertex2,...))]
+    this converts to the list of tuples needed for setting a LinkSubList property"""
+    if not userstring:
+        return []
+    cleaned = WORD_RE.sub(r'"\1"', userstring)
+    try:
+        names = ast.literal_eval(cleaned)
+    except:
+        raise EvalError(f"cannot evaluate {userstring}")
+    objs = getObjectsByNameOrLabel(doc, [name[0] for name in names])
+    return [(objs[name[0]], name[1]) for name in names]
+
+def getStringList(userstring):
+    """[a;b;c] or [a,b,c] -> ["a", "b", "c"]"""
+    val = userstring[1:-1] #strip the [] brackets
+    return val.split(",") if "," in val else val.split(";") if ";" in val else ast.literal_eval(userstring)
+
+def evalExpression(obj, expr):
+    """evaluate expr in the context of obj, falling back to a python literal,
+    raises EvalError if neither works"""
+    if not expr:
+        return ""
+    try:
+        retval = obj.evalExpression(expr)
+        return retval
+    except:
+        return evalLiteral(expr)
+
+def evalLiteral(expr):
+    """expr as a python literal, semicolons may separate the items, raises
+    EvalError if it is not one.  Pure python, so it may run in any thread."""
+    try:
+        retval = ast.literal_eval(expr)
+        return retval
+    except:
+        try:
+            retval = ast.literal_eval(expr.replace(";",","))
+            return retval
+        except:
+            raise EvalError(f"Cannot evaluate {expr}\n")
+
+def parseValue(obj, text):
+    """value entered by the user as text: evaluated if possible, else the text itself"""
+    try:
+        return evalExpression(obj, text)
+    except EvalError:
+        return text
+
+def parseText(obj, text):
+    """the text as it is, for types whose setter reads the text itself"""
+    return text
+
+
+########################################################################################
+# setters, set obj.prop from the value returned by the parser of the type
+
+def setValue(obj, prop, value):
+    """strings beginning with = are set as expressions"""
+    if isinstance(value, str):
+        if value.startswith("="):
+            obj.setExpression(prop, value[1:])
+            metrics.count(metrics.EXPRESSIONS_SET)
+        elif value:
+            setattr(obj, prop, value)
+    elif value:
+        try:
+            setattr(obj, prop, value)
+        except:
+            setattr(obj, prop, f"{value}")
+
+def setLink(obj, prop, value):
+    if value:
+        link = getObjectByNameOrLabel(obj.Document, value)
+        if link:
+            setattr(obj, prop, link)
+
+def setLinkList(obj, prop, value):
+    if value:
+        links = getLinkList(obj.Document, value)
+        if links:
+            setattr(obj, prop, links)
+
+def setLinkSubList(obj, prop, value):
+    if value:
+        links = getLinkSubList(obj.Document, value)
+        if links:
+            setattr(obj, prop, links)
+
+def setStringList(obj, prop, value):
+    if value:
+        setattr(obj, prop, getStringList(value) if isinstance(value, str) else value)
+
+def setColor(obj, prop, value):
+    if value:
+        setattr(obj, prop, getColor(f"{value}"))
+
+
+########################################################################################
+# validators, return the preview of the text and its status: VALID, INVALID or a color
+
+VALID = "valid"
+INVALID = "invalid"
+
+def validateNothing(obj, text):
+    return ("", VALID)
+
+def validateTemperature(obj, text):
+    if "C" in text or "F" in text:
+        return ("Note: F and C units not supported.", INVALID)
+    return (text, VALID)
+
+def validateLink(obj, text):
+    return (f"{getLink(obj.Document, text)}", VALID)
+
+def validateLinkList(obj, text):
+    try:
+        return (f"{getLinkList(obj.Document, text)}", VALID)
+    except EvalError as ev:
+        return (ev.message, INVALID)
+
+def validateLinkSubList(obj, text):
+    try:
+        return (f"{getLinkSubList(obj.Document, text)}", VALID)
+    except EvalError as ev:
+        return (ev.message, INVALID)
+
+def validateColor(obj, text):
+    """the status is the color itself if it is valid"""
+    if not text:
+        return ("", VALID)
+    color = getColor(text)
+    if color:
+        return (f"{color}", color)
+    return ("Invalid color", INVALID)
+
+
+########################################################################################
+# the registry
+
+#validator None: the text is evaluated as an expression, see evalExpression()
+PropertyType = namedtuple("PropertyType", ["name", "placeholder", "parse", "validate", "setter"],
+                          defaults=("", parseValue, None, setValue))
+
+def makeTypes(*types):
+    return {propertyType.name: propertyType for propertyType in types}
+
+LINK = dict(placeholder="ObjectNameOrLabel", parse=parseText, validate=validateLink, setter=setLink)
+LINK_LIST = dict(placeholder="[Obj1,Obj2,Obj3]", parse=parseText, validate=validateLinkList, setter=setLinkList)
+
+TYPES = makeTypes(
+    PropertyType("Acceleration"),
+    PropertyType("Angle", "32 deg or pi rad or 45"),
+    PropertyType("Area"),
+    PropertyType("Bool"),
+    PropertyType("Color", "(255,0,0) or red or #ff0000", parseText, validateColor, setColor),
+    PropertyType("Direction", "create(<<vector>>; 0; 0; 0)"),
+    PropertyType("Distance"),
+    PropertyType("Enumeration", """["small";"medium";"large"]"""),
+    PropertyType("File", "c:/users/username/Documents/freecad/macros"),
+    PropertyType("FileIncluded"),
+    PropertyType("Float"),
+    PropertyType("FloatConstraint", "(0;-360;360;15) = (initial, min, max, step)"),
+    PropertyType("FloatList", "(1;2;3)"),
+    PropertyType("Font", "Arial", parseText, validateNothing),
+    PropertyType("Force"),
+    PropertyType("Integer"),
+    PropertyType("IntegerConstraint", "(0;-360;360;45) = (initial, min, max, step)"),
+    PropertyType("IntegerList", "(1;2;3;4)"),
+    PropertyType("Length", "6' + 2\" or 5m or 17"),
+    PropertyType("Link", **LINK),
+    PropertyType("LinkChild", **LINK),
+    PropertyType("LinkGlobal", **LINK),
+    PropertyType("LinkList", **LINK_LIST),
+    PropertyType("LinkListChild", **LINK_LIST),
+    PropertyType("LinkListGlobal", **LINK_LIST),
+    PropertyType("LinkSubList", "[(Extrude,(Face1,Edge2)),(Sketch,(Vertex1))]",
+                 parseText, validateLinkSubList, setLinkSubList),
+    PropertyType("Material"),
+    PropertyType("MaterialList"),
+    PropertyType("Matrix", "((1;0;0;0),(0;1;0;0),(0;0;1;0),(0;0;0;1))"),
+    PropertyType("Path", "c:/users/username/documents"),
+    PropertyType("Percent"),
+    PropertyType("Placement", "create(<<placement>>; create(<<vector>>;10;20;30); "
+                              "create(<<rotation>>; create(<<vector>>;1;0;0);45))"),
+    PropertyType("PlacementLink", "ObjectNameOrLabel", parseText, validateLink, setLink),
+    PropertyType("Position", "create(<<vector>>;10;20;30)"),
+    PropertyType("Precision", "1e-7"),
+    PropertyType("Pressure"),
+    PropertyType("Quantity"),
+    PropertyType("QuantityConstraint"),
+    PropertyType("Rotation", "create(<<rotation>>; create(<<vector>>;1;0;0);45)"),
+    PropertyType("Speed"),
+    PropertyType("String", "Your string here"),
+    PropertyType("StringList", "[a;b;c]", parseText, validateNothing, setStringList),
+    PropertyType("Temperature", "0.00 K", validate=validateTemperature),
+    PropertyType("Vector", "create(<<vector>>; 0; 0; 0)"),
+    PropertyType("VectorList", "((1;2;3);(4;5;6))"),
+    PropertyType("VectorDistance", "create(<<vector>>; 0; 0; 0)"),
+    PropertyType("Volume"),
+)
+
+#the names in the order offered by the Add Property command
+NAMES = tuple(TYPES)
+
+DEFAULT = PropertyType("")
+
+def getShortType(typeId):
+    """accepts "App::PropertyLength" or "Length", returns "Length" """
+    return typeId[len("App::Property"):] if typeId.startswith("App::Property") else typeId
+
+def getTypeId(propertyType):
+    """accepts "Length" or "App::PropertyLength", returns "App::PropertyLength" """
+    return propertyType if "::" in propertyType else f"App::Property{propertyType}"
+
+def get(propertyType):
+    """the PropertyType of "Length" or "App::PropertyLength", a default one
+    (evaluate the text, then set it) for types not in the registry"""
+    return TYPES.get(getShortType(propertyType), DEFAULT)
+
+def isKnown(propertyType):
+    return getShortType(propertyType) in TYPES
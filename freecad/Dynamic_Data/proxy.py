@@ -0,0 +1,96 @@
+# SPDX-License-Identifier: LGPL-2.1-or-later
+# SPDX-FileNotice: Part of the Dynamic Data addon.
+
+################################################################################
+#                                                                              #
+#   Copyright (c) 2018 Mark Ganson ( TheMarkster )                             #
+#                                                                              #
+#   This library is free software; you can redistribute it and/or modify it    #
+#   under the terms of the GNU Lesser General Public License as published      #
+#   by the Free Software Foundation; either version 2.1 of the License, or     #
+#   (at your option) any later version.                                        #
+#                                                                              #
+#   This library is distributed in the hope that it will be useful,            #
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of             #
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.                       #
+#                                                                              #
+#   See the GNU Lesser General Public License for more details.                #
+#                                                                              #
+#   You should have received a copy of the GNU Lesser General Public License   #
+#   along with this library; if not, write to the Free Software Foundation,    #
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA           #
+#                                                                              #
+################################################################################
+
+"""Python proxy of dd objects.
+
+A configuration in switch mode has no {variable}List properties and no
+expressions on its variables, instead the proxy writes all the variables of
+the configuration from its table when the configuration's enumeration
+changes.  That is one pass over the table rather than one expression per
+variable to parse, resolve and evaluate on every recompute.
+
+The proxy is only given to a dd object when it gets a configuration in switch
+mode, see core.applyConfigurationTable().  This module does not import Qt."""
+
+from freecad.Dynamic_Data import configtable
+
+
+class DynamicDataProxy:
+    def __init__(self):
+        self.configurations = [] #names of the enumerations of configurations in switch mode
+        self.tables = {} #name: (serialized table, ConfigurationTable)
+
+    def dumps(self):
+        return {"configurations": self.configurations}
+
+    def loads(self, state):
+        self.configurations = list(state.get("configurations", [])) if state else []
+        self.tables = {}
+
+    #FreeCAD before 0.22 uses these instead of dumps() and loads()
+    def __getstate__(self):
+        return self.dumps()
+
+    def __setstate__(self, state):
+        self.loads(state)
+
+    def execute(self, obj):
+        pass
+
+    def onChanged(self, obj, prop):
+        if not prop in self.configurations:
+            return
+        try:
+            if "Restore" in obj.State:
+                return #the variables were saved with their values
+        except Exception:
+            pass
+        self.switch(obj, prop)
+
+    def getTable(self, obj, name):
+        """the table of configuration name, deserialized again only if it changed"""
+        text = getattr(obj, f"{name}Table", "")
+        cached = self.tables.get(name)
+        if cached and cached[0] == text:
+            return cached[1]
+        table = configtable.ConfigurationTable.deserialize(text) if text else None
+        self.tables[name] = (text, table)
+        return table
+
+    def switch(self, obj, name):
+        """set the variables of configuration name to the values of the selected enum,
+        only those that differ are written so the others are not touched"""
+        table = self.getTable(obj, name)
+        if not table:
+            return
+        try:
+            values = table.getColumn(getattr(obj, name))
+        except ValueError:
+            return
+        for var,value in zip(table.variables, values):
+            try:
+                if getattr(obj, var) != value:
+                    setattr(obj, var, value)
+            except AttributeError:
+                pass #a variable removed by hand
@@ -0,0 +1,193 @@
+# SPDX-License-Identifier: LGPL-2.1-or-later
+# SPDX-FileNotice: Part of the Dynamic Data addon.
+
+################################################################################
+#                                                                              #
+#   Copyright (c) 2018 Mark Ganson ( TheMarkster )                             #
+#                                                                              #
+#   This library is free software; you can redistribute it and/or modify it    #
+#   under the terms of the GNU Lesser General Public License as published      #
+#   by the Free Software Foundation; either version 2.1 of the License, or     #
+#   (at your option) any later version.                                        #
+#                                                                              #
+#   This library is distributed in the hope that it will be useful,            #
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of             #
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.                       #
+#                                                                              #
+#   See the GNU Lesser General Public License for more details.                #
+#                                                                              #
+#   You should have received a copy of the GNU Lesser General Public License   #
+#   along with this library; if not, write to the Free Software Foundation,    #
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA           #
+#                                                                              #
+################################################################################
+
+"""Configuration sweeps.
+
+Selects each enum of a configuration in turn, recomputes, and collects metrics
+from the recomputed document into a table, so every variant can be checked in
+one go, for example in FreeCADCmd:
+
+    import FreeCAD
+    from freecad.Dynamic_Data import cache, sweep
+    doc = FreeCAD.openDocument("part.FCStd")
+    dd = cache.getSingleDDObject(doc)
+    rows = sweep.sweepConfiguration(dd, "Size", ["Body.Shape.Volume", "Body.Shape.BoundBox"])
+    sweep.writeResults(rows, "sizes.csv")
+
+A metric is an object name or label (as <<label>> if it has dots in it)
+followed by a path of attributes, e.g. Body.Shape.Volume, <<Main body>>.Shape.Area
+or dd.Height.  Quantities give their value, vectors and bounding boxes give one
+column per component.  With workers > 1 the enums are shared among FreeCADCmd
+processes, each on its own copy of the document, see worker.py.
+
+This module does not import Qt."""
+
+import csv, json, re, time
+import FreeCAD
+from freecad.Dynamic_Data import core, expressions
+
+METRIC_RE = re.compile(r"(<<.+?>>|[^.]+)\.(.+)")
+BOUNDBOX_FIELDS = ("XLength", "YLength", "ZLength", "XMin", "YMin", "ZMin", "XMax", "YMax", "ZMax")
+VECTOR_FIELDS = ("x", "y", "z")
+
+def getDefaultMetrics(objs):
+    """volume, area, and bounding box of those of objs that have a shape"""
+    metrics = []
+    for obj in objs:
+        if hasattr(obj, "Shape"):
+            label = expressions.quoteLabel(obj.Label) if "." in obj.Label else obj.Name
+            metrics.extend(f"{label}.Shape.{attr}" for attr in ("Volume", "Area", "BoundBox"))
+    return metrics
+
+def flatten(column, value):
+    """list of (column, value) of value, a plain number, string, or bool"""
+    if hasattr(value, "XLength") and hasattr(value, "ZMax"): #BoundBox
+        return [(f"{column}.{field}", getattr(value, field)) for field in BOUNDBOX_FIELDS]
+    if hasattr(value, "Value") and hasattr(value, "Unit"): #Quantity
+        return [(column, value.Value)]
+    if all(hasattr(value, field) for field in VECTOR_FIELDS) and hasattr(value, "Length"): #Vector
+        return [(f"{column}.{field}", getattr(value, field)) for field in VECTOR_FIELDS]
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return [(column, value)]
+    return [(column, str(value))]
+
+def getMetric(doc, metric):
+    """list of (column, value) of metric, value None if it cannot be evaluated"""
+    match = METRIC_RE.fullmatch(metric.strip())
+    if not match:
+        raise ValueError(f"not a metric: {metric}, use object.property")
+    obj = core.getObjectByNameOrLabel(doc, expressions.unquote(match.group(1)))
+    if not obj:
+        return [(metric, None)]
+    value = obj
+    try:
+        for attr in match.group(2).split("."):
+            value = getattr(value, attr)
+    except Exception as e: #a null shape raises on Volume for example
+        FreeCAD.Console.PrintLog(f"DynamicData sweep: {metric}: {e}\n")
+        return [(metric, None)]
+    return flatten(metric, value)
+
+def getInvalidObjects(doc):
+    return [obj.Name for obj in doc.Objects if "Invalid" in obj.State]
+
+def evaluate(doc, metrics):
+    """recompute doc and return a row (dictionary) of the metrics"""
+    start = time.perf_counter()
+    doc.recompute()
+    row = {"recompute_seconds": time.perf_counter() - start,
+           "invalid": " ".join(getInvalidObjects(doc))}
+    for metric in metrics:
+        row.update(getMetric(doc, metric))
+    return row
+
+def getEnums(dd, name):
+    """the enums of configuration name a sweep goes through, all but the "Select ..." one"""
+    return list(dd.getEnumerationsOfProperty(name))[1:]
+
+def sweepConfiguration(dd, name, metrics, enums=None, progress=None):
+    """select each of enums (default all) of the configuration name of dd in turn,
+    recompute, and collect metrics.  progress(done, total) is called after each
+    one, if it returns False the sweep stops.  The selected enum is restored at the
+    end.  Returns the list of rows, dictionaries of column: value."""
+    doc = dd.Document
+    enums = enums if enums is not None else getEnums(dd, name)
+    current = getattr(dd, name)
+    rows = []
+    try:
+        for idx,enum in enumerate(enums):
+            setattr(dd, name, enum)
+            row = {"enum": enum}
+            row.update(evaluate(doc, metrics))
+            rows.append(row)
+            if progress and progress(idx + 1, len(enums)) is False:
+                break
+    finally:
+        setattr(dd, name, current)
+        doc.recompute()
+    return rows
+
+def runJob(doc, job):
+    """worker side of sweepParallel()"""
+    dd = doc.getObject(job["dd"])
+    return sweepConfiguration(dd, job["configuration"], job["metrics"], job["enums"])
+
+def sweepParallel(dd, name, metrics, enums=None, workers=0, freecadCmd=None, timeout=None):
+    """sweepConfiguration() shared among workers FreeCADCmd processes (0: one per
+    core but one), each on its own copy of the document.  Rows of a worker that
+    failed only have an error column."""
+    from freecad.Dynamic_Data import worker
+    enums = enums if enums is not None else getEnums(dd, name)
+    count = min(worker.getWorkerCount(workers), len(enums))
+    chunks = [enums[idx::count] for idx in range(count)]
+    jobs = [{"task": "sweep", "dd": dd.Name, "configuration": name, "metrics": list(metrics), "enums": chunk}
+            for chunk in chunks]
+    results = worker.runJobs(dd.Document, jobs, freecadCmd, timeout)
+    rows = {}
+    for chunk,result in zip(chunks, results):
+        for idx,enum in enumerate(chunk):
+            rows[enum] = result[idx] if result and idx < len(result) else {"enum": enum, "error": "worker failed"}
+    return [rows[enum] for enum in enums]
+
+def getColumns(rows):
+    """the columns of rows in the order they first appear"""
+    columns = {}
+    for row in rows:
+        columns.update(dict.fromkeys(row))
+    return list(columns)
+
+def isNumeric(values):
+    return all(value is None or (isinstance(value, (int, float)) and not isinstance(value, bool)) for value in values)
+
+def writeNpz(columns, path):
+    """write columns (column: list of values) to a compressed numpy file, numbers
+    as float arrays with NaN for missing values, anything else as strings"""
+    try:
+        import numpy
+    except ImportError:
+        raise ValueError(f"{path}: numpy is needed for .npz files, use .json or .csv")
+    arrays = {}
+    for column,values in columns.items():
+        if isNumeric(values):
+            arrays[column] = numpy.array([numpy.nan if value is None else value for value in values], dtype=float)
+        else:
+            arrays[column] = numpy.array(["" if value is None else str(value) for value in values])
+    numpy.savez_compressed(path, **arrays)
+
+def writeResults(rows, path):
+    """write rows to path: if path ends with .json a json file of columns (column:
+    list of values), with .npz a numpy file of column arrays (needs numpy), else a
+    csv file"""
+    columns = getColumns(rows)
+    if path.lower().endswith(".npz"):
+        writeNpz({column: [row.get(column) for row in rows] for column in columns}, path)
+        return
+    if path.lower().endswith(".json"):
+        with open(path, "w") as f:
+            json.dump({column: [row.get(column) for row in rows] for column in columns}, f, indent=1)
+        return
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, columns)
+        writer.writeheader()
+        writer.writerows(rows)
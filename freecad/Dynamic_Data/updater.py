@@ -0,0 +1,157 @@
+# SPDX-License-Identifier: LGPL-2.1-or-later
+# SPDX-FileNotice: Part of the Dynamic Data addon.
+
+################################################################################
+#                                                                              #
+#   Copyright (c) 2018 Mark Ganson ( TheMarkster )                             #
+#                                                                              #
+#   This library is free software; you can redistribute it and/or modify it    #
+#   under the terms of the GNU Lesser General Public License as published      #
+#   by the Free Software Foundation; either version 2.1 of the License, or     #
+#   (at your option) any later version.                                        #
+#                                                                              #
+#   This library is distributed in the hope that it will be useful,            #
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of             #
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.                       #
+#                                                                              #
+#   See the GNU Lesser General Public License for more details.                #
+#                                                                              #
+#   You should have received a copy of the GNU Lesser General Public License   #
+#   along with this library; if not, write to the Free Software Foundation,    #
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA           #
+#                                                                              #
+################################################################################
+
+"""Update checker for the workbench.
+
+The check runs in a background thread so a slow or blocked network never
+stalls the GUI, and the result is cached on disk so we only go to github once
+per cache period.  The function that fetches package.xml can be replaced, for
+example to point at a local server when testing offline:
+
+    updater.checkForUpdate("2.78", print, fetch=lambda url, timeout: xmlBytes)
+"""
+
+import json, os, re, threading, time
+import xml.etree.ElementTree as ET
+import FreeCAD
+
+USER = "mwganson"
+REPO = "DynamicData"
+BRANCH = "master"
+DEFAULT_TIMEOUT = 5 #seconds
+DEFAULT_TTL = 24 * 3600 #seconds between checks
+
+def getPackageUrl(user=USER, repo=REPO, branch=BRANCH):
+    """GitHub raw URL for package.xml"""
+    return f"https://raw.githubusercontent.com/{user}/{repo}/{branch}/package.xml"
+
+def getCacheFile():
+    """where the result of the last check is stored"""
+    if hasattr(FreeCAD, "getUserCachePath"):
+        folder = FreeCAD.getUserCachePath()
+    else:
+        folder = FreeCAD.getUserAppDataDir()
+    return os.path.join(folder, "DynamicDataUpdateCheck.json")
+
+def getLocalVersion():
+    """version of the installed workbench, read from its package.xml so we need
+    not import DynamicDataCmd just to learn its __version__"""
+    packageXml = os.path.join(os.path.dirname(__file__), "..", "..", "package.xml")
+    try:
+        with open(packageXml, "rb") as f:
+            version = getVersionFromXml(f.read())
+        if version:
+            return version
+    except Exception:
+        pass
+    import freecad.Dynamic_Data.DynamicDataCmd as DynamicDataCmd
+    return DynamicDataCmd.__version__
+
+def parseVersion(version):
+    """returns version string as a tuple of integers so they compare properly,
+    e.g. "2.9" < "2.10" and "2.78" < "2.78.1", any non-numeric suffix is ignored"""
+    if not version:
+        return ()
+    parts = []
+    for part in str(version).strip().split("."):
+        match = re.match(r"\d+", part)
+        if not match:
+            break
+        parts.append(int(match.group(0)))
+    return tuple(parts)
+
+def isNewer(latest, current):
+    """True if version string latest is newer than version string current"""
+    latest = parseVersion(latest)
+    return bool(latest) and latest > parseVersion(current)
+
+def fetchUrl(url, timeout=DEFAULT_TIMEOUT):
+    """default fetch function, returns the content of url as bytes"""
+    import urllib.request
+    with urllib.request.urlopen(url, timeout=timeout) as response:
+        return response.read()
+
+def getVersionFromXml(content):
+    """returns the <version> text of package.xml content or None"""
+    root = ET.fromstring(content)
+    version = root.find("version")
+    return version.text.strip() if version is not None and version.text else None
+
+def getRemoteVersion(url, fetch=None, timeout=DEFAULT_TIMEOUT):
+    """fetch package.xml from url and return its version, None on any failure"""
+    fetch = fetch if fetch else fetchUrl
+    try:
+        return getVersionFromXml(fetch(url, timeout))
+    except Exception as e:
+        FreeCAD.Console.PrintLog(f"DynamicData updater: error fetching or parsing {url}: {e}\n")
+        return None
+
+def readCache(cacheFile, url, ttl):
+    """returns the cached remote version if the cache is younger than ttl, else None"""
+    try:
+        with open(cacheFile, "r") as f:
+            data = json.load(f)
+    except Exception:
+        return None
+    if data.get("url") != url or time.time() - data.get("checked", 0) > ttl:
+        return None
+    return data.get("version")
+
+def writeCache(cacheFile, url, version):
+    try:
+        with open(cacheFile, "w") as f:
+            json.dump({"url": url, "checked": time.time(), "version": version}, f)
+    except Exception as e:
+        FreeCAD.Console.PrintLog(f"DynamicData updater: cannot write {cacheFile}: {e}\n")
+
+def getLatestVersion(url, fetch=None, timeout=DEFAULT_TIMEOUT, cacheFile=None, ttl=DEFAULT_TTL):
+    """returns the latest version, from the cache if it is recent enough, else from url"""
+    if cacheFile:
+        version = readCache(cacheFile, url, ttl)
+        if version:
+            return version
+    version = getRemoteVersion(url, fetch, timeout)
+    if version and cacheFile:
+        writeCache(cacheFile, url, version)
+    return version
+
+def checkForUpdate(currentVersion, callback, fetch=None, url=None, timeout=DEFAULT_TIMEOUT,
+                   cacheFile=None, ttl=DEFAULT_TTL, background=True):
+    """check if a newer version than currentVersion is available and if so call
+    callback(latestVersion).  With background=True the check runs in a daemon
+    thread and this returns the thread immediately, so callback is called from
+    that thread: GUI code must marshal it back to the GUI thread itself."""
+    url = url if url else getPackageUrl()
+
+    def run():
+        latest = getLatestVersion(url, fetch, timeout, cacheFile, ttl)
+        if isNewer(latest, currentVersion):
+            callback(latest)
+
+    if not background:
+        run()
+        return None
+    thread = threading.Thread(target=run, name="DynamicDataUpdateCheck", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,136 @@
+# SPDX-License-Identifier: LGPL-2.1-or-later
+# SPDX-FileNotice: Part of the Dynamic Data addon.
+
+################################################################################
+#                                                                              #
+#   Copyright (c) 2018 Mark Ganson ( TheMarkster )                             #
+#                                                                              #
+#   This library is free software; you can redistribute it and/or modify it    #
+#   under the terms of the GNU Lesser General Public License as published      #
+#   by the Free Software Foundation; either version 2.1 of the License, or     #
+#   (at your option) any later version.                                        #
+#                                                                              #
+#   This library is distributed in the hope that it will be useful,            #
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of             #
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.                       #
+#                                                                              #
+#   See the GNU Lesser General Public License for more details.                #
+#                                                                              #
+#   You should have received a copy of the GNU Lesser General Public License   #
+#   along with this library; if not, write to the Free Software Foundation,    #
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA           #
+#                                                                              #
+################################################################################
+
+"""Pool of FreeCADCmd worker processes.
+
+Long runs over many variants of a document (configuration sweeps, design of
+experiments) are split into jobs, each run by a separate FreeCADCmd process on
+its own copy of the document, so they use all the cores and a crash in one
+variant does not take down the GUI.
+
+A job is a dictionary saved as json, with at least:
+    task: the module of this package that runs it, see TASKS
+    document: path of the document copy to open
+    output: path of the json file the result is written to
+The worker imports the task module, opens the document, calls its
+runJob(doc, job) and writes what it returns to output.
+
+This module is both the parent side (runJobs()) and the worker script, which
+runs when FreeCADCmd executes this file with DD_WORKER_JOB set to the job file."""
+
+import json, os, shutil, subprocess, tempfile, time
+import FreeCAD
+
+JOB_ENV = "DD_WORKER_JOB"
+FREECADCMD_ENV = "DD_FREECADCMD" #overrides where FreeCADCmd is looked for
+TASKS = {"sweep": "freecad.Dynamic_Data.sweep", "doe": "freecad.Dynamic_Data.doe"}
+
+def getFreeCADCmd():
+    """path of the FreeCADCmd executable, None if it cannot be found"""
+    path = os.environ.get(FREECADCMD_ENV)
+    if path:
+        return path
+    binDir = os.path.join(FreeCAD.getHomePath(), "bin")
+    for name in ("FreeCADCmd", "freecadcmd", "FreeCADCmd.exe"):
+        path = os.path.join(binDir, name)
+        if os.path.isfile(path):
+            return path
+    return shutil.which("FreeCADCmd") or shutil.which("freecadcmd")
+
+def getWorkerCount(requested=0):
+    """requested, or the number of cores less one if requested is 0"""
+    return requested if requested > 0 else max(1, (os.cpu_count() or 2) - 1)
+
+def saveCopy(doc, folder):
+    """save a copy of doc in folder without changing doc's file name, returns its path"""
+    path = os.path.join(folder, "document.FCStd")
+    doc.saveCopy(path)
+    return path
+
+def runJobs(doc, jobs, freecadCmd=None, timeout=None, keepFiles=False):
+    """run each job (a dictionary, see the module docstring, without document and
+    output which are filled in here) in its own FreeCADCmd process on a copy of
+    doc, all at once.  Returns the list of results, None for a job that failed,
+    whose log is printed to the report view."""
+    freecadCmd = freecadCmd if freecadCmd else getFreeCADCmd()
+    if not freecadCmd:
+        raise FileNotFoundError(f"FreeCADCmd not found, set {FREECADCMD_ENV} to its path")
+    folder = tempfile.mkdtemp(prefix="dd_worker_")
+    source = saveCopy(doc, folder)
+    processes = []
+    for idx,job in enumerate(jobs):
+        job = dict(job)
+        job["document"] = os.path.join(folder, f"document{idx}.FCStd")
+        job["output"] = os.path.join(folder, f"result{idx}.json")
+        shutil.copyfile(source, job["document"])
+        jobFile = os.path.join(folder, f"job{idx}.json")
+        with open(jobFile, "w") as f:
+            json.dump(job, f)
+        log = open(os.path.join(folder, f"worker{idx}.log"), "w")
+        env = dict(os.environ)
+        env[JOB_ENV] = jobFile
+        process = subprocess.Popen([freecadCmd, os.path.abspath(__file__)], env=env,
+                                   stdout=log, stderr=subprocess.STDOUT)
+        processes.append((process, job, log))
+    results = []
+    deadline = time.monotonic() + timeout if timeout else None
+    failed = False
+    for idx,(process, job, log) in enumerate(processes):
+        try:
+            process.wait(None if deadline is None else max(0, deadline - time.monotonic()))
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+        log.close()
+        result = None
+        try:
+            with open(job["output"], "r") as f:
+                result = json.load(f)
+        except (OSError, ValueError):
+            failed = True
+            with open(log.name, "r", errors="replace") as f:
+                FreeCAD.Console.PrintError(f"DynamicData: worker {idx} failed (exit code {process.returncode}):\n{f.read()[-2000:]}\n")
+        results.append(result)
+    if keepFiles or failed:
+        FreeCAD.Console.PrintMessage(f"DynamicData: worker files kept in {folder}\n")
+    else:
+        shutil.rmtree(folder, ignore_errors=True)
+    return results
+
+def main(jobFile):
+    """worker side: run the job in jobFile"""
+    import importlib
+    with open(jobFile, "r") as f:
+        job = json.load(f)
+    module = importlib.import_module(TASKS[job["task"]])
+    doc = FreeCAD.openDocument(job["document"])
+    try:
+        result = module.runJob(doc, job)
+    finally:
+        FreeCAD.closeDocument(doc.Name)
+    with open(job["output"], "w") as f:
+        json.dump(result, f)
+
+if __name__ == "__main__" and os.environ.get(JOB_ENV):
+    main(os.environ[JOB_ENV])